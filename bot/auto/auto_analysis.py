@@ -1,86 +1,105 @@
 """
-A.R.K. Auto Market Scanner – Full Coverage Loop v3.1  
-Scannt ALLE Symbole aus .env alle 60 Sekunden – mit voller API-Nutzung.  
-Kompatibel mit Railway + Application-Kontext.  
+A.R.K. Auto Market Scanner – Full Coverage Loop v4.0
+Kein eigener Scan mehr: Ultra Signals abonnieren den Scan Bus des Auto Signal Loops; Session Tracking zählt nur gesendete Signale.
+Kompatibel mit Railway + Application-Kontext.
 Made in Bali! Engineered with German Precision.
 """
 
 import asyncio
 from telegram.ext import Application
-from bot.engine.analysis_engine import analyze_symbol
+from bot.auto.scan_bus import ScanEvent
 from bot.utils.ultra_signal_builder import build_ultra_signal
 from bot.utils.session_tracker import update_session_tracker
+from bot.analytics.performance_tracker import update_performance
+from bot.utils.signal_state import signal_state
 from bot.utils.error_reporter import report_error
 from bot.utils.logger import setup_logger
 from bot.config.settings import get_settings
+from bot.utils.message_queue import PRIORITY_ALERT
+from bot.auto.broadcaster import broadcaster
 
 logger = setup_logger(__name__)
 config = get_settings()
 
-async def auto_analysis(application: Application):
+def qualify_ultra_signal(result: dict | None) -> list[dict]:
     """
-    Führt eine komplette Analyse aller Symbole aus AUTO_SIGNAL_SYMBOLS durch.
+    Returns the strong patterns (3+ stars) of a directional result with at least
+    40% confidence, or an empty list if the result does not qualify.
     """
-    bot = application.bot
-    chat_id = int(config["TELEGRAM_CHAT_ID"])
-    language = config.get("BOT_LANGUAGE", "en")
-    symbols = config.get("AUTO_SIGNAL_SYMBOLS", [])
+    if not result:
+        return []
 
-    if not symbols:
-        logger.error("❌ [AutoAnalysis] Keine Symbole konfiguriert.")
-        return
+    action = result.get("combined_action", "Neutral ⚪")
+    confidence = result.get("avg_confidence", 0.0)
+    if confidence < 40 or action not in ["Long 📈", "Short 📉"]:
+        return []
 
-    logger.info(f"🔁 [AutoAnalysis] Starte Vollscan für {len(symbols)} Symbole...")
+    return [p for p in result.get("patterns", []) if p.get("stars", 0) >= 3]
 
-    for symbol in symbols:
-        try:
-            result = await analyze_symbol(symbol, chat_id=chat_id, silent=True)
-            if not result:
-                logger.info(f"⏩ [AutoAnalysis] {symbol} – Keine verwertbare Analyse.")
-                continue
+async def ultra_signal_consumer(application: Application, event: ScanEvent):
+    """
+    Sends an ultra signal for every qualifying scan result on the bus to the symbol's subscribers.
+    """
+    bot = application.bot
+    chat_id = int(config["TELEGRAM_CHAT_ID"])
+    symbol, result = event.symbol, event.result
 
-            action = result.get("combined_action", "Neutral ⚪")
-            patterns = result.get("patterns", [])
-            confidence = result.get("avg_confidence", 0.0)
+    try:
+        if not result:
+            logger.info(f"⏩ [AutoAnalysis] {symbol} – Keine verwertbare Analyse.")
+            return
 
-            if confidence < 40 or action not in ["Long 📈", "Short 📉"]:
-                logger.info(f"⏩ [AutoAnalysis] {symbol} – Confidence zu niedrig oder neutral.")
-                continue
+        valid_patterns = qualify_ultra_signal(result)
+        if not valid_patterns:
+            logger.info(f"⏩ [AutoAnalysis] {symbol} – Confidence zu niedrig, neutral oder keine starken Patterns.")
+            return
 
-            valid_patterns = [p for p in patterns if p.get("stars", 0) >= 3]
-            if not valid_patterns:
-                logger.info(f"⏩ [AutoAnalysis] {symbol} – Keine starken Patterns.")
-                continue
+        if not signal_state.admit(symbol, result, channel="ultra"):
+            return
 
-            # Signal erstellen
-            signal_message = build_ultra_signal(
+        action = result.get("combined_action")
+
+        # Signal einmal pro Sprache der Abonnenten erstellen
+        def render(lang: str) -> str:
+            return build_ultra_signal(
                 symbol=symbol,
                 move=action,
                 volume_spike=result.get("volume_info"),
                 atr_breakout=result.get("volatility_info"),
                 risk_reward=result.get("risk_reward_info"),
-                lang=language
+                lang=lang
             )
 
-            if signal_message:
-                await bot.send_message(
-                    chat_id=chat_id,
-                    text=signal_message,
-                    parse_mode="Markdown",
-                    disable_web_page_preview=True
-                )
-                logger.info(f"✅ [AutoAnalysis] Signal gesendet: {symbol} ({action})")
-
-                update_session_tracker(
-                    valid_patterns_count=len(valid_patterns),
-                    avg_confidence=confidence,
-                    signal_strength=len(valid_patterns)
-                )
-
-            await asyncio.sleep(1.0)
+        recipients = await broadcaster.fan_out(
+            bot,
+            symbol,
+            result.get("avg_confidence", 0.0),
+            render,
+            parse_mode="Markdown",
+            disable_web_page_preview=True,
+            priority=PRIORITY_ALERT,
+            batch=True
+        )
+        if recipients:
+            logger.info(f"✅ [AutoAnalysis] Signal gesendet: {symbol} ({action}) → {recipients} chat(s)")
+            await record_session_signal(result, valid_patterns)
 
-        except Exception as symbol_error:
-            logger.error(f"❌ [AutoAnalysis] Fehler bei {symbol}: {symbol_error}")
-            await report_error(bot, chat_id, symbol_error, context_info=f"AutoAnalysis Symbol Error ({symbol})")
+    except Exception as symbol_error:
+        logger.error(f"❌ [AutoAnalysis] Fehler bei {symbol}: {symbol_error}")
+        await report_error(bot, chat_id, symbol_error, context_info=f"AutoAnalysis Symbol Error ({symbol})")
 
-    logger.info("✅ [AutoAnalysis] Vollscan abgeschlossen.")
+async def record_session_signal(result: dict, valid_patterns: list[dict]):
+    """
+    Records a sent ultra signal in the session statistics and the recap
+    performance data (file writes off the event loop). Only called after
+    signal_state admitted the signal and it was queued for delivery.
+    """
+    confidence = result.get("avg_confidence", 0.0)
+    await asyncio.to_thread(
+        update_session_tracker,
+        valid_patterns_count=len(valid_patterns),
+        avg_confidence=confidence,
+        signal_strength=len(valid_patterns)
+    )
+    stars = max(p.get("stars", 0) for p in valid_patterns)
+    await asyncio.to_thread(update_performance, stars, confidence)
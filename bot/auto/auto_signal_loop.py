@@ -1,6 +1,7 @@
 """
 A.R.K. Auto Signal Loop – Final Boss Ultra Premium Build 2025  
 Smart Parallel US Market Scanner mit Deep Diagnostics, Rejection Insights und Live Signal Protocols.
+Scannt kurz nach jedem Kerzenschluss statt im festen 60s-Takt – dazwischen nur leichte Intrabar-Quote-Checks.
 Made in Bali. Engineered with German Precision.
 """
 
@@ -8,18 +9,48 @@ import asyncio
 import time
 from math import floor
 
-from bot.auto.heartbeat_manager import send_heartbeat
 from bot.auto.connection_watchdog import check_connection
+from bot.auto.scan_scheduler import scan_scheduler, ScanScheduler
+from bot.auto.scan_bus import scan_bus, ScanEvent
 from bot.engine.analysis_engine import analyze_symbol
+from bot.engine.data_loader import fetch_market_data, fetch_quote, candle_cache, BASE_RESOLUTION, CACHE_GRACE_SEC
+from bot.engine.data_auto_validator import validate_market_data
+from bot.engine.feature_frame import feature_cache
+from bot.engine.panel_scan import scan_panel
 from bot.utils.logger import setup_logger
-from bot.utils.language import get_language
+from bot.utils.market_calendar import market_calendar
+from bot.utils.signal_state import signal_state
 from bot.utils.api_bridge import record_call, monitor as usage_monitor
+from bot.utils.rate_limiter import finnhub_limiter, PRIORITY_SCAN
 from bot.config.settings import get_settings
+from bot.utils.message_queue import PRIORITY_ALERT
+from bot.auto.broadcaster import broadcaster
+from bot.utils.i18n import TemplateSet
 
 logger = setup_logger(__name__)
 config = get_settings()
 RUNNING = True
 MIN_CONFIDENCE = 50.0
+INTRABAR_ATR_MULT = 1.0  # Bewegung seit letztem Schlusskurs in ATR, ab der ein Symbol vorgezogen wird
+intrabar_scheduler = ScanScheduler("intrabar", deadline_sec=20)
+BAR_SEC = int(BASE_RESOLUTION) * 60
+
+# === Live-Alert-Template (Labels einmal pro Sprache aufgelöst) ===
+LIVE_TEMPLATES = TemplateSet(
+    live=(
+        "📡 *{t:live_signal_header}*\n\n"
+        "*{t:symbol}:* `{symbol}`\n"
+        "*{t:live_signal_direction}:* {action}\n"
+        "*{t:confidence}:* `{confidence:.1f}%`\n"
+        "*{t:live_signal_score}:* `{score}/100`\n"
+        "*{t:live_signal_rating}:* {rating}\n"
+        "*{t:live_signal_price}:* `${price}`\n"
+        "*{t:live_signal_bar}:* [{bar}]\n"
+        "⚙️ {runtime:.2f}s – Signal #{total} {t:live_signal_today}\n"
+        "_Ø {t:confidence}: {avg:.1f}%_\n\n"
+        "_{t:live_signal_footer}_"
+    )
+)
 
 def build_signal_bar(conf: float, bars: int = 20) -> str:
     filled = floor(conf / 100 * bars)
@@ -39,34 +70,150 @@ async def auto_signal_loop(application):
     logger.info(f"📊 [AutoSignalLoop] {len(symbols)} Symbole geladen: {symbols[:5]}...")
 
     while RUNNING:
-        try:
-            await send_heartbeat(application, chat_id)
+        # Außerhalb der Handelszeiten bis zum ersten Kerzenschluss der nächsten Session schlafen statt zu pollen;
+        # die letzte Kerze (Schluss 16:00) wird noch gescannt
+        await market_calendar.wait_for_bar("AutoSignalLoop", BAR_SEC, scan_offset())
 
-            if not await check_connection():
+        try:
+            if not await check_connection(application.bot, chat_id):
                 logger.warning("⚠️ [AutoSignalLoop] Telegram-Verbindung gestört. Retry in 30s.")
                 await asyncio.sleep(30)
                 continue
 
             logger.info(f"📡 [AutoSignalLoop] Analyse-Zyklus gestartet...")
 
-            tasks = [analyze_and_dispatch(application, symbol, chat_id) for symbol in symbols]
-            await asyncio.gather(*tasks)
+            await run_scan_cycle(application, symbols, chat_id)
 
             logger.info("✅ [AutoSignalLoop] Zyklus abgeschlossen.")
 
         except Exception as e:
             logger.exception(f"🔥 [AutoSignalLoop] Totalabbruch: {e}")
 
-        await asyncio.sleep(interval)
+        if config.get("MARKET_HOURS_ONLY", True) and not market_calendar.is_open():
+            continue  # Letzte Kerze der Session gescannt → Schleifenanfang suspendiert bis zur nächsten Session
+        if config.get("SCAN_SCHEDULE") == "candle_close":
+            await idle_until_candle_close(symbols)
+        else:
+            await asyncio.sleep(interval)
 
-async def analyze_and_dispatch(application, symbol, chat_id):
-    try:
-        logger.debug(f"🔍 Beginne Analyse: {symbol}")
-        start = time.perf_counter()
-        result = await analyze_symbol(symbol, chat_id=chat_id)
-        runtime = time.perf_counter() - start
-        record_call(symbol)
+def scan_offset() -> float:
+    """Seconds after a bar close at which it is scanned."""
+    # Nie vor Ablauf des Candle-Caches, sonst liefert der Scan noch die alte Kerze
+    return max(config.get("CANDLE_CLOSE_OFFSET_SEC", 3), CACHE_GRACE_SEC)
+
+def next_scan_time(now: float = None) -> float:
+    """Epoch second of the next scan: shortly after the current base-resolution bar closes."""
+    bar_close = candle_cache.next_candle_close(BASE_RESOLUTION, now) - CACHE_GRACE_SEC
+    return bar_close + scan_offset()
+
+async def idle_until_candle_close(symbols: list[str]):
+    """
+    Sleeps until the next bar close; meanwhile only runs lightweight intrabar checks.
+    """
+    wake_at = next_scan_time()
+    check_every = config.get("INTRABAR_CHECK_SEC", 60)
+    logger.info(f"🕯️ [AutoSignalLoop] Nächster Scan in {wake_at - time.time():.0f}s (Kerzenschluss).")
+
+    while check_every > 0 and time.time() + check_every < wake_at:
+        await asyncio.sleep(check_every)
+        try:
+            await run_intrabar_checks(symbols)
+        except Exception as e:
+            logger.error(f"❌ [AutoSignalLoop] Intrabar-Check fehlgeschlagen: {e}")
+
+    await asyncio.sleep(max(wake_at - time.time(), 0))
+
+async def run_intrabar_checks(symbols: list[str]):
+    """
+    Quotes the highest-priority symbols and pulls breakouts forward for the next close scan.
+    """
+    watched = scan_scheduler.order(symbols)[:config.get("INTRABAR_MAX_SYMBOLS", 10)]
+    deadline_at = intrabar_scheduler.deadline()
+    await intrabar_scheduler.run_cycle(watched, lambda symbol: check_intrabar(symbol, deadline_at), deadline_at)
+
+async def check_intrabar(symbol: str, deadline_at: float = None):
+    """
+    Compares the live quote with the held bar: a move of INTRABAR_ATR_MULT × ATR
+    raises the symbol's scan priority. No candles are fetched, no engines run.
+
+    The quote is skipped when the shared Finnhub limiter cannot serve it before
+    deadline_at, so the check never waits in the limiter only to be cancelled.
+    """
+    frame = feature_cache.peek(symbol)
+    if frame is None or not frame.last.atr > 0:
+        return
+
+    if deadline_at is not None and finnhub_limiter.estimated_wait("quote", PRIORITY_SCAN) > deadline_at - time.monotonic():
+        logger.debug(f"⏭️ [AutoSignalLoop] Intrabar {symbol} übersprungen – Finnhub-Budget vor Deadline erschöpft.")
+        return
 
+    quote = await fetch_quote(symbol)
+    if quote is None:
+        return
+
+    price = float(quote["c"])
+    move_atr = abs(price - frame.close[-1]) / frame.last.atr
+    if move_atr < INTRABAR_ATR_MULT:
+        return
+
+    scan_scheduler.bump(symbol, move_atr)
+    logger.info(f"⚡ [AutoSignalLoop] Intrabar {symbol}: ${price:.2f} = {move_atr:.1f} ATR → vorgezogen")
+
+async def run_scan_cycle(application, symbols: list[str], chat_id: int):
+    """
+    One bounded scan cycle: fetch → (panel prefilter) → analysis, all under one deadline.
+    Every analysis result is published once on the scan bus.
+    """
+    deadline_at = scan_scheduler.deadline()
+    scan_bus.next_cycle()
+    candidates = symbols
+    valid = {}
+    stagger = config.get("SCAN_STAGGER_SEC", 0.0)
+
+    if config.get("SCAN_MODE") == "panel":
+        fetched = await scan_scheduler.run_cycle(symbols, fetch_market_data, deadline_at, stagger)
+        valid = {s: c for s, c in fetched.items() if c is not None and validate_market_data(c)}
+        scan = scan_panel(valid)
+        for i, symbol in enumerate(scan.panel.symbols):
+            scan_scheduler.update_priority(symbol, scan.features["atr_pct"][i], scan.features["volume_ratio"][i])
+        candidates = scan.candidates
+        logger.info(f"🧮 [AutoSignalLoop] Panel-Vorfilter: {len(candidates)}/{len(symbols)} Kandidaten.")
+
+    await scan_scheduler.run_cycle(
+        candidates,
+        lambda symbol: scan_and_publish(symbol, chat_id, valid.get(symbol)),
+        deadline_at,
+        0.0 if config.get("SCAN_MODE") == "panel" else stagger  # Im Panel-Modus ist der Fetch schon gestaffelt
+    )
+    await scan_bus.end_cycle()
+
+    if config.get("SCAN_MODE") != "panel":
+        for symbol in candidates:
+            frame = feature_cache.peek(symbol)
+            if frame is not None and len(frame) >= 3 and frame.last.volume_baseline > 0:
+                last = frame.last
+                scan_scheduler.update_priority(
+                    symbol,
+                    last.atr / frame.close[-1] * 100,
+                    frame.volume[-3:].mean() / last.volume_baseline
+                )
+
+async def scan_and_publish(symbol: str, chat_id: int, candles=None):
+    """
+    Producer: analyzes one symbol and publishes the result to all consumers.
+    Candles already fetched for the panel are analyzed as-is, not fetched again.
+    """
+    logger.debug(f"🔍 Beginne Analyse: {symbol}")
+    start = time.perf_counter()
+    result = await analyze_symbol(symbol, chat_id=chat_id, candles=candles)
+    runtime = time.perf_counter() - start
+    record_call(symbol)
+    await scan_bus.publish(symbol, result, runtime)
+
+async def dispatch_live_signal(application, event: ScanEvent):
+    """Consumer: sends the live signal alert to all subscribers of the symbol."""
+    symbol, result = event.symbol, event.result
+    try:
         if result is None:
             logger.info(f"⚠️ [AutoSignalLoop] Kein verwertbares Signal: {symbol}")
             return
@@ -81,33 +228,32 @@ async def analyze_and_dispatch(application, symbol, chat_id):
             logger.info(f"⛔ {symbol} übersprungen. Action: {action}, Confidence: {confidence:.1f}%")
             return
 
+        if not signal_state.admit(symbol, result, channel="live"):
+            return
+
         bar = build_signal_bar(confidence)
         total = usage_monitor.get_call_count()
         avg = usage_monitor.get_average_confidence()
-        lang = get_language(chat_id) or "en"
-
-        text = (
-            f"📡 *A.R.K. Live Signal!*\n\n"
-            f"*Symbol:* `{symbol}`\n"
-            f"*Direction:* {action}\n"
-            f"*Confidence:* `{confidence:.1f}%`\n"
-            f"*Signal Score:* `{score}/100`\n"
-            f"*Rating:* {rating}\n"
-            f"*Price:* `${price}`\n"
-            f"*Signal Bar:* [{bar}]\n"
-            f"⚙️ {runtime:.2f}s – Signal #{total} today\n"
-            f"_Ø Confidence: {avg:.1f}%_\n\n"
-            f"_Markets move fast. Be precise. Be ready._"
-        )
 
-        await application.bot.send_message(
-            chat_id=chat_id,
-            text=text,
+        # Alert einmal pro Sprache der Abonnenten erstellen
+        def render(lang: str) -> str:
+            return LIVE_TEMPLATES(lang)["live"](
+                symbol=symbol, action=action, confidence=confidence, score=score, rating=rating,
+                price=price, bar=bar, runtime=event.runtime, total=total, avg=avg
+            )
+
+        recipients = await broadcaster.fan_out(
+            application.bot,
+            symbol,
+            confidence,
+            render,
             parse_mode="Markdown",
-            disable_web_page_preview=True
+            disable_web_page_preview=True,
+            priority=PRIORITY_ALERT,
+            batch=True
         )
 
-        logger.info(f"✅ [AutoSignalLoop] Signal gesendet: {symbol} ({action})")
+        logger.info(f"✅ [AutoSignalLoop] Signal gesendet: {symbol} ({action}) → {recipients} chat(s)")
 
     except Exception as e:
         logger.exception(f"❌ Analysefehler bei {symbol}: {e}")
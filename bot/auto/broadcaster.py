@@ -0,0 +1,84 @@
+"""
+A.R.K. Broadcaster – Multi-Subscriber Fan-Out 1.0
+Ein Signal wird einmal analysiert, einmal pro Sprache gerendert und über die Message Queue an alle passenden Abonnenten verteilt.
+Empfänger kommen aus dem Subscription Index – zusätzliche Abonnenten kosten keinen zusätzlichen Scan.
+
+Made in Bali. Engineered with German Precision.
+"""
+
+import time
+from bot.utils.language import get_language
+from bot.utils.subscription_index import subscription_index
+from bot.utils.message_queue import message_queue, PRIORITY_ALERT
+from bot.utils.logger import setup_logger
+
+# === Setup ===
+logger = setup_logger(__name__)
+
+class Broadcaster:
+    """
+    Delivers one rendered message to many chats.
+
+    Recipients are grouped by language so render(lang) runs once per
+    language, not once per chat; sends are queued on the shared,
+    rate-limited message queue and not awaited individually.
+    """
+
+    def __init__(self):
+        self.broadcasts = 0
+        self.deliveries = 0
+        self.renders = 0
+        self.total_fanout_time = 0.0
+
+    async def fan_out(self, bot, symbol: str, confidence: float, render, priority: int = PRIORITY_ALERT,
+                      batch: bool = False, **kwargs) -> int:
+        """
+        Sends a signal to every chat subscribed to symbol at this confidence.
+
+        Args:
+            bot (Bot): Bot used for sending.
+            symbol (str): Signal symbol, looked up in the subscription index.
+            confidence (float): Signal confidence, checked against each chat's minimum.
+            render (Callable): Takes a language code and returns the message text.
+
+        Returns:
+            int: Number of chats the message was queued for.
+        """
+        return await self.deliver(bot, subscription_index.recipients(symbol, confidence), render, priority, batch, **kwargs)
+
+    async def deliver(self, bot, chat_ids, render, priority: int = PRIORITY_ALERT, batch: bool = False, **kwargs) -> int:
+        """Renders once per language of chat_ids and queues the message for each chat."""
+        if not chat_ids:
+            return 0
+
+        started = time.perf_counter()
+        by_language = {}
+        for chat_id in chat_ids:
+            by_language.setdefault(get_language(chat_id), []).append(chat_id)
+
+        queued = 0
+        for lang, chats in by_language.items():
+            text = render(lang)
+            self.renders += 1
+            if not text:
+                continue
+            for chat_id in chats:
+                await message_queue.send(bot, chat_id=chat_id, text=text, priority=priority, batch=batch, **kwargs)
+            queued += len(chats)
+
+        self.broadcasts += 1
+        self.deliveries += queued
+        self.total_fanout_time += time.perf_counter() - started
+        logger.debug(f"📢 [Broadcaster] {queued} chat(s) | {len(by_language)} language(s)")
+        return queued
+
+    def get_stats(self) -> dict:
+        return {
+            "broadcasts": self.broadcasts,
+            "deliveries": self.deliveries,
+            "renders": self.renders,
+            "avg_fanout_ms": round(self.total_fanout_time / self.broadcasts * 1000, 2) if self.broadcasts else 0.0
+        }
+
+# === Singleton Export ===
+broadcaster = Broadcaster()
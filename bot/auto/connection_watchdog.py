@@ -12,6 +12,7 @@ from bot.utils.error_reporter import report_error
 from bot.utils.language import get_language
 from bot.utils.i18n import get_text
 from bot.config.settings import get_settings
+from bot.utils.message_queue import message_queue, PRIORITY_LOW
 
 # Logger & Config
 logger = setup_logger(__name__)
@@ -46,11 +47,13 @@ async def check_connection(bot: Bot, chat_id: int) -> bool:
         await report_error(bot, chat_id, e, context_info="Telegram API Connection Error")
 
         try:
-            await bot.send_message(
+            await message_queue.send(
+                bot,
                 chat_id=chat_id,
                 text=warning,
                 parse_mode="Markdown",
-                disable_web_page_preview=True
+                disable_web_page_preview=True,
+                priority=PRIORITY_LOW
             )
             logger.warning("⚠️ [ConnectionWatchdog] Alert message sent to user.")
         except Exception as alert_error:
@@ -13,6 +13,7 @@ from bot.utils.session_tracker import update_session_tracker
 from bot.utils.error_reporter import report_error
 from bot.utils.logger import setup_logger
 from bot.config.settings import get_settings
+from bot.utils.message_queue import message_queue, PRIORITY_NORMAL
 
 # Setup logger and config
 logger = setup_logger(__name__)
@@ -36,10 +37,12 @@ async def daily_analysis_job(context: ContextTypes.DEFAULT_TYPE = None):
         return
 
     try:
-        await bot.send_message(
+        await message_queue.send(
+            bot,
             chat_id=chat_id,
             text="📊 *Daily Ultra Market Scan started...*\n_Only strongest signals will be shown._",
-            parse_mode="Markdown"
+            parse_mode="Markdown",
+            priority=PRIORITY_NORMAL
         )
 
         for symbol in symbols:
@@ -73,11 +76,13 @@ async def daily_analysis_job(context: ContextTypes.DEFAULT_TYPE = None):
                 )
 
                 if signal_message:
-                    await bot.send_message(
+                    await message_queue.send(
+                        bot,
                         chat_id=chat_id,
                         text=signal_message,
                         parse_mode="Markdown",
-                        disable_web_page_preview=True
+                        disable_web_page_preview=True,
+                        priority=PRIORITY_NORMAL
                     )
                     logger.info(f"✅ [DailyAnalysis] Signal sent for {symbol}")
 
@@ -87,10 +92,12 @@ async def daily_analysis_job(context: ContextTypes.DEFAULT_TYPE = None):
                 logger.error(f"❌ [DailyAnalysis] Error on {symbol}: {symbol_error}")
                 await report_error(bot, chat_id, symbol_error, context_info=f"Daily Analysis {symbol}")
 
-        await bot.send_message(
+        await message_queue.send(
+            bot,
             chat_id=chat_id,
             text="✅ *Daily scan complete.*\n_Stay sharp. Stay disciplined._",
-            parse_mode="Markdown"
+            parse_mode="Markdown",
+            priority=PRIORITY_NORMAL
         )
         logger.info("✅ [DailyAnalysis] Scan completed successfully.")
 
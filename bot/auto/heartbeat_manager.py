@@ -7,43 +7,30 @@ Made in Bali. Engineered with German Precision.
 from datetime import datetime
 import platform
 import psutil
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from apscheduler.triggers.interval import IntervalTrigger
 from bot.utils.logger import setup_logger
 from bot.utils.language import get_language
 from bot.utils.i18n import get_text
 from bot.config.settings import get_settings
+from bot.scheduler.job_scheduler import job_scheduler
+from bot.utils.message_queue import message_queue, PRIORITY_LOW
 
 # Logger & Config
 logger = setup_logger(__name__)
 config = get_settings()
 
-# Singleton Scheduler Instance
-heartbeat_scheduler = AsyncIOScheduler()
-
 def start_heartbeat_manager(application, chat_id: int):
     """
-    Starts the heartbeat scheduler that pings status every 60 minutes.
+    Registers the heartbeat that pings status every 60 minutes with the central job scheduler.
     """
     try:
-        if heartbeat_scheduler.get_job(f"ultra_heartbeat_{chat_id}"):
-            logger.info(f"♻️ [HeartbeatManager] Scheduler already running for chat_id {chat_id}")
-            return
-
-        heartbeat_scheduler.add_job(
-            send_heartbeat,
-            trigger=IntervalTrigger(minutes=60),
-            args=[application, chat_id],
-            id=f"ultra_heartbeat_{chat_id}",
-            name=f"A.R.K. Heartbeat for {chat_id}",
-            replace_existing=True,
-            misfire_grace_time=300
+        job_scheduler.add_interval(
+            f"ultra_heartbeat_{chat_id}",
+            send_heartbeat, application, chat_id,
+            minutes=60,
+            jitter=30,
+            max_runtime=60
         )
-
-        if not heartbeat_scheduler.running:
-            heartbeat_scheduler.start()
-
-        logger.info(f"✅ [HeartbeatManager] Scheduler started for chat_id {chat_id}")
+        logger.info(f"✅ [HeartbeatManager] Registered for chat_id {chat_id}")
 
     except Exception as e:
         logger.critical(f"🔥 [HeartbeatManager] Failed to initialize: {e}")
@@ -73,11 +60,13 @@ async def send_heartbeat(application, chat_id: int):
             f"_{get_text('heartbeat_footer', lang)}_"
         )
 
-        await application.bot.send_message(
+        await message_queue.send(
+            application.bot,
             chat_id=chat_id,
             text=message,
             parse_mode="Markdown",
-            disable_web_page_preview=True
+            disable_web_page_preview=True,
+            priority=PRIORITY_LOW
         )
 
         logger.info(f"✅ [HeartbeatManager] Status sent to {chat_id}")
@@ -8,8 +8,9 @@ from telegram import Bot
 from bot.engine.news_scanner import detect_breaking_news, format_breaking_news
 from bot.utils.logger import setup_logger
 from bot.config.settings import get_settings
-from bot.utils.market_session_guard import is_us_market_open
+from bot.utils.market_calendar import market_calendar
 from bot.utils.error_reporter import report_error
+from bot.utils.message_queue import message_queue, PRIORITY_ALERT
 
 # Setup logger and load config
 logger = setup_logger(__name__)
@@ -29,11 +30,8 @@ async def news_signal_loop():
 
     while True:
         try:
-            # === US Market Guard ===
-            if not is_us_market_open():
-                logger.info("⏳ [NewsLoop] US market closed – skipping news check.")
-                await asyncio.sleep(180)
-                continue
+            # === US Market Guard: bis zur nächsten Eröffnung schlafen ===
+            await market_calendar.wait_for_session("NewsLoop")
 
             # === Fetch & Format ===
             breaking_news = await detect_breaking_news()
@@ -42,11 +40,13 @@ async def news_signal_loop():
                 message = await format_breaking_news(breaking_news, lang=language)
 
                 if message:
-                    await bot.send_message(
+                    await message_queue.send(
+                        bot,
                         chat_id=chat_id,
                         text=message,
                         parse_mode="Markdown",
-                        disable_web_page_preview=True
+                        disable_web_page_preview=True,
+                        priority=PRIORITY_ALERT
                     )
                     logger.info(f"✅ [NewsLoop] Breaking news alert sent. Count: {len(breaking_news)}")
                 else:
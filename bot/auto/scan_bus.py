@@ -0,0 +1,158 @@
+"""
+A.R.K. Scan Bus – Single Producer, Many Consumers 1.0
+Ein Scan pro Zyklus veröffentlicht jedes analyze_symbol-Ergebnis genau einmal.
+Live Alerts, Ultra Signals, Session Tracking und Recaps hängen sich als Abonnenten an – kein doppelter Fetch, keine doppelte Analyse.
+Jeder Abonnent hat eine eigene Queue mit eigenem Task – Consumer laufen außerhalb der begrenzten Scan-Worker.
+Zyklus-Abonnenten (z. B. der Signal Digest) werden nach dem letzten verarbeiteten Ergebnis eines Zyklus einmal benachrichtigt.
+
+Made in Bali. Engineered with German Precision.
+"""
+
+import asyncio
+import time
+from typing import NamedTuple
+from bot.utils.logger import setup_logger
+
+# === Setup ===
+logger = setup_logger(__name__)
+
+class ScanEvent(NamedTuple):
+    """One published scan result."""
+    symbol: str
+    result: dict | None   # analyze_symbol-Ergebnis, None wenn keine verwertbare Analyse
+    runtime: float        # Sekunden für Fetch + Analyse
+    cycle: int            # Laufende Nummer des Scan-Zyklus
+    published_at: float   # time.time() der Veröffentlichung
+
+class ScanBus:
+    """
+    In-process publish/subscribe bus for scan results.
+
+    Every subscriber receives every event through its own queue, drained in
+    order by its own task. publish() only enqueues, so consumer time neither
+    counts against the scan concurrency and deadline nor can a scan deadline
+    cancel a consumer half-way. A failing subscriber blocks nobody.
+    """
+
+    def __init__(self):
+        self._subscribers = {}  # name → async handler(event)
+        self._queues = {}       # name → asyncio.Queue[ScanEvent]
+        self._workers = {}      # name → asyncio.Task
+        self._cycle_handlers = {}  # name → async handler(cycle)
+        self.cycle = 0
+        self.published = 0
+        self.delivered = {}     # name → count
+        self.failures = {}      # name → count
+
+    # === Subscriptions ===
+    def subscribe(self, name: str, handler) -> None:
+        """
+        Registers a consumer; a second registration under the same name replaces the first.
+
+        Args:
+            name (str): Consumer name for logs and stats.
+            handler (Callable): Coroutine function taking a ScanEvent.
+        """
+        self._subscribers[name] = handler
+        self._queues.setdefault(name, asyncio.Queue())
+        self.delivered.setdefault(name, 0)
+        self.failures.setdefault(name, 0)
+        logger.info(f"📬 [ScanBus] Consumer registriert: {name}")
+
+    def unsubscribe(self, name: str) -> None:
+        self._subscribers.pop(name, None)
+        self._cycle_handlers.pop(name, None)
+        self._queues.pop(name, None)
+        worker = self._workers.pop(name, None)
+        if worker is not None:
+            worker.cancel()
+
+    def on_cycle_end(self, name: str, handler) -> None:
+        """
+        Registers a coroutine function taking the cycle number; it runs once
+        after the producer has published the last result of a cycle.
+        """
+        self._cycle_handlers[name] = handler
+        self.failures.setdefault(name, 0)
+        logger.info(f"📬 [ScanBus] Cycle-Consumer registriert: {name}")
+
+    @property
+    def consumers(self) -> list[str]:
+        return list(self._subscribers)
+
+    # === Publishing ===
+    def next_cycle(self) -> int:
+        """Starts a new scan cycle and returns its number."""
+        self.cycle += 1
+        return self.cycle
+
+    async def publish(self, symbol: str, result: dict | None, runtime: float = 0.0) -> ScanEvent:
+        """
+        Queues one scan result for all consumers; does not wait for them.
+
+        Returns:
+            ScanEvent: The published event.
+        """
+        event = ScanEvent(symbol, result, runtime, self.cycle, time.time())
+        self.published += 1
+
+        for name in list(self._subscribers):
+            self._ensure_worker(name)
+            self._queues[name].put_nowait(event)
+        return event
+
+    def _ensure_worker(self, name: str) -> None:
+        worker = self._workers.get(name)
+        if worker is None or worker.done():
+            self._workers[name] = asyncio.ensure_future(self._drain(name))
+
+    async def _drain(self, name: str) -> None:
+        queue = self._queues[name]
+        while True:
+            event = await queue.get()
+            try:
+                handler = self._subscribers.get(name)
+                if handler is not None:
+                    await handler(event)
+                    self.delivered[name] += 1
+            except Exception as e:
+                self.failures[name] += 1
+                logger.error(f"❌ [ScanBus] Consumer {name} failed for {event.symbol}: {e}")
+            finally:
+                queue.task_done()
+
+    async def end_cycle(self) -> None:
+        """
+        Waits until every consumer has processed the cycle's events, then
+        notifies all cycle consumers that the current cycle is complete.
+        """
+        await asyncio.gather(*(queue.join() for queue in list(self._queues.values())))
+        names = list(self._cycle_handlers)
+        outcomes = await asyncio.gather(
+            *(self._cycle_handlers[name](self.cycle) for name in names),
+            return_exceptions=True
+        )
+        for name, outcome in zip(names, outcomes):
+            if isinstance(outcome, BaseException):
+                self.failures[name] += 1
+                logger.error(f"❌ [ScanBus] Cycle-Consumer {name} failed for cycle {self.cycle}: {outcome}")
+
+    async def shutdown(self) -> None:
+        """Cancels all consumer tasks; queued events are dropped."""
+        workers = list(self._workers.values())
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        self._workers.clear()
+
+    def get_stats(self) -> dict:
+        return {
+            "cycle": self.cycle,
+            "published": self.published,
+            "consumers": len(self._subscribers),
+            "backlog": sum(queue.qsize() for queue in self._queues.values()),
+            "failures": sum(self.failures.values())
+        }
+
+# === Singleton Export ===
+scan_bus = ScanBus()
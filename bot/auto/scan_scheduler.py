@@ -0,0 +1,141 @@
+"""
+A.R.K. Scan Scheduler – Bounded Priority Scanner 1.0
+Begrenzte Parallelität, Priorität nach Volatilität & Volumen-Spikes, Deadline pro Zyklus.
+Was bis zur Deadline nicht fertig ist, rollt an den Anfang des nächsten Zyklus – keine gestapelten Jobs.
+
+Made in Bali. Engineered with German Precision.
+"""
+
+import asyncio
+import time
+from bot.config.settings import get_settings
+from bot.utils.logger import setup_logger
+
+# === Setup ===
+logger = setup_logger(__name__)
+config = get_settings()
+
+SCAN_CONCURRENCY = config.get("SCAN_CONCURRENCY", 8)
+SCAN_DEADLINE_SEC = config.get("SCAN_DEADLINE_SEC", 45)
+
+class ScanScheduler:
+    """
+    Runs one worker coroutine per symbol with a concurrency cap and a deadline.
+
+    Symbols are ordered by carry-over first, then by priority (recent
+    volatility plus volume spike). Workers still pending at the deadline are
+    cancelled and their symbols lead the next cycle.
+    """
+
+    def __init__(self, name: str, concurrency: int = SCAN_CONCURRENCY, deadline_sec: float = SCAN_DEADLINE_SEC):
+        self.name = name
+        self.concurrency = max(1, concurrency)
+        self.deadline_sec = deadline_sec
+        self._priority = {}      # symbol → score
+        self._carry_over = []    # Symbole, die im letzten Zyklus nicht fertig wurden
+        self.runs = 0
+        self.completed = 0
+        self.rolled_over = 0
+        self.last_cycle_sec = 0.0
+
+    # === Priorities ===
+    def update_priority(self, symbol: str, atr_pct: float = 0.0, volume_ratio: float = 1.0) -> None:
+        """
+        Scores a symbol by its ATR in percent of price plus any volume surge above baseline.
+        """
+        atr_pct = atr_pct if atr_pct == atr_pct else 0.0
+        surge = max(volume_ratio - 1.0, 0.0) if volume_ratio == volume_ratio else 0.0
+        self._priority[symbol] = atr_pct + surge
+
+    def bump(self, symbol: str, amount: float) -> None:
+        """Raises a symbol's priority until its next regular update, e.g. after an intrabar breakout."""
+        self._priority[symbol] = self._priority.get(symbol, 0.0) + amount
+
+    def order(self, symbols: list[str]) -> list[str]:
+        """Returns the symbols in scan order: carry-over first, then by priority."""
+        wanted = set(symbols)
+        first = [s for s in self._carry_over if s in wanted]
+        carried = set(first)
+        rest = sorted((s for s in symbols if s not in carried), key=lambda s: -self._priority.get(s, 0.0))
+        return first + rest
+
+    def deadline(self) -> float:
+        """Absolute monotonic deadline for a cycle starting now."""
+        return time.monotonic() + self.deadline_sec
+
+    # === Execution ===
+    async def run_cycle(self, symbols: list[str], worker, deadline_at: float = None, stagger_sec: float = 0.0) -> dict:
+        """
+        Runs worker(symbol) for all symbols in priority order under the cap.
+
+        Args:
+            symbols (list[str]): Symbols to scan.
+            worker (Callable): Coroutine function taking a symbol.
+            deadline_at (float, optional): Shared monotonic deadline, e.g. for
+                several phases of one cycle. Defaults to now + deadline_sec.
+            stagger_sec (float, optional): Spreads worker starts evenly over this
+                window in scan order, so requests do not all hit at the bar close.
+
+        Returns:
+            dict: Symbol → worker result for all workers finished in time.
+        """
+        if not symbols:
+            return {}
+
+        started = time.monotonic()
+        deadline_at = deadline_at or started + self.deadline_sec
+        ordered = self.order(symbols)
+        gate = asyncio.Semaphore(self.concurrency)
+
+        async def guarded(index: int, symbol: str):
+            if stagger_sec > 0:
+                await asyncio.sleep(index * stagger_sec / len(ordered))
+            async with gate:
+                return await worker(symbol)
+
+        tasks = {asyncio.ensure_future(guarded(i, symbol)): symbol for i, symbol in enumerate(ordered)}
+        done, pending = await asyncio.wait(tasks, timeout=max(deadline_at - time.monotonic(), 0))
+
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        results = {}
+        for task in done:
+            if task.cancelled():
+                continue
+            if task.exception() is not None:
+                logger.error(f"❌ [ScanScheduler:{self.name}] {tasks[task]} failed: {task.exception()}")
+                continue
+            results[tasks[task]] = task.result()
+
+        # Unfertige Symbole in Scan-Reihenfolge an den Anfang des nächsten Zyklus;
+        # Übertrag aus anderen Phasen desselben Zyklus bleibt erhalten
+        unfinished = {tasks[t] for t in pending}
+        scanned = set(ordered)
+        untouched = [s for s in self._carry_over if s not in scanned]
+        self._carry_over = [s for s in ordered if s in unfinished] + untouched
+        self.runs += 1
+        self.completed += len(done)
+        self.rolled_over += len(pending)
+        self.last_cycle_sec = time.monotonic() - started
+
+        logger.info(
+            f"⏱️ [ScanScheduler:{self.name}] {len(done)}/{len(ordered)} done in {self.last_cycle_sec:.1f}s | "
+            f"Rolled over: {len(pending)} | Concurrency: {self.concurrency}"
+        )
+        return results
+
+    def get_stats(self) -> dict:
+        return {
+            "runs": self.runs,
+            "completed": self.completed,
+            "rolled_over": self.rolled_over,
+            "carry_over": len(self._carry_over),
+            "last_cycle_sec": round(self.last_cycle_sec, 2),
+            "concurrency": self.concurrency
+        }
+
+# === Singleton Export ===
+scan_scheduler = ScanScheduler("signals")
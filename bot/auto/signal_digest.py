@@ -0,0 +1,193 @@
+"""
+A.R.K. Signal Digest – One Ranked Message per Scan Cycle 1.0
+Sammelt alle qualifizierten Live- und Ultra-Signale eines Zyklus vom Scan Bus und sendet sie am Zyklusende
+als eine kompakte, nach Confidence und Score sortierte Nachricht – bei Bedarf auf mehrere 4096-Zeichen-Teile verteilt.
+Jeder Abonnent erhält nur seine Symbole; Chats mit gleicher Auswahl und Sprache teilen sich ein Rendering.
+
+Made in Bali. Engineered with German Precision.
+"""
+
+from telegram.ext import Application
+from bot.auto.scan_bus import ScanEvent
+from bot.auto.auto_analysis import qualify_ultra_signal, record_session_signal
+from bot.utils.signal_state import signal_state
+from bot.utils.language import get_language
+from bot.utils.i18n import TemplateSet
+from bot.utils.subscription_index import subscription_index
+from bot.utils.message_queue import message_queue, PRIORITY_ALERT, MAX_MESSAGE_LENGTH
+from bot.utils.logger import setup_logger
+
+# === Setup ===
+logger = setup_logger(__name__)
+
+MIN_CONFIDENCE = 50.0  # wie im Live-Alert des Auto Signal Loops
+HEADER_RESERVE = 120   # Platz für Kopfzeile und Teil-Nummer
+
+# === Templates (Labels einmal pro Sprache aufgelöst) ===
+TEMPLATES = TemplateSet(
+    header="📡 *{t:digest_header}*{suffix}\n_{t:digest_cycle} {cycle} – {count} {t:digest_signals}_\n\n",
+    line="{rank}. `{symbol}` {action} | `{confidence:.1f}%` | {t:digest_score} `{score}/100` | `${price}`{stars}"
+)
+
+class SignalDigest:
+    """
+    Collects qualifying scan results until the cycle ends, then sends each
+    subscriber one ranked digest of its symbols instead of one message per symbol.
+
+    A result qualifies as a live signal (directional, MIN_CONFIDENCE) or as an
+    ultra signal (qualify_ultra_signal) and signal_state admits it as a
+    changed setup; each symbol appears once per digest.
+    """
+
+    def __init__(self):
+        self._pending = {}  # symbol → (result, ultra patterns)
+        self.digests = 0
+        self.messages = 0
+        self.signals = 0
+
+    # === Collecting ===
+    def add(self, event: ScanEvent) -> bool:
+        """Keeps the event's result if it qualifies; returns True when kept."""
+        result = event.result
+        if not result:
+            return False
+
+        action = result.get("combined_action", "Neutral ⚪")
+        ultra = qualify_ultra_signal(result)
+        live = action in ("Long 📈", "Short 📉") and result.get("avg_confidence", 0.0) >= MIN_CONFIDENCE
+        if not (live or ultra) or not signal_state.admit(event.symbol, result, channel="digest"):
+            return False
+
+        self._pending[event.symbol] = (result, ultra)
+        return True
+
+    def ranked(self, symbols=None) -> list:
+        """Pending signals (optionally only `symbols`), strongest first (confidence, then signal score)."""
+        items = self._pending.items() if symbols is None else [(s, self._pending[s]) for s in symbols]
+        return sorted(
+            items,
+            key=lambda item: (item[1][0].get("avg_confidence", 0.0), item[1][0].get("signal_score", 0)),
+            reverse=True
+        )
+
+    # === Rendering ===
+    @staticmethod
+    def render_line(rank: int, symbol: str, result: dict, ultra: list, lang: str = "en") -> str:
+        stars = max((p.get("stars", 0) for p in ultra), default=0)
+        return TEMPLATES(lang)["line"](
+            rank=rank,
+            symbol=symbol,
+            action=result.get("combined_action"),
+            confidence=result.get("avg_confidence", 0.0),
+            score=result.get("signal_score", 0),
+            price=result.get("last_price", "n/a"),
+            stars=f" {'⭐' * stars}" if stars else ""
+        )
+
+    def render(self, cycle: int, symbols=None, lang: str = "en") -> list[str]:
+        """
+        Renders the pending signals in `lang` into as few messages as Telegram's length limit allows.
+        """
+        entries = self.ranked(symbols)
+        lines = [
+            self.render_line(rank, symbol, result, ultra, lang)
+            for rank, (symbol, (result, ultra)) in enumerate(entries, 1)
+        ]
+
+        chunks, current, length = [], [], 0
+        budget = MAX_MESSAGE_LENGTH - HEADER_RESERVE
+        for line in lines:
+            if current and length + len(line) + 1 > budget:
+                chunks.append(current)
+                current, length = [], 0
+            current.append(line)
+            length += len(line) + 1
+        if current:
+            chunks.append(current)
+
+        messages = []
+        for part, chunk in enumerate(chunks, 1):
+            suffix = f" ({part}/{len(chunks)})" if len(chunks) > 1 else ""
+            header = TEMPLATES(lang)["header"](suffix=suffix, cycle=cycle, count=len(entries))
+            messages.append(header + "\n".join(chunk))
+        return messages
+
+    # === Flushing ===
+    def audiences(self) -> dict:
+        """Groups subscribers by (language, subscribed pending symbols) → chat_ids."""
+        per_chat = {}
+        for symbol, (result, _) in self._pending.items():
+            for chat_id in subscription_index.recipients(symbol, result.get("avg_confidence", 0.0)):
+                per_chat.setdefault(chat_id, []).append(symbol)
+
+        groups = {}
+        for chat_id, symbols in per_chat.items():
+            groups.setdefault((get_language(chat_id), frozenset(symbols)), []).append(chat_id)
+        return groups
+
+    async def flush(self, bot, cycle: int) -> int:
+        """
+        Sends the digest of the finished cycle to every subscriber and clears it.
+
+        Returns:
+            int: Number of signals in the digest.
+        """
+        if not self._pending:
+            return 0
+
+        groups = self.audiences()
+        delivered = set()
+        sent, chats = 0, 0
+        for (lang, symbols), chat_ids in groups.items():
+            messages = self.render(cycle, symbols, lang)
+            for chat_id in chat_ids:
+                for text in messages:
+                    await message_queue.send(
+                        bot,
+                        chat_id=chat_id,
+                        text=text,
+                        parse_mode="Markdown",
+                        disable_web_page_preview=True,
+                        priority=PRIORITY_ALERT
+                    )
+            delivered |= symbols
+            sent += len(messages) * len(chat_ids)
+            chats += len(chat_ids)
+
+        pending = dict(self._pending)
+        count = len(pending)
+        self._pending.clear()
+
+        # Session-Statistik nur für tatsächlich gesendete Ultra Signals
+        for symbol in delivered:
+            result, ultra = pending[symbol]
+            if ultra:
+                await record_session_signal(result, ultra)
+
+        self.digests += 1
+        self.messages += sent
+        self.signals += count
+        logger.info(
+            f"📨 [SignalDigest] Cycle {cycle}: {count} signal(s) → {chats} chat(s) | "
+            f"{sent} message(s) from {len(groups)} rendering(s)"
+        )
+        return count
+
+    def get_stats(self) -> dict:
+        return {
+            "digests": self.digests,
+            "messages": self.messages,
+            "signals": self.signals,
+            "pending": len(self._pending)
+        }
+
+# === Singleton Export ===
+signal_digest = SignalDigest()
+
+async def digest_consumer(event: ScanEvent):
+    """Scan bus consumer: collects the event for the cycle's digest."""
+    signal_digest.add(event)
+
+async def flush_digest(application: Application, cycle: int):
+    """Cycle consumer: sends the collected digest."""
+    await signal_digest.flush(application.bot, cycle)
@@ -54,7 +54,26 @@ def get_settings() -> dict:
 
     # === Signal Module ===
     signal_check_interval_sec = get_env_var("SIGNAL_CHECK_INTERVAL_SEC", default=60, cast_type=int)
-    max_signals_per_hour = get_env_var("MAX_SIGNALS_PER_HOUR", default=150, cast_type=int)
+    max_signals_per_hour = get_env_var("MAX_SIGNALS_PER_HOUR", default=150, cast_type=int)  # 0 = unbegrenzt
+    signal_cooldown_sec = get_env_var("SIGNAL_COOLDOWN_SEC", default=900, cast_type=int)
+    scan_mode = get_env_var("SCAN_MODE", default="per_symbol").lower()  # per_symbol | panel (opt-in)
+    scan_concurrency = get_env_var("SCAN_CONCURRENCY", default=8, cast_type=int)
+    scan_deadline_sec = get_env_var("SCAN_DEADLINE_SEC", default=45, cast_type=int)
+    scan_schedule = get_env_var("SCAN_SCHEDULE", default="candle_close").lower()  # candle_close | interval
+    candle_close_offset_sec = get_env_var("CANDLE_CLOSE_OFFSET_SEC", default=3, cast_type=int)
+    scan_stagger_sec = get_env_var("SCAN_STAGGER_SEC", default=5, cast_type=float)
+    intrabar_check_sec = get_env_var("INTRABAR_CHECK_SEC", default=60, cast_type=int)  # 0 = aus
+    intrabar_max_symbols = get_env_var("INTRABAR_MAX_SYMBOLS", default=10, cast_type=int)
+    market_hours_only = get_env_var("MARKET_HOURS_ONLY", default="True").lower() == "true"
+    signal_delivery = get_env_var("SIGNAL_DELIVERY", default="single").lower()  # single | digest (opt-in)
+
+    # === Compute Pool ===
+    analysis_execution = get_env_var("ANALYSIS_EXECUTION", default="inline").lower()  # inline | process
+    compute_pool_size = get_env_var("COMPUTE_POOL_SIZE", default=2, cast_type=int)
+
+    # === Analysis Pipeline Gates ===
+    analysis_min_volume_ratio = get_env_var("ANALYSIS_MIN_VOLUME_RATIO", default=0.0, cast_type=float)  # 0 = aus
+    analysis_require_ema_alignment = get_env_var("ANALYSIS_REQUIRE_EMA_ALIGNMENT", default="False").lower() == "true"
 
     # === AI Confidence Scaling ===
     confidence_adjustment_enabled = get_env_var("CONFIDENCE_ADJUSTMENT_ENABLED", default="False").lower() == "true"
@@ -72,6 +91,34 @@ def get_settings() -> dict:
     us_market_open_hour = get_env_var("US_MARKET_OPEN_HOUR", default=13, cast_type=int)   # UTC → 13:30 NYSE
     us_market_close_hour = get_env_var("US_MARKET_CLOSE_HOUR", default=20, cast_type=int) # UTC → 20:00 NYSE
 
+    # === HTTP Client ===
+    http_pool_limit = get_env_var("HTTP_POOL_LIMIT", default=20, cast_type=int)
+    http_pool_limit_per_host = get_env_var("HTTP_POOL_LIMIT_PER_HOST", default=8, cast_type=int)
+    http_timeout_sec = get_env_var("HTTP_TIMEOUT_SEC", default=10, cast_type=int)
+
+    # === Finnhub Rate Limits (Token Buckets) ===
+    finnhub_rate_per_min = get_env_var("FINNHUB_RATE_PER_MIN", default=60, cast_type=int)
+    finnhub_burst = get_env_var("FINNHUB_BURST", default=10, cast_type=int)
+    finnhub_candle_rate_per_min = get_env_var("FINNHUB_CANDLE_RATE_PER_MIN", default=60, cast_type=int)
+    finnhub_news_rate_per_min = get_env_var("FINNHUB_NEWS_RATE_PER_MIN", default=10, cast_type=int)
+    finnhub_quote_rate_per_min = get_env_var("FINNHUB_QUOTE_RATE_PER_MIN", default=60, cast_type=int)
+
+    # === Telegram Outbound Queue ===
+    telegram_global_rate_per_sec = get_env_var("TELEGRAM_GLOBAL_RATE_PER_SEC", default=25, cast_type=int)
+    telegram_chat_rate_per_min = get_env_var("TELEGRAM_CHAT_RATE_PER_MIN", default=20, cast_type=int)
+    telegram_max_retries = get_env_var("TELEGRAM_MAX_RETRIES", default=5, cast_type=int)
+
+    # === Circuit Breaker ===
+    breaker_window_sec = get_env_var("BREAKER_WINDOW_SEC", default=60, cast_type=int)
+    breaker_min_calls = get_env_var("BREAKER_MIN_CALLS", default=5, cast_type=int)
+    breaker_error_rate = get_env_var("BREAKER_ERROR_RATE", default=0.5, cast_type=float)
+    breaker_slow_call_sec = get_env_var("BREAKER_SLOW_CALL_SEC", default=5.0, cast_type=float)
+    breaker_open_sec = get_env_var("BREAKER_OPEN_SEC", default=30, cast_type=int)
+
+    # === Candle Store ===
+    candle_store_enabled = get_env_var("CANDLE_STORE_ENABLED", default="True").lower() == "true"
+    candle_store_dir = get_env_var("CANDLE_STORE_DIR", default="data/candles")
+
     logger.info(f"✅ [Settings] Loaded successfully. Environment: {environment} | Language: {bot_language}")
 
     return {
@@ -84,6 +131,21 @@ def get_settings() -> dict:
         "BOT_LANGUAGE": bot_language,
         "SIGNAL_CHECK_INTERVAL_SEC": signal_check_interval_sec,
         "MAX_SIGNALS_PER_HOUR": max_signals_per_hour,
+        "SIGNAL_COOLDOWN_SEC": signal_cooldown_sec,
+        "SCAN_MODE": scan_mode,
+        "SCAN_CONCURRENCY": scan_concurrency,
+        "SCAN_DEADLINE_SEC": scan_deadline_sec,
+        "SCAN_SCHEDULE": scan_schedule,
+        "CANDLE_CLOSE_OFFSET_SEC": candle_close_offset_sec,
+        "SCAN_STAGGER_SEC": scan_stagger_sec,
+        "INTRABAR_CHECK_SEC": intrabar_check_sec,
+        "INTRABAR_MAX_SYMBOLS": intrabar_max_symbols,
+        "MARKET_HOURS_ONLY": market_hours_only,
+        "SIGNAL_DELIVERY": signal_delivery,
+        "ANALYSIS_EXECUTION": analysis_execution,
+        "COMPUTE_POOL_SIZE": compute_pool_size,
+        "ANALYSIS_MIN_VOLUME_RATIO": analysis_min_volume_ratio,
+        "ANALYSIS_REQUIRE_EMA_ALIGNMENT": analysis_require_ema_alignment,
         "NEWS_FILTER_ENABLED": news_filter_enabled,
         "BACKUP_NEWS_ENABLED": backup_news_enabled,
         "CONFIDENCE_ADJUSTMENT_ENABLED": confidence_adjustment_enabled,
@@ -91,5 +153,23 @@ def get_settings() -> dict:
         "WATCHDOG_ENABLED": watchdog_enabled,
         "WATCHDOG_INTERVAL_MIN": watchdog_interval_min,
         "US_MARKET_OPEN_HOUR": us_market_open_hour,
-        "US_MARKET_CLOSE_HOUR": us_market_close_hour
+        "US_MARKET_CLOSE_HOUR": us_market_close_hour,
+        "HTTP_POOL_LIMIT": http_pool_limit,
+        "HTTP_POOL_LIMIT_PER_HOST": http_pool_limit_per_host,
+        "HTTP_TIMEOUT_SEC": http_timeout_sec,
+        "FINNHUB_RATE_PER_MIN": finnhub_rate_per_min,
+        "FINNHUB_BURST": finnhub_burst,
+        "FINNHUB_CANDLE_RATE_PER_MIN": finnhub_candle_rate_per_min,
+        "FINNHUB_NEWS_RATE_PER_MIN": finnhub_news_rate_per_min,
+        "FINNHUB_QUOTE_RATE_PER_MIN": finnhub_quote_rate_per_min,
+        "TELEGRAM_GLOBAL_RATE_PER_SEC": telegram_global_rate_per_sec,
+        "TELEGRAM_CHAT_RATE_PER_MIN": telegram_chat_rate_per_min,
+        "TELEGRAM_MAX_RETRIES": telegram_max_retries,
+        "BREAKER_WINDOW_SEC": breaker_window_sec,
+        "BREAKER_MIN_CALLS": breaker_min_calls,
+        "BREAKER_ERROR_RATE": breaker_error_rate,
+        "BREAKER_SLOW_CALL_SEC": breaker_slow_call_sec,
+        "BREAKER_OPEN_SEC": breaker_open_sec,
+        "CANDLE_STORE_ENABLED": candle_store_enabled,
+        "CANDLE_STORE_DIR": candle_store_dir
     }
@@ -8,6 +8,7 @@ Made in Bali. Engineered with German Precision.
 
 import pandas as pd
 import numpy as np
+from bot.engine.feature_frame import FeatureFrame, EMA_FAST, EMA_SLOW, RSI_PERIOD
 from bot.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
@@ -17,10 +18,13 @@ def detect_adaptive_trend(
     rsi_period: int = 14,
     slope_window: int = 5,
     ma_fast: int = 9,
-    ma_slow: int = 21
+    ma_slow: int = 21,
+    features: FeatureFrame = None
 ) -> dict | None:
     """
     Detects early directional bias using smoothed slope, RSI zone, EMA cross distance and recent dynamics.
+
+    The shared feature frame is used whenever the periods match its defaults.
     """
 
     if df is None or df.empty or "c" not in df.columns or len(df) < max(rsi_period, slope_window, ma_slow):
@@ -39,21 +43,29 @@ def detect_adaptive_trend(
         x = np.arange(slope_window)
         slope = np.polyfit(x, y, 1)[0]
 
+        shared = (rsi_period, ma_fast, ma_slow) == (RSI_PERIOD, EMA_FAST, EMA_SLOW)
+        if features is None or not shared:
+            features = FeatureFrame.from_frame(df) if shared else None
+
         # === 2. RSI Calculation ===
-        delta = close.diff()
-        gain = np.maximum(delta, 0)
-        loss = -np.minimum(delta, 0)
-        avg_gain = gain.rolling(window=rsi_period).mean()
-        avg_loss = loss.rolling(window=rsi_period).mean()
-        rs = avg_gain / (avg_loss + 1e-9)
-        rsi = 100 - (100 / (1 + rs))
-        current_rsi = rsi.iloc[-1]
+        if features is not None:
+            current_rsi = features.last.rsi
+        else:
+            delta = close.diff()
+            gain = np.maximum(delta, 0)
+            loss = -np.minimum(delta, 0)
+            avg_gain = gain.rolling(window=rsi_period).mean()
+            avg_loss = loss.rolling(window=rsi_period).mean()
+            rs = avg_gain / (avg_loss + 1e-9)
+            current_rsi = (100 - (100 / (1 + rs))).iloc[-1]
 
         # === 3. EMA Crossover ===
-        ema_fast = close.ewm(span=ma_fast, adjust=False).mean()
-        ema_slow = close.ewm(span=ma_slow, adjust=False).mean()
-        last_fast = ema_fast.iloc[-1]
-        last_slow = ema_slow.iloc[-1]
+        if features is not None:
+            last_fast = features.last.ema_fast
+            last_slow = features.last.ema_slow
+        else:
+            last_fast = close.ewm(span=ma_fast, adjust=False).mean().iloc[-1]
+            last_slow = close.ewm(span=ma_slow, adjust=False).mean().iloc[-1]
         crossover_strength = abs(last_fast - last_slow) / (close.iloc[-1] + 1e-9) * 100
 
         # === 4. Adaptive Thresholds ===
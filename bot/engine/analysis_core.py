@@ -0,0 +1,183 @@
+"""
+A.R.K. Analysis Core – Pure Compute Stage 1.1
+Patterns, Indikatoren, Trend, Volumen, RRR und Confidence als reine Funktion auf Kerzen-Arrays.
+Ohne Netzwerk- und Event-Loop-Abhängigkeiten – läuft inline oder in einem Worker-Prozess.
+Billige Gates (Kerzen-Range, Patterns, Volumen-Ratio, EMA-Richtung) verwerfen Symbole vor den teuren Engines.
+
+Made in Bali. Engineered with German Precision.
+"""
+
+import numpy as np
+from bot.engine.candles import Candles
+from bot.engine.feature_frame import FeatureFrame, IndicatorSnapshot
+from bot.engine.pattern_analysis_engine import (
+    detect_patterns, evaluate_indicators, pattern_matrix, qualified_mask,
+    PATTERN_DEFINITIONS, PATTERN_NAMES, MOMENTUM_LOOKBACK
+)
+from bot.engine.volume_spike_detector import detect_volume_spike
+from bot.engine.adaptive_trend_detector import detect_adaptive_trend
+from bot.engine.confidence_optimizer import optimize_confidence
+from bot.engine.signal_category_engine import categorize_signal
+from bot.engine.risk_engine import analyze_risk_reward
+from bot.engine.signal_rating_improvement import rate_signal
+from bot.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Reihenfolge der Pipeline: billige Gates zuerst, "confidence" ist die volle Rechenstufe
+STAGES = ("validation", "range", "patterns", "volume", "ema", "confidence")
+RECENT_VOLUME_BARS = 3
+
+def screen_candles(candles: Candles, snapshot: IndicatorSnapshot,
+                   min_volume_ratio: float = 0.0, require_ema_alignment: bool = False) -> str | None:
+    """
+    Runs the cheap gates in order and stops at the first one that fails.
+
+    "range" and "patterns" are exact: without range and body on the last bar,
+    or without a qualified pattern, compute_analysis can never reach its
+    confidence threshold. "volume" and "ema" are opt-in filters.
+
+    Args:
+        candles (Candles): Validated OHLCV series.
+        snapshot (IndicatorSnapshot): Latest indicator values.
+        min_volume_ratio (float): Minimum recent volume / baseline; 0 disables the gate.
+        require_ema_alignment (bool): Reject patterns against the EMA9/EMA21 direction.
+
+    Returns:
+        str | None: Name of the rejecting stage, or None if all gates pass.
+    """
+    o, h, l, c = candles.o[-1], candles.h[-1], candles.l[-1], candles.c[-1]
+    if h == l or c == o:
+        return "range"
+
+    window = slice(-(MOMENTUM_LOOKBACK + 1), None)
+    hits = pattern_matrix(candles.o[window], candles.h[window], candles.l[window], candles.c[window])[-1]
+    hits &= qualified_mask()
+    if not hits.any():
+        return "patterns"
+
+    if min_volume_ratio > 0:
+        ratio = candles.v[-RECENT_VOLUME_BARS:].mean() / snapshot.volume_baseline if snapshot.volume_baseline > 0 else np.nan
+        if ratio < min_volume_ratio:
+            return "volume"
+
+    if require_ema_alignment:
+        patterns = [PATTERN_DEFINITIONS[name] for name, hit in zip(PATTERN_NAMES, hits) if hit]
+        action = determine_action(patterns, {}, 0.0)
+        ema_gap = snapshot.ema_fast - snapshot.ema_slow
+        if (action == "Long 📈" and not ema_gap > 0) or (action == "Short 📉" and not ema_gap < 0):
+            return "ema"
+
+    return None
+
+def compute_analysis(symbol: str, candles: Candles, snapshot: IndicatorSnapshot = None) -> dict | None:
+    """
+    Runs the complete signal computation for one symbol.
+
+    Args:
+        symbol (str): Ticker symbol.
+        candles (Candles): Validated OHLCV series.
+        snapshot (IndicatorSnapshot, optional): Latest indicator values from the
+            caller's streaming state; computed from the arrays when missing.
+
+    Returns:
+        dict | None: Analysis result, or None below the confidence threshold.
+    """
+    try:
+        last_price = float(candles.c[-1])
+        df = candles.to_pandas()  # DataFrame nur noch an der Grenze zu den Legacy-Engines
+        features = FeatureFrame.from_candles(candles, last=snapshot)
+        patterns = detect_patterns(df) or []
+        volume_info = detect_volume_spike(df, features=features) or {}
+        trend_info = detect_adaptive_trend(df, features=features) or {}
+        indicator_score, trend_direction = evaluate_indicators(df, features=features) or (0.0, "Neutral ⚪")
+        combined_action = determine_action(patterns, trend_info, indicator_score)
+
+        # === Lockerung: Trend-Only fallback, falls keine Patterns vorhanden ===
+        if combined_action == "Neutral ⚪" and trend_direction in ["Long 📈", "Short 📉"] and indicator_score >= 65:
+            combined_action = trend_direction
+            logger.info(f"⚠️ [AnalysisEngine] {symbol} upgraded via Trend Fallback → {combined_action}")
+
+        risk_reward_info = (
+            analyze_risk_reward(df, combined_action)
+            if combined_action in ("Long 📈", "Short 📉")
+            else None
+        )
+
+        base_confidence = calculate_confidence(patterns)
+
+        # === FINAL: Optimierte Confidence mit allen Kontextdaten ===
+        adjusted_confidence = optimize_confidence(
+            {
+                "confidence": base_confidence,
+                "trend_info": trend_info,
+                "volume_info": volume_info,
+                "patterns": patterns
+            },
+            {
+                "signals_total": 100,
+                "strong_signals": 40
+            }
+        )
+
+        # === Bonuspunkte für starke Trends, RSI, Pattern-Menge ===
+        if combined_action in ["Long 📈", "Short 📉"]:
+            adjusted_confidence += 10
+        if indicator_score >= 70:
+            adjusted_confidence += 5
+        if len(patterns) >= 2:
+            adjusted_confidence += 3
+
+        adjusted_confidence = min(adjusted_confidence, 100.0)
+
+        signal_score = rate_signal(patterns, volatility_info=volume_info, trend_info=trend_info)
+        signal_category = categorize_signal(adjusted_confidence)
+
+        # === Neue, gelockerte Schwelle: 40 statt 50 ===
+        if adjusted_confidence < 40:
+            logger.info(f"⛔ [AnalysisEngine] {symbol} skipped – Confidence: {adjusted_confidence:.1f}%")
+            return None
+
+        result = {
+            "symbol": symbol,
+            "last_price": round(last_price, 2),
+            "patterns": patterns,
+            "avg_confidence": adjusted_confidence,
+            "combined_action": combined_action,
+            "signal_category": signal_category,
+            "signal_score": signal_score,
+            "indicator_score": indicator_score,
+            "trend_direction": trend_direction,
+            "volume_info": volume_info,
+            "trend_info": trend_info,
+            "risk_reward_info": risk_reward_info,
+            "bar_ts": int(candles.t[-1])  # Startzeit der Signal-Kerze; kein DataFrame im Ergebnis (Pickle aus dem Pool)
+        }
+
+        logger.info(
+            f"✅ [AnalysisEngine] {symbol} | {combined_action} | "
+            f"${last_price:.2f} | Confidence: {adjusted_confidence:.1f}% | "
+            f"Score: {signal_score}/100 | Trend: {trend_direction}"
+        )
+        return result
+
+    except Exception as e:
+        logger.exception(f"❌ [AnalysisEngine] Critical error for {symbol}: {e}")
+        return None
+
+
+def determine_action(patterns: list, trend_info: dict, indicator_score: float) -> str:
+    bullish = any(p.get("action", "").startswith("Long") for p in patterns)
+    bearish = any(p.get("action", "").startswith("Short") for p in patterns)
+    if bullish:
+        return "Long 📈"
+    elif bearish:
+        return "Short 📉"
+    return "Neutral ⚪"
+
+
+def calculate_confidence(patterns: list) -> float:
+    if not patterns:
+        return 0.0
+    total = sum(p.get("confidence", 60) for p in patterns)
+    return round(total / len(patterns), 2)
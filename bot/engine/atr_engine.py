@@ -9,6 +9,7 @@ Made in Bali. Engineered with German Precision.
 import pandas as pd
 import numpy as np
 import logging
+from bot.engine.feature_frame import FeatureFrame, ATR_PERIOD
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
@@ -35,29 +36,33 @@ class ATREngine:
         }
         return messages.get(key, {}).get(self.language, "Unknown error")
 
-    def calculate_atr_percent(self, df: pd.DataFrame) -> float:
+    def calculate_atr_percent(self, df: pd.DataFrame, features: FeatureFrame = None) -> float:
         """
         Calculates the Average True Range (ATR) as a percentage of the last close.
 
+        Uses the shared feature frame's true range when it is passed in.
+
         Returns:
             float: ATR% rounded to 2 decimals.
         """
-        if df is None or df.empty or len(df) < self.period:
-            raise ValueError(self._localized_error("invalid_df"))
+        if features is None:
+            if df is None or df.empty or len(df) < self.period:
+                raise ValueError(self._localized_error("invalid_df"))
 
-        required_cols = {"high", "low", "close"}
-        if not required_cols.issubset(df.columns):
+            required_cols = {"high", "low", "close"}
+            if not required_cols.issubset(df.columns):
+                raise ValueError(self._localized_error("invalid_df"))
+
+            features = FeatureFrame(df["close"], df["high"], df["low"])
+        elif len(features) < self.period:
             raise ValueError(self._localized_error("invalid_df"))
 
         try:
-            df = df.copy()  # Prevent mutation
-            df["hl"] = df["high"] - df["low"]
-            df["hc"] = (df["high"] - df["close"].shift()).abs()
-            df["lc"] = (df["low"] - df["close"].shift()).abs()
-            df["tr"] = df[["hl", "hc", "lc"]].max(axis=1)
-
-            atr = df["tr"].rolling(window=self.period, min_periods=1).mean().iloc[-1]
-            close = df["close"].iloc[-1]
+            if self.period == ATR_PERIOD:
+                atr = features.last.atr
+            else:
+                atr = pd.Series(features.true_range).rolling(window=self.period, min_periods=1).mean().iloc[-1]
+            close = features.close[-1]
 
             if close <= 0:
                 raise ValueError(self._localized_error("zero_close"))
@@ -68,7 +73,7 @@ class ATREngine:
             logger.error(f"[ATREngine ATR Calculation Error] {e}")
             raise
 
-    def detect_volatility_spike(self, df: pd.DataFrame, threshold: float = 1.8) -> dict | None:
+    def detect_volatility_spike(self, df: pd.DataFrame, threshold: float = 1.8, features: FeatureFrame = None) -> dict | None:
         """
         Detects if current price move exceeds ATR-based expectation.
 
@@ -76,10 +81,13 @@ class ATREngine:
             dict: Details if spike detected, else None.
         """
         try:
-            atr_pct = self.calculate_atr_percent(df)
-            last_high = df["high"].iloc[-1]
-            last_low = df["low"].iloc[-1]
-            last_close = df["close"].iloc[-1]
+            atr_pct = self.calculate_atr_percent(df, features=features)
+            if features is not None:
+                last_high, last_low, last_close = features.high[-1], features.low[-1], features.close[-1]
+            else:
+                last_high = df["high"].iloc[-1]
+                last_low = df["low"].iloc[-1]
+                last_close = df["close"].iloc[-1]
 
             move_range = last_high - last_low
             if last_close <= 0 or move_range <= 0:
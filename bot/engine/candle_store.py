@@ -0,0 +1,165 @@
+"""
+A.R.K. Candle Store – Persistent Columnar History 1.0
+Append-only OHLCV-Spalten pro Symbol/Resolution als Binärdateien auf Disk.
+Zero-Copy-Laden via NumPy memmap – Warmstart nach jedem Restart, Datenquelle für Backtests.
+
+Made in Bali. Engineered with German Precision.
+"""
+
+import os
+import time
+import numpy as np
+from bot.config.settings import get_settings
+from bot.engine.candles import Candles
+from bot.utils.logger import setup_logger
+
+# === Setup ===
+logger = setup_logger(__name__)
+config = get_settings()
+
+STORE_DIR = config.get("CANDLE_STORE_DIR", "data/candles")
+STORE_ENABLED = config.get("CANDLE_STORE_ENABLED", True)
+
+# === Column Layout ===
+COLUMNS = {
+    "t": np.int64,    # Bar-Startzeit in Epoch-Sekunden
+    "o": np.float64,
+    "h": np.float64,
+    "l": np.float64,
+    "c": np.float64,
+    "v": np.float64,
+}
+
+class CandleStore:
+    """
+    Persists closed candles as one append-only binary file per column.
+
+    Layout: <root>/<SYMBOL>_<resolution>/<column>.bin
+
+    Before a series is first read or extended, every column file is cut to
+    the row count all columns hold completely, so a torn append never
+    leaves the columns misaligned.
+    """
+
+    def __init__(self, root: str = STORE_DIR):
+        self.root = root
+        self._last_ts = {}    # (symbol, resolution) → letzter persistierter Bar-Zeitstempel
+        self._checked = set() # (symbol, resolution) mit geprüften, gleich langen Spalten
+
+    def _path(self, symbol: str, resolution: str, column: str) -> str:
+        return os.path.join(self.root, f"{symbol}_{resolution}", f"{column}.bin")
+
+    def _repair(self, symbol: str, resolution: str) -> int:
+        """
+        Truncates all column files to the common number of complete rows.
+
+        Returns:
+            int: Valid row count (0 if any column is missing).
+        """
+        key = (symbol, resolution)
+        paths = {column: self._path(symbol, resolution, column) for column in COLUMNS}
+        sizes = {column: os.path.getsize(path) if os.path.exists(path) else 0 for column, path in paths.items()}
+        rows = min(sizes[column] // np.dtype(dtype).itemsize for column, dtype in COLUMNS.items())
+
+        for column, dtype in COLUMNS.items():
+            valid = rows * np.dtype(dtype).itemsize
+            if sizes[column] > valid:
+                os.truncate(paths[column], valid)
+                logger.warning(
+                    f"🩹 [CandleStore] {symbol} ({resolution}m) {column}.bin: "
+                    f"{sizes[column] - valid} byte(s) of a torn append removed"
+                )
+        self._checked.add(key)
+        self._last_ts.pop(key, None)
+        return rows
+
+    def load(self, symbol: str, resolution: str, bars: int = None) -> Candles | None:
+        """
+        Maps stored columns read-only into memory without copying.
+
+        Args:
+            symbol (str): Ticker symbol.
+            resolution (str): Resolution in minutes.
+            bars (int, optional): Only return the most recent N bars.
+
+        Returns:
+            Candles | None: Memmap-backed candles, or None if nothing (valid) is stored.
+        """
+        key = (symbol, resolution)
+        try:
+            if key not in self._checked and os.path.isdir(os.path.dirname(self._path(symbol, resolution, "t"))):
+                self._repair(symbol, resolution)
+
+            arrays = {}
+            for column, dtype in COLUMNS.items():
+                path = self._path(symbol, resolution, column)
+                if not os.path.exists(path) or os.path.getsize(path) < np.dtype(dtype).itemsize:
+                    return None
+                arrays[column] = np.memmap(path, dtype=dtype, mode="r")
+
+            rows = min(len(a) for a in arrays.values())
+            start = max(rows - bars, 0) if bars else 0
+            return Candles(*(arrays[column][start:rows] for column in COLUMNS))
+
+        except (OSError, ValueError) as e:
+            # Korrupter Store gilt als nicht vorhanden; beim nächsten Zugriff wird erneut repariert
+            logger.error(f"❌ [CandleStore] {symbol} ({resolution}m) unreadable, treated as empty: {e}")
+            self._checked.discard(key)
+            return None
+
+    def last_timestamp(self, symbol: str, resolution: str) -> int | None:
+        """Returns the epoch second of the newest persisted bar."""
+        key = (symbol, resolution)
+        if key not in self._last_ts:
+            stored = self.load(symbol, resolution, bars=1)
+            self._last_ts[key] = stored.last_timestamp if stored is not None else None
+        return self._last_ts[key]
+
+    def append(self, symbol: str, resolution: str, candles: Candles, now: float = None) -> int:
+        """
+        Appends all closed bars newer than the last persisted one.
+
+        The still-forming bar is never written, so files stay append-only.
+
+        Returns:
+            int: Number of bars written.
+        """
+        if candles is None or candles.empty:
+            return 0
+
+        now = now if now is not None else time.time()
+        width = int(resolution) * 60
+        ts = candles.t
+        last = self.last_timestamp(symbol, resolution)
+
+        mask = ts + width <= now
+        if last is not None:
+            mask &= ts > last
+        if not mask.any():
+            return 0
+
+        os.makedirs(os.path.dirname(self._path(symbol, resolution, "t")), exist_ok=True)
+        if (symbol, resolution) not in self._checked:
+            self._repair(symbol, resolution)
+            last = self.last_timestamp(symbol, resolution)
+            if last is not None:
+                mask &= ts > last
+                if not mask.any():
+                    return 0
+
+        try:
+            for column, dtype in COLUMNS.items():
+                with open(self._path(symbol, resolution, column), "ab") as f:
+                    f.write(np.ascontiguousarray(candles[column][mask], dtype=dtype).tobytes())
+        except OSError:
+            # Teilweise geschriebene Zeilen sofort wieder entfernen
+            self._repair(symbol, resolution)
+            raise
+
+        self._last_ts[(symbol, resolution)] = int(ts[mask][-1])
+        written = int(mask.sum())
+        logger.debug(f"💾 [CandleStore] {symbol} ({resolution}m) +{written} bar(s) persisted")
+        return written
+
+# === Singleton Export ===
+candle_store = CandleStore()
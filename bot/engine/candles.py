@@ -0,0 +1,117 @@
+"""
+A.R.K. Candles – Compact OHLCV Container 1.0
+Zusammenhängende float64/int64-Arrays mit __slots__ statt DataFrame pro Abruf.
+Zero-Copy-Spaltenansichten, Slicing ohne Kopie und optionales .to_pandas() für Legacy-Aufrufer.
+
+Made in Bali. Engineered with German Precision.
+"""
+
+import numpy as np
+import pandas as pd
+
+PRICE_COLUMNS = ("o", "h", "l", "c", "v")
+
+class Candles:
+    """
+    Immutable OHLCV series backed by contiguous NumPy arrays.
+
+    Attributes:
+        t (np.ndarray): Bar start times in epoch seconds (int64).
+        o, h, l, c, v (np.ndarray): Open, high, low, close, volume (float64).
+    """
+
+    __slots__ = ("t", "o", "h", "l", "c", "v")
+
+    def __init__(self, t, o, h, l, c, v):
+        self.t = _frozen(t, np.int64)
+        self.o = _frozen(o, np.float64)
+        self.h = _frozen(h, np.float64)
+        self.l = _frozen(l, np.float64)
+        self.c = _frozen(c, np.float64)
+        self.v = _frozen(v, np.float64)
+
+    # === Constructors ===
+    @classmethod
+    def blank(cls) -> "Candles":
+        return cls(*([np.empty(0)] * 6))
+
+    @classmethod
+    def from_finnhub(cls, data: dict) -> "Candles":
+        """Builds candles straight from a Finnhub /stock/candle JSON payload."""
+        return cls(data["t"], data["o"], data["h"], data["l"], data["c"], data["v"])
+
+    @classmethod
+    def from_pandas(cls, df: pd.DataFrame) -> "Candles":
+        """Builds candles from an OHLCV DataFrame indexed by bar time."""
+        if df is None or df.empty:
+            return cls.blank()
+        return cls(df.index.asi8 // 10**9, *(df[column].to_numpy() for column in PRICE_COLUMNS))
+
+    # === Access ===
+    def __len__(self) -> int:
+        return len(self.t)
+
+    def __getitem__(self, key):
+        """
+        Column name → zero-copy array view; slice → zero-copy Candles view.
+        """
+        if isinstance(key, str):
+            return getattr(self, key)
+        if isinstance(key, slice):
+            return Candles(self.t[key], self.o[key], self.h[key], self.l[key], self.c[key], self.v[key])
+        raise TypeError(f"Candles indices must be column names or slices, not {type(key).__name__}")
+
+    def __getstate__(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state):
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
+    def __repr__(self) -> str:
+        last = f", last={int(self.t[-1])}" if len(self) else ""
+        return f"Candles(bars={len(self)}{last})"
+
+    @property
+    def empty(self) -> bool:
+        return len(self.t) == 0
+
+    @property
+    def last_timestamp(self) -> int | None:
+        return int(self.t[-1]) if len(self.t) else None
+
+    def tail(self, n: int) -> "Candles":
+        return self[-n:] if n else Candles.blank()
+
+    def since(self, timestamp: int) -> "Candles":
+        """Returns the view of all bars at or after the given epoch second."""
+        return self[int(np.searchsorted(self.t, timestamp, side="left")):]
+
+    def until(self, timestamp: int) -> "Candles":
+        """Returns the view of all bars strictly before the given epoch second."""
+        return self[:int(np.searchsorted(self.t, timestamp, side="left"))]
+
+    @staticmethod
+    def concat(parts: list) -> "Candles":
+        parts = [p for p in parts if len(p)]
+        if not parts:
+            return Candles.blank()
+        if len(parts) == 1:
+            return parts[0]
+        return Candles(*(np.concatenate([getattr(p, name) for p in parts]) for name in Candles.__slots__))
+
+    # === Legacy Bridge ===
+    def to_pandas(self) -> pd.DataFrame:
+        """Returns an OHLCV DataFrame indexed by naive UTC bar time."""
+        df = pd.DataFrame(
+            {column: getattr(self, column) for column in PRICE_COLUMNS},
+            index=pd.to_datetime(self.t, unit="s")
+        )
+        df.index.name = "t"
+        return df
+
+def _frozen(values, dtype) -> np.ndarray:
+    array = np.ascontiguousarray(values, dtype=dtype)
+    if array.flags.writeable and array.base is None:
+        array.flags.writeable = False
+    return array
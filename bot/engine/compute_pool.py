@@ -0,0 +1,114 @@
+"""
+A.R.K. Compute Pool – Off-Loop Analysis Workers 1.0
+Führt die reine Rechenstufe (Patterns, Indikatoren, Trend, Volumen, RRR, Confidence) wahlweise
+inline oder in vorgewärmten Worker-Prozessen aus – Telegram-Polling bleibt reaktionsfähig.
+
+Made in Bali. Engineered with German Precision.
+"""
+
+import asyncio
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from bot.config.settings import get_settings
+from bot.utils.logger import setup_logger
+
+# === Setup ===
+logger = setup_logger(__name__)
+config = get_settings()
+
+EXECUTION_MODE = config.get("ANALYSIS_EXECUTION", "inline")  # inline | process
+POOL_SIZE = config.get("COMPUTE_POOL_SIZE", 2)
+
+def _init_worker() -> None:
+    """Imports the compute stage once per worker so the first task pays no import cost."""
+    import bot.engine.analysis_core  # noqa: F401
+
+def _warmup() -> int:
+    time.sleep(0.1)  # hält den Worker kurz belegt, damit jeder Warmup einen eigenen Prozess startet
+    return os.getpid()
+
+class ComputePool:
+    """
+    Runs pure compute functions inline or on a process pool.
+
+    Payloads are compact NumPy-backed Candles; fetching and dispatch stay on
+    the event loop. A broken pool is rebuilt and the call is served inline.
+    """
+
+    def __init__(self, mode: str = EXECUTION_MODE, size: int = POOL_SIZE):
+        self.mode = mode
+        self.size = max(1, size)
+        self._executor = None
+        self.tasks = 0
+        self.failures = 0
+        self.busy_sec = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode == "process"
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # spawn: Worker erben keine Threads/Sockets des Hauptprozesses
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.size,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker
+            )
+        return self._executor
+
+    async def warm_up(self) -> None:
+        """Starts all workers up front so the first scan does not pay the spawn cost."""
+        if not self.enabled:
+            return
+        loop = asyncio.get_running_loop()
+        started = time.monotonic()
+        executor = self._get_executor()
+        pids = await asyncio.gather(*(loop.run_in_executor(executor, _warmup) for _ in range(self.size)))
+        logger.info(
+            f"🧠 [ComputePool] {len(set(pids))} worker(s) ready in {time.monotonic() - started:.2f}s"
+        )
+
+    async def run(self, fn, *args):
+        """
+        Executes fn(*args) according to the execution mode.
+
+        Args:
+            fn (Callable): Module-level, picklable pure function.
+        """
+        if not self.enabled:
+            return fn(*args)
+
+        loop = asyncio.get_running_loop()
+        started = time.monotonic()
+        try:
+            return await loop.run_in_executor(self._get_executor(), fn, *args)
+        except BrokenProcessPool as e:
+            self.failures += 1
+            logger.error(f"❌ [ComputePool] Worker pool broken ({e}) – rebuilding, running inline.")
+            self.shutdown()
+            return fn(*args)
+        finally:
+            self.tasks += 1
+            self.busy_sec += time.monotonic() - started
+
+    def shutdown(self) -> None:
+        """Stops all workers; queued tasks are cancelled."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def get_stats(self) -> dict:
+        return {
+            "mode": self.mode,
+            "workers": self.size if self.enabled else 0,
+            "tasks": self.tasks,
+            "failures": self.failures,
+            "avg_task_sec": round(self.busy_sec / self.tasks, 3) if self.tasks else 0.0
+        }
+
+# === Singleton Export ===
+compute_pool = ComputePool()
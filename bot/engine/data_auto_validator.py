@@ -4,13 +4,18 @@ Sichert Datenintegrität vor Analyse. Verhindert fehlerhafte Berechnungen.
 Made in Bali. Engineered with German Precision.
 """
 
+import numpy as np
 import pandas as pd
+from bot.engine.candles import Candles
 from bot.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
-def validate_market_data(df: pd.DataFrame) -> bool:
+def validate_market_data(df: pd.DataFrame | Candles) -> bool:
     try:
+        if isinstance(df, Candles):
+            return _validate_candles(df)
+
         if df is None or df.empty:
             logger.warning("❌ [Validator] DataFrame is None or empty.")
             return False
@@ -33,3 +38,20 @@ def validate_market_data(df: pd.DataFrame) -> bool:
     except Exception as e:
         logger.error(f"❌ [Validator] Error validating market data: {e}")
         return False
+
+
+def _validate_candles(candles: Candles) -> bool:
+    """Same checks as for DataFrames, directly on the NumPy columns."""
+    if candles.empty:
+        logger.warning("❌ [Validator] Candles are empty.")
+        return False
+
+    if np.ptp(candles.c) == 0:
+        logger.warning("⚠️ [Validator] Price data shows no variation.")
+        return False
+
+    if any(np.isnan(candles[column]).any() for column in ("o", "h", "l", "c", "v")):
+        logger.warning("⚠️ [Validator] Null values detected in candles.")
+        return False
+
+    return True
@@ -5,90 +5,348 @@ Validierung ausgelagert an data_auto_validator.py.
 Made in Bali. Engineered with German Precision.
 """
 
-import pandas as pd
-import aiohttp
-import yfinance as yf
+import asyncio
+import time
+from bot.engine.candles import Candles
 from bot.config.settings import get_settings
 from bot.utils.language import get_language
 from bot.utils.i18n import get_text
 from bot.utils.logger import setup_logger
 from bot.utils.api_bridge import record_call
+from bot.utils.http_client import get_http_session
+from bot.utils.rate_limiter import finnhub_limiter, PRIORITY_SCAN
+from bot.utils.circuit_breaker import finnhub_breaker, CircuitOpenError
+from bot.engine.candle_store import candle_store, STORE_ENABLED
+from bot.engine.resampler import resample_ohlcv
+from bot.engine.yahoo_fallback import yahoo_batcher
 
 # === Setup ===
 logger = setup_logger(__name__)
 config = get_settings()
 FINNHUB_TOKEN = config.get("FINNHUB_API_KEY")
+CACHE_GRACE_SEC = 2  # Finnhub braucht nach Kerzenschluss einen Moment
+MAX_BARS = 300       # Rollierendes Fenster für analyze_symbol
+BASE_RESOLUTION = "5"  # Feinste geladene Auflösung – höhere Timeframes werden abgeleitet
+FALLBACK_MAX_AGE_BARS = 2  # Gehaltene Daten nur als Fallback, wenn die letzte Kerze höchstens so viele Bars alt ist
+
+# === Candle Cache (TTL bis Kerzenschluss + Single-Flight) ===
+class CandleCache:
+    """
+    In-process cache for candle series keyed by (symbol, resolution).
+
+    Entries expire when the current candle of their resolution closes.
+    Concurrent callers for the same key share one in-flight request.
+    Candles are read-only, so hits are served without copying.
+    """
+
+    def __init__(self):
+        self._entries = {}   # (symbol, resolution) → (expires_at, candles)
+        self._inflight = {}  # (symbol, resolution) → asyncio.Task
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    @staticmethod
+    def next_candle_close(resolution: str, now: float = None) -> float:
+        """
+        Returns the epoch second at which the current candle closes.
+
+        Args:
+            resolution (str): Finnhub resolution in minutes (e.g. "5").
+            now (float, optional): Reference epoch time.
+
+        Returns:
+            float: Candle close timestamp plus grace period.
+        """
+        now = now if now is not None else time.time()
+        width = int(resolution) * 60
+        return (now // width + 1) * width + CACHE_GRACE_SEC
+
+    async def get_or_fetch(self, symbol: str, resolution: str, fetcher) -> Candles:
+        """
+        Returns cached candles or awaits a single shared fetch for the key.
+
+        Args:
+            symbol (str): Ticker symbol.
+            resolution (str): Finnhub resolution in minutes.
+            fetcher (Callable): Coroutine factory performing the real download.
+
+        Returns:
+            Candles: Shared read-only candle series.
+        """
+        key = (symbol, resolution)
+        entry = self._entries.get(key)
+        if entry and entry[0] > time.time():
+            self.hits += 1
+            return entry[1]
+
+        task = self._inflight.get(key)
+        if task:
+            self.coalesced += 1
+            logger.debug(f"🔗 [CandleCache] Coalesced request → {symbol} ({resolution}m)")
+        else:
+            self.misses += 1
+            task = asyncio.ensure_future(fetcher())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._on_done(key, t))
+
+        # shield: ein abgebrochener Aufrufer bricht den geteilten Fetch nicht ab
+        return await asyncio.shield(task)
+
+    def _on_done(self, key: tuple, task: asyncio.Task) -> None:
+        self._inflight.pop(key, None)
+        if task.cancelled() or task.exception() is not None:
+            return
+        self._entries[key] = (self.next_candle_close(key[1]), task.result())
+
+    def peek(self, symbol: str, resolution: str) -> Candles | None:
+        """Returns the last held candles for the key, even if they have expired."""
+        entry = self._entries.get((symbol, resolution))
+        return entry[1] if entry else None
+
+    def invalidate(self, symbol: str = None) -> None:
+        """Drops cached entries for one symbol or for all symbols."""
+        if symbol is None:
+            self._entries.clear()
+        else:
+            for key in [k for k in self._entries if k[0] == symbol]:
+                del self._entries[key]
+
+    def get_stats(self) -> dict:
+        """Returns hit, miss and coalesce counters."""
+        lookups = self.hits + self.misses + self.coalesced
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "entries": len(self._entries),
+            "hit_rate": round((self.hits + self.coalesced) / lookups * 100, 1) if lookups else 0.0
+        }
+
+# === Singleton Export ===
+candle_cache = CandleCache()
+
+def get_cache_stats() -> dict:
+    """Externer Shortcut für candle_cache.get_stats()."""
+    return candle_cache.get_stats()
 
 # === Finnhub API Call ===
-async def fetch_from_finnhub(symbol: str, resolution: str) -> pd.DataFrame:
-    url = f"https://finnhub.io/api/v1/stock/candle?symbol={symbol}&resolution={resolution}&count=300&token={FINNHUB_TOKEN}"
+async def fetch_from_finnhub(symbol: str, resolution: str, since: int = None, priority: int = PRIORITY_SCAN) -> Candles:
+    """
+    Downloads candles from Finnhub.
+
+    Args:
+        symbol (str): Ticker symbol.
+        resolution (str): Resolution in minutes.
+        since (int, optional): Epoch second of the first bar wanted. Without it
+            the last MAX_BARS candles are requested.
+        priority (int): Rate limiter lane for this call.
 
-    async with aiohttp.ClientSession() as session:
-        async with session.get(url, timeout=10) as response:
+    Returns:
+        Candles: OHLCV series (may be empty for since-requests).
+    """
+    if since is None:
+        window = f"count={MAX_BARS}"
+    else:
+        window = f"from={since}&to={int(time.time())}"
+    url = f"https://finnhub.io/api/v1/stock/candle?symbol={symbol}&resolution={resolution}&{window}&token={FINNHUB_TOKEN}"
+
+    if not finnhub_breaker.allow_request():
+        raise CircuitOpenError(f"Finnhub circuit open – {symbol} ({resolution}m)")
+
+    # Nur Transport-/HTTP-Fehler zählen gegen die Quelle, nicht fehlende Daten einzelner Symbole
+    async with finnhub_breaker.call(finnhub_limiter, "candles", priority) as call:
+        session = get_http_session()
+        async with session.get(url) as response:
             if response.status != 200:
                 raise ConnectionError(f"Finnhub HTTP {response.status} – {symbol} ({resolution}m)")
+            data = await response.json()
+            call.ok()
+
+    if since is not None and data.get("s") == "no_data":
+        record_call(symbol)
+        return Candles.blank()
+
+    if data.get("s") != "ok" or not all(k in data for k in ["o", "h", "l", "c", "v", "t"]):
+        raise ValueError(f"Finnhub response malformed for {symbol} ({resolution}m)")
+
+    candles = Candles.from_finnhub(data)
+
+    logger.info(
+        f"✅ [Finnhub] {symbol} | {resolution}m | Rows: {len(candles)} | "
+        f"Recent: {candles.c[-3:].tolist()}"
+    )
+
+    record_call(symbol)
+    return candles
+
+async def fetch_quote(symbol: str, priority: int = PRIORITY_SCAN) -> dict | None:
+    """
+    Fetches the live quote of a symbol via the quote endpoint class.
+
+    Returns:
+        dict | None: Finnhub quote ("c" current, "h"/"l" day range, "pc" previous
+        close, "t" timestamp), or None without a usable price.
+    """
+    url = f"https://finnhub.io/api/v1/quote?symbol={symbol}&token={FINNHUB_TOKEN}"
 
+    if not finnhub_breaker.allow_request():
+        raise CircuitOpenError(f"Finnhub circuit open – {symbol} (quote)")
+
+    async with finnhub_breaker.call(finnhub_limiter, "quote", priority) as call:
+        session = get_http_session()
+        async with session.get(url) as response:
+            if response.status != 200:
+                raise ConnectionError(f"Finnhub HTTP {response.status} – {symbol} (quote)")
             data = await response.json()
-            if data.get("s") != "ok" or not all(k in data for k in ["o", "h", "l", "c", "v", "t"]):
-                raise ValueError(f"Finnhub response malformed for {symbol} ({resolution}m)")
-
-            df = pd.DataFrame({
-                "t": pd.to_datetime(data["t"], unit="s"),
-                "o": data["o"],
-                "h": data["h"],
-                "l": data["l"],
-                "c": data["c"],
-                "v": data["v"]
-            }).set_index("t")
-
-            logger.info(
-                f"✅ [Finnhub] {symbol} | {resolution}m | Rows: {len(df)} | "
-                f"Recent: {df['c'].tail(3).tolist()}"
-            )
-
-            record_call(symbol)
-            return df.astype(float)
+            call.ok()
+
+    record_call(symbol)
+    return data if data and data.get("c") else None
+
+# === Incremental Update ===
+def merge_candles(held: Candles, fresh: Candles) -> Candles:
+    """
+    Merges newly downloaded bars into the held series.
+
+    Bars from the first fresh timestamp onward replace the held ones, so the
+    still-forming last bar is overwritten by its latest state.
+
+    Returns:
+        Candles: Rolling series of at most MAX_BARS bars.
+    """
+    if fresh.empty:
+        return held
+    kept = held.until(int(fresh.t[0])).tail(MAX_BARS - len(fresh))
+    return Candles.concat([kept, fresh]).tail(MAX_BARS)
+
+async def fetch_candles(symbol: str, resolution: str, priority: int = PRIORITY_SCAN) -> Candles:
+    """
+    Fetches only the bars newer than the last one held for (symbol, resolution).
+
+    After a restart the held series is served from the on-disk candle store.
+    Falls back to a full MAX_BARS download when nothing is held yet.
+    """
+    held = candle_cache.peek(symbol, resolution)
+    if (held is None or held.empty) and STORE_ENABLED:
+        held = candle_store.load(symbol, resolution, bars=MAX_BARS)
+        if held is not None:
+            logger.info(f"💾 [DataLoader] {symbol} ({resolution}m) warm start from disk → {len(held)} bar(s)")
+
+    if held is None or held.empty:
+        merged = await fetch_from_finnhub(symbol, resolution, priority=priority)
+    else:
+        since = held.last_timestamp
+        fresh = await fetch_from_finnhub(symbol, resolution, since=since, priority=priority)
+        merged = merge_candles(held, fresh)
+        logger.debug(f"🧩 [DataLoader] {symbol} ({resolution}m) incremental → +{len(fresh)} bar(s), {len(merged)} held")
+
+    if STORE_ENABLED:
+        try:
+            candle_store.append(symbol, resolution, merged)
+        except Exception as e:
+            logger.warning(f"⚠️ [DataLoader] Candle store write failed for {symbol}: {e}")
+
+    return merged
+
+def _held_frame(symbol: str, resolution: str) -> Candles | None:
+    """Returns the last known candles from memory, else from the candle store."""
+    held = candle_cache.peek(symbol, resolution)
+    if held is None and STORE_ENABLED:
+        held = candle_store.load(symbol, resolution, bars=MAX_BARS)
+    return held
+
+# === Fallback Sources ===
+def derive_fallback_frame(symbol: str, now: float = None) -> Candles | None:
+    """
+    Builds the 15m fallback locally from held 5m data – no second Finnhub call.
+
+    Held data whose last bar closed more than FALLBACK_MAX_AGE_BARS base bars
+    ago (e.g. a disk warm start after a long restart) is not used.
+    """
+    try:
+        held = _held_frame(symbol, BASE_RESOLUTION)
+        if held is not None and not held.empty:
+            width = int(BASE_RESOLUTION) * 60
+            age = (now if now is not None else time.time()) - (held.last_timestamp + width)
+            if age > FALLBACK_MAX_AGE_BARS * width:
+                logger.info(f"ℹ️ [DataLoader] Held 5m data for {symbol} is {age / 60:.0f} min old – skipping 15m fallback.")
+                return None
+            logger.info(f"⏳ [DataLoader] Deriving {symbol} 15m fallback from held 5m data...")
+            return resample_ohlcv(held, 15)
+        logger.info(f"ℹ️ [DataLoader] No held 5m data for {symbol} – skipping 15m fallback.")
+    except Exception as e:
+        logger.warning(f"⚠️ [DataLoader] 15m resample failed → {symbol}: {e}")
+    return None
+
+async def fetch_from_yahoo(symbol: str) -> Candles:
+    """
+    Downloads 5m candles from Yahoo Finance off the event loop.
+
+    Concurrent fallbacks are coalesced into one batched multi-ticker download.
+    """
+    candles = await yahoo_batcher.fetch(symbol)
+    logger.info(
+        f"✅ [YahooBackup] {symbol} fallback used | Rows: {len(candles)} | "
+        f"Recent: {candles.c[-3:].tolist()}"
+    )
+    return candles
 
 # === Entry Function for Analysis Engine ===
-async def fetch_market_data(symbol: str, chat_id: int = None) -> pd.DataFrame | None:
+async def fetch_market_data(symbol: str, chat_id: int = None, priority: int = PRIORITY_SCAN) -> Candles | None:
     lang = get_language(chat_id) if chat_id else "en"
+    finnhub_open = False
 
-    # 1. Finnhub 5-Minuten
+    # 1. Finnhub 5-Minuten (Cache-Treffer auch bei offenem Breaker)
     try:
         logger.info(f"⏳ [DataLoader] {get_text('fetching_data_primary', lang)} {symbol} (5m)")
-        return await fetch_from_finnhub(symbol, "5")
+        return await candle_cache.get_or_fetch(symbol, BASE_RESOLUTION, lambda: fetch_candles(symbol, BASE_RESOLUTION, priority))
+    except CircuitOpenError as e1:
+        finnhub_open = True
+        logger.info(f"🔴 [DataLoader] {e1} → routing {symbol} straight to Yahoo.")
     except Exception as e1:
         logger.warning(f"⚠️ [DataLoader] Finnhub 5m failed → {symbol}: {e1}")
 
-    # 2. Finnhub 15-Minuten Fallback
-    try:
-        logger.info(f"⏳ [DataLoader] Retrying {symbol} with 15m fallback...")
-        return await fetch_from_finnhub(symbol, "15")
-    except Exception as e2:
-        logger.warning(f"⚠️ [DataLoader] Finnhub 15m failed → {symbol}: {e2}")
+    # 2. 15-Minuten Fallback aus gehaltenen 5m-Daten (nur bei einzelnem Finnhub-Ausfall)
+    if not finnhub_open:
+        candles = derive_fallback_frame(symbol)
+        if candles is not None:
+            return candles
 
-    # 3. Yahoo Finance Backup (letzte Chance)
+    # 3. Yahoo Finance Backup
     try:
         logger.info(f"⏳ [DataLoader] {get_text('fetching_data_backup', lang)} {symbol} (Yahoo Fallback)")
-        ticker = yf.Ticker(symbol)
-        hist = ticker.history(period="5d", interval="5m")
+        return await fetch_from_yahoo(symbol)
+    except Exception as e3:
+        logger.error(
+            f"❌ [DataLoader] {get_text('error_backup_source', lang)} {symbol}: {e3}"
+        )
 
-        hist = hist.rename(columns={
-            "Open": "o", "High": "h", "Low": "l", "Close": "c", "Volume": "v"
-        })
+    # 4. Beide Quellen gestört → gehaltene Daten als letzte Chance
+    return derive_fallback_frame(symbol) if finnhub_open else None
 
-        df = hist[["o", "h", "l", "c", "v"]].copy()
-        df.index.name = "t"
+# === Multi-Timeframe Entry ===
+async def fetch_timeframe(symbol: str, minutes: int, chat_id: int = None, priority: int = PRIORITY_SCAN) -> Candles | None:
+    """
+    Returns candles for any timeframe that is a multiple of the 5m base resolution.
 
-        logger.info(
-            f"✅ [YahooBackup] {symbol} fallback used | Rows: {len(df)} | "
-            f"Recent: {df['c'].tail(3).tolist()}"
-        )
+    Only the 5m frame is fetched; higher timeframes are resampled locally, so one
+    download feeds every timeframe the engines need.
 
-        return df.astype(float)
+    Args:
+        symbol (str): Ticker symbol.
+        minutes (int): Target timeframe (5, 15, 30, 60, ...).
+        chat_id (int, optional): For localized log texts.
+        priority (int): Rate limiter lane for the underlying fetch.
 
-    except Exception as e3:
-        logger.error(
-            f"❌ [DataLoader] {get_text('error_backup_source', lang)} {symbol}: {e3}"
-        )
-        return None
+    Returns:
+        Candles | None: OHLCV series or None if no source delivered data.
+    """
+    base = int(BASE_RESOLUTION)
+    if minutes % base != 0:
+        raise ValueError(f"Timeframe {minutes}m is not a multiple of {base}m")
+
+    candles = await fetch_market_data(symbol, chat_id=chat_id, priority=priority)
+    if candles is None or minutes == base:
+        return candles
+    return resample_ohlcv(candles, minutes)
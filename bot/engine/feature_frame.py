@@ -0,0 +1,341 @@
+"""
+A.R.K. Feature Frame – Shared Indicator Cache 1.1
+Berechnet EMA9/EMA21, RSI14, True Range/ATR und Volumen-Baseline genau einmal pro Symbol und neuer Kerze.
+Alle Engines lesen aus demselben Frame statt eigene ewm/rolling-Läufe zu starten.
+Die jüngsten Werte kommen aus Streaming-State: Kosten pro neuer Kerze statt pro Historienlänge.
+
+Made in Bali. Engineered with German Precision.
+"""
+
+from functools import cached_property
+from typing import NamedTuple
+import numpy as np
+import pandas as pd
+from bot.engine.candles import Candles
+from bot.engine.streaming_indicators import RollingMean, StreamingEMA, StreamingRSI, StreamingATR, StreamingMove
+from bot.utils.logger import setup_logger
+
+# === Setup ===
+logger = setup_logger(__name__)
+
+# === Standard-Perioden der Engines ===
+EMA_FAST = 9
+EMA_SLOW = 21
+RSI_PERIOD = 14
+ATR_PERIOD = 14
+VOLUME_WINDOW = 30
+
+class IndicatorSnapshot(NamedTuple):
+    """Indicator values of the latest bar."""
+    ema_fast: float
+    ema_slow: float
+    rsi: float
+    atr: float
+    pct_move: float
+    avg_pct_move: float
+    volume_baseline: float
+
+class FeatureFrame:
+    """
+    Lazily computed, memoized indicator arrays for one OHLCV series.
+
+    Every indicator is calculated on first access and then reused by all
+    engines working on the same bar. Arrays have the length of the series;
+    `last` holds the latest bar's values and is filled from streaming state
+    when the frame comes from the FeatureCache.
+    """
+
+    def __init__(self, close, high=None, low=None, volume=None, t=None, last: IndicatorSnapshot = None):
+        self.close = np.asarray(close, dtype=np.float64)
+        self.high = None if high is None else np.asarray(high, dtype=np.float64)
+        self.low = None if low is None else np.asarray(low, dtype=np.float64)
+        self.volume = None if volume is None else np.asarray(volume, dtype=np.float64)
+        self.t = t
+        self.signature = _signature(self.t, self.close, self.volume, self.high, self.low)
+        if last is not None:
+            self.__dict__["last"] = last
+
+    # === Constructors ===
+    @classmethod
+    def from_candles(cls, candles: Candles, last: IndicatorSnapshot = None) -> "FeatureFrame":
+        return cls(candles.c, candles.h, candles.l, candles.v, t=candles.t, last=last)
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> "FeatureFrame":
+        """Builds an uncached frame for legacy callers that only hold a DataFrame."""
+        column = lambda name: df[name].to_numpy(dtype=np.float64) if name in df.columns else None
+        return cls(column("c"), column("h"), column("l"), column("v"))
+
+    def __len__(self) -> int:
+        return len(self.close)
+
+    @cached_property
+    def last(self) -> IndicatorSnapshot:
+        """Latest bar's indicator values (from the full arrays for uncached frames)."""
+        has_range = self.high is not None and self.low is not None
+        return IndicatorSnapshot(
+            ema_fast=self.ema_fast[-1],
+            ema_slow=self.ema_slow[-1],
+            rsi=self.rsi[-1],
+            atr=self.atr[-1] if has_range else np.nan,
+            pct_move=self.pct_move[-1],
+            avg_pct_move=self.avg_pct_move[-1],
+            volume_baseline=self.volume_baseline[-1] if self.volume is not None else np.nan
+        )
+
+    # === Trend ===
+    @cached_property
+    def ema_fast(self) -> np.ndarray:
+        return _ema(self.close, EMA_FAST)
+
+    @cached_property
+    def ema_slow(self) -> np.ndarray:
+        return _ema(self.close, EMA_SLOW)
+
+    # === Momentum ===
+    @cached_property
+    def rsi(self) -> np.ndarray:
+        """Rolling-mean RSI over RSI_PERIOD bars (NaN until the window is full)."""
+        delta = np.diff(self.close, prepend=np.nan)
+        avg_gain = _rolling_mean(np.maximum(delta, 0), RSI_PERIOD)
+        avg_loss = _rolling_mean(np.abs(np.minimum(delta, 0)), RSI_PERIOD)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rsi = 100 - (100 / (1 + avg_gain / avg_loss))
+        return np.where(avg_loss == 0, 100.0, rsi)
+
+    # === Volatility ===
+    @cached_property
+    def true_range(self) -> np.ndarray:
+        prev_close = np.roll(self.close, 1)
+        prev_close[0] = np.nan
+        return np.fmax.reduce([
+            self.high - self.low,
+            np.abs(self.high - prev_close),
+            np.abs(self.low - prev_close)
+        ])
+
+    @cached_property
+    def atr(self) -> np.ndarray:
+        return _rolling_mean(self.true_range, ATR_PERIOD, min_periods=1)
+
+    @cached_property
+    def pct_move(self) -> np.ndarray:
+        """Absolute bar-to-bar close change in percent."""
+        move = np.full(len(self.close), np.nan)
+        move[1:] = np.abs(self.close[1:] / self.close[:-1] - 1) * 100
+        return move
+
+    @cached_property
+    def avg_pct_move(self) -> np.ndarray:
+        return _rolling_mean(self.pct_move, ATR_PERIOD, min_periods=1)
+
+    # === Volume ===
+    @cached_property
+    def volume_baseline(self) -> np.ndarray:
+        return _rolling_mean(self.volume, VOLUME_WINDOW, min_periods=VOLUME_WINDOW // 2)
+
+class IndicatorState:
+    """
+    Streaming indicator state of one symbol.
+
+    New bars are pushed and a changed forming bar is revised in O(1); the
+    state only replays the full series when it no longer lines up with it.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        self.ema_fast = StreamingEMA(EMA_FAST)
+        self.ema_slow = StreamingEMA(EMA_SLOW)
+        self.rsi = StreamingRSI(RSI_PERIOD)
+        self.atr = StreamingATR(ATR_PERIOD)
+        self.move = StreamingMove(ATR_PERIOD)
+        self.volume = RollingMean(VOLUME_WINDOW, min_periods=VOLUME_WINDOW // 2)
+        self.last_t = None
+        self.prev_close = None
+
+    # === Updates ===
+    def push(self, t: int, h: float, l: float, c: float, v: float) -> None:
+        """Adds a new bar."""
+        self.prev_close = self.rsi.last_close
+        self.last_t = t
+        self.ema_fast.push(c)
+        self.ema_slow.push(c)
+        self.rsi.push(c)
+        self.atr.push(h, l, c)
+        self.move.push(c)
+        self.volume.push(v)
+
+    def revise(self, h: float, l: float, c: float, v: float) -> None:
+        """Replaces the values of the latest (still forming) bar."""
+        self.ema_fast.revise(c)
+        self.ema_slow.revise(c)
+        self.rsi.revise(c)
+        self.atr.revise(h, l, c)
+        self.move.revise(c)
+        self.volume.revise(v)
+
+    def sync(self, candles: Candles) -> tuple[int, bool]:
+        """
+        Brings the state in line with the series.
+
+        Returns:
+            tuple: (bars processed, whether the state was rebuilt from scratch)
+        """
+        if candles.empty:
+            self.reset()
+            return 0, True
+
+        start = int(np.searchsorted(candles.t, self.last_t)) if self.last_t is not None else 0
+        aligned = (
+            self.last_t is not None
+            and start < len(candles)
+            and candles.t[start] == self.last_t
+            and (candles.c[start - 1] == self.prev_close if start > 0 else self.prev_close is None)
+        )
+
+        if aligned:
+            self.revise(candles.h[start], candles.l[start], candles.c[start], candles.v[start])
+            start += 1
+        else:
+            self.reset()
+            start = 0
+
+        for i in range(start, len(candles)):
+            self.push(int(candles.t[i]), candles.h[i], candles.l[i], candles.c[i], candles.v[i])
+        return len(candles) - start + (1 if aligned else 0), not aligned
+
+    # === Read-out ===
+    def values(self) -> IndicatorSnapshot:
+        return IndicatorSnapshot(
+            ema_fast=self.ema_fast.value,
+            ema_slow=self.ema_slow.value,
+            rsi=self.rsi.value,
+            atr=self.atr.value,
+            pct_move=self.move.move,
+            avg_pct_move=self.move.average,
+            volume_baseline=self.volume.value
+        )
+
+    def peek(self, h: float, l: float, c: float, v: float) -> IndicatorSnapshot:
+        """Values as if the forming bar were revised to the given prices – state stays untouched."""
+        saved = self.snapshot()
+        try:
+            self.revise(h, l, c, v)
+            return self.values()
+        finally:
+            self.restore(saved)
+
+    def snapshot(self) -> tuple:
+        return (
+            self.last_t, self.prev_close,
+            self.ema_fast.snapshot(), self.ema_slow.snapshot(), self.rsi.snapshot(),
+            self.atr.snapshot(), self.move.snapshot(), self.volume.snapshot()
+        )
+
+    def restore(self, state: tuple) -> None:
+        self.last_t, self.prev_close, ema_fast, ema_slow, rsi, atr, move, volume = state
+        self.ema_fast.restore(ema_fast)
+        self.ema_slow.restore(ema_slow)
+        self.rsi.restore(rsi)
+        self.atr.restore(atr)
+        self.move.restore(move)
+        self.volume.restore(volume)
+
+class FeatureCache:
+    """
+    Holds the feature frame and streaming indicator state of each symbol.
+
+    A frame is reused as long as the series it was built from ends in the
+    same bar with the same values; a new or revised bar only advances the
+    symbol's streaming state by the bars that changed.
+    """
+
+    def __init__(self):
+        self._frames = {}  # symbol → FeatureFrame
+        self._states = {}  # symbol → IndicatorState
+        self.hits = 0
+        self.misses = 0
+        self.bars_streamed = 0
+        self.rebuilds = 0
+
+    def get(self, symbol: str, candles: Candles) -> FeatureFrame:
+        """
+        Returns the shared feature frame for the symbol's current series.
+
+        Args:
+            symbol (str): Ticker symbol.
+            candles (Candles): Series the engines are analysing.
+        """
+        frame = self._frames.get(symbol)
+        if frame is not None and frame.signature == _signature(candles.t, candles.c, candles.v, candles.h, candles.l):
+            self.hits += 1
+            return frame
+
+        self.misses += 1
+        state = self._states.setdefault(symbol, IndicatorState())
+        processed, rebuilt = state.sync(candles)
+        if rebuilt:
+            self.rebuilds += 1
+        else:
+            self.bars_streamed += processed
+
+        frame = FeatureFrame.from_candles(candles, last=state.values())
+        self._frames[symbol] = frame
+        return frame
+
+    def peek(self, symbol: str) -> FeatureFrame | None:
+        """Returns the symbol's latest frame without building one."""
+        return self._frames.get(symbol)
+
+    def get_state(self, symbol: str) -> IndicatorState | None:
+        """Returns the streaming state of a symbol (e.g. for intrabar peeks)."""
+        return self._states.get(symbol)
+
+    def invalidate(self, symbol: str = None) -> None:
+        """Drops frame and state of one symbol or of all symbols."""
+        if symbol is None:
+            self._frames.clear()
+            self._states.clear()
+        else:
+            self._frames.pop(symbol, None)
+            self._states.pop(symbol, None)
+
+    def get_stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "symbols": len(self._frames),
+            "bars_streamed": self.bars_streamed,
+            "rebuilds": self.rebuilds,
+            "hit_rate": round(self.hits / lookups * 100, 1) if lookups else 0.0
+        }
+
+# === Singleton Export ===
+feature_cache = FeatureCache()
+
+def get_features(symbol: str, candles: Candles) -> FeatureFrame:
+    """Externer Shortcut für feature_cache.get()."""
+    return feature_cache.get(symbol, candles)
+
+# === Helpers ===
+def _signature(t, close, volume, high=None, low=None) -> tuple:
+    """
+    Identifies a series by its length and its complete last bar; a revised
+    high or low (ATR input) with unchanged close and volume is a new series.
+    """
+    if not len(close):
+        return (0,)
+    last_t = int(t[-1]) if t is not None else None
+    last_v = float(volume[-1]) if volume is not None else None
+    last_h = float(high[-1]) if high is not None else None
+    last_l = float(low[-1]) if low is not None else None
+    return (len(close), last_t, float(close[-1]), last_v, last_h, last_l)
+
+def _ema(values: np.ndarray, span: int) -> np.ndarray:
+    return pd.Series(values).ewm(span=span, adjust=False).mean().to_numpy()
+
+def _rolling_mean(values: np.ndarray, window: int, min_periods: int = None) -> np.ndarray:
+    return pd.Series(values).rolling(window=window, min_periods=min_periods or window).mean().to_numpy()
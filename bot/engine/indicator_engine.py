@@ -8,14 +8,18 @@ Made in Bali. Engineered with German Precision.
 
 import pandas as pd
 import numpy as np
+from bot.engine.feature_frame import FeatureFrame
 from bot.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
-def evaluate_indicators(df: pd.DataFrame) -> tuple[float, str]:
+def evaluate_indicators(df: pd.DataFrame, features: FeatureFrame = None) -> tuple[float, str]:
     """
     Evaluates EMA trend, RSI conditions and combined signal score.
 
+    Args:
+        features (FeatureFrame, optional): Shared indicators of the same bar.
+
     Returns:
         tuple: (score: 0–100, trend: str)
     """
@@ -25,13 +29,11 @@ def evaluate_indicators(df: pd.DataFrame) -> tuple[float, str]:
         return 52.0, "Neutral ⚪"
 
     try:
-        close = df["c"]
+        features = features or FeatureFrame.from_frame(df)
 
         # === EMA-Trend-Erkennung ===
-        ema_9 = close.ewm(span=9, adjust=False).mean()
-        ema_21 = close.ewm(span=21, adjust=False).mean()
-        last_ema9 = ema_9.iloc[-1]
-        last_ema21 = ema_21.iloc[-1]
+        last_ema9 = features.last.ema_fast
+        last_ema21 = features.last.ema_slow
 
         trend = (
             "Long 📈" if last_ema9 > last_ema21 else
@@ -39,13 +41,8 @@ def evaluate_indicators(df: pd.DataFrame) -> tuple[float, str]:
             "Neutral ⚪"
         )
 
-        # === RSI-Berechnung ===
-        delta = close.diff()
-        gain = np.maximum(delta, 0)
-        loss = np.abs(np.minimum(delta, 0))
-        avg_gain = pd.Series(gain).rolling(window=14, min_periods=14).mean().iloc[-1]
-        avg_loss = pd.Series(loss).rolling(window=14, min_periods=14).mean().iloc[-1]
-        rsi = 100 if avg_loss == 0 else 100 - (100 / (1 + avg_gain / (avg_loss + 1e-9)))
+        # === RSI ===
+        rsi = features.last.rsi
 
         # === Scoring Logik ===
         score = 50.0
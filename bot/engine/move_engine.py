@@ -13,6 +13,7 @@ import logging
 from telegram import Bot
 from datetime import datetime
 from bot.utils.logger import setup_logger
+from bot.utils.message_queue import message_queue, PRIORITY_ALERT
 
 logger = setup_logger(__name__)
 
@@ -103,11 +104,13 @@ class MoveEngine:
 
             message += f"\n\n_{tone}_\n_🔔 Trade smart. Not first._"
 
-            await bot.send_message(
+            await message_queue.send(
+                bot,
                 chat_id=chat_id,
                 text=message,
                 parse_mode="Markdown",
-                disable_web_page_preview=True
+                disable_web_page_preview=True,
+                priority=PRIORITY_ALERT
             )
 
             logger.info(f"✅ [MoveAlert] ALERT for {symbol}: {move_pct:.2f}% @ {ts}")
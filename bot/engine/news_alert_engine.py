@@ -8,12 +8,14 @@ Designed for: High-Frequency News Trading, Institutional Timing, Telegram Instan
 Made in Bali. Engineered with German Precision.
 """
 
-import aiohttp
 from datetime import datetime
 from bot.config.settings import get_settings
 from bot.utils.logger import setup_logger
 from bot.utils.keyword_enricher import get_all_keywords, get_keyword_power
 from bot.utils.news_health_checker import use_finnhub
+from bot.utils.http_client import get_http_session
+from bot.utils.rate_limiter import finnhub_limiter, PRIORITY_NEWS
+from bot.utils.circuit_breaker import finnhub_breaker
 
 # === Setup ===
 logger = setup_logger(__name__)
@@ -31,11 +33,17 @@ MAX_AGE_MINUTES = 30   # Erweitert für langsame Publisher
 
 # === News Fetchers ===
 async def fetch_finnhub_news() -> list:
+    if not finnhub_breaker.allow_request():
+        logger.info("[News Engine] ⏸️ Finnhub breaker open – skipping news fetch.")
+        return []
+
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(FINNHUB_URL, timeout=10) as response:
+        async with finnhub_breaker.call(finnhub_limiter, "news", PRIORITY_NEWS) as call:
+            session = get_http_session()
+            async with session.get(FINNHUB_URL) as response:
                 if response.status == 200:
                     news = await response.json()
+                    call.ok()
                     logger.info("[News Engine] ✅ Finnhub news fetched.")
                     return news
     except Exception as e:
@@ -44,13 +52,13 @@ async def fetch_finnhub_news() -> list:
 
 async def fetch_yahoo_news(symbol: str) -> str:
     try:
-        async with aiohttp.ClientSession() as session:
-            url = YAHOO_RSS.format(symbol=symbol)
-            async with session.get(url, timeout=10) as response:
-                if response.status == 200:
-                    rss = await response.text()
-                    logger.info(f"[News Engine] ✅ Yahoo RSS fetched for {symbol}")
-                    return rss
+        session = get_http_session()
+        url = YAHOO_RSS.format(symbol=symbol)
+        async with session.get(url) as response:
+            if response.status == 200:
+                rss = await response.text()
+                logger.info(f"[News Engine] ✅ Yahoo RSS fetched for {symbol}")
+                return rss
     except Exception as e:
         logger.warning(f"[News Engine] ⚠️ Yahoo fetch error: {e}")
     return ""
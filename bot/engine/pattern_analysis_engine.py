@@ -6,6 +6,7 @@ Made in Bali. Engineered with German Precision.
 
 import pandas as pd
 import numpy as np
+from bot.engine.feature_frame import FeatureFrame
 from bot.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
@@ -24,67 +25,106 @@ PATTERN_DEFINITIONS = {
     "Strong Bearish Momentum": {"action": "Short 📉", "confidence": 78, "stars": 4},
 }
 
+PATTERN_NAMES = list(PATTERN_DEFINITIONS)
+
+# Reihenfolge, in der detect_patterns Treffer meldet (wie die bisherige if-Kette)
+DETECTION_ORDER = [
+    "Doji", "Bullish Engulfing", "Bearish Engulfing", "Hammer", "Shooting Star",
+    "Morning Star", "Evening Star", "Strong Bullish Momentum", "Strong Bearish Momentum",
+]
+
+MOMENTUM_LOOKBACK = 10
+
+def _shift(values: np.ndarray, n: int) -> np.ndarray:
+    """Shifts along the last (time) axis by n bars, padding with NaN."""
+    shifted = np.full(values.shape, np.nan)
+    shifted[..., n:] = values[..., :-n]
+    return shifted
+
+def pattern_matrix(o, h, l, c) -> np.ndarray:
+    """
+    Evaluates every pattern rule on every bar at once.
+
+    Works on any shape with time on the last axis – a single history
+    (bars) or a panel (symbols × bars). NaN-padded bars never match.
+
+    Returns:
+        np.ndarray: Boolean array of shape (..., bars, len(PATTERN_NAMES)).
+    """
+    o, h, l, c = (np.asarray(x, dtype=np.float64) for x in (o, h, l, c))
+    po, pc = _shift(o, 1), _shift(c, 1)
+    p2o, p2c = _shift(o, 2), _shift(c, 2)
+
+    body = np.abs(c - o)
+    candle_range = h - l
+    # Wie bisher: ohne zwei Vorkerzen, Body oder Range gibt es auf dieser Kerze kein Pattern
+    valid = ~np.isnan(p2c) & (body != 0) & (candle_range != 0)
+    bull, bear = c > o, o > c
+
+    ref = _shift(c, MOMENTUM_LOOKBACK)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        change_pct = (c - ref) / ref * 100
+
+    rules = {
+        "Doji": body < 0.1 * candle_range,
+        "Bullish Engulfing": bull & (pc < po) & (o < pc) & (c > po),
+        "Bearish Engulfing": bear & (po < pc) & (c < po) & (o > pc),
+        "Hammer": bull & (l < o - body * 0.5),
+        "Shooting Star": bear & (h > o + body * 0.5),
+        "Morning Star": (p2c < p2o) & (pc > po) & bull & (c > p2o),
+        "Evening Star": (p2c > p2o) & (pc < po) & bear & (c < p2o),
+        "Strong Bullish Momentum": change_pct >= 2.0,
+        "Strong Bearish Momentum": change_pct <= -2.0,
+    }
+
+    matches = np.zeros(c.shape + (len(PATTERN_NAMES),), dtype=bool)
+    for name, hit in rules.items():
+        matches[..., PATTERN_NAMES.index(name)] = valid & hit
+    return matches
+
+def qualified_mask(min_confidence: int = 55) -> np.ndarray:
+    """Boolean mask over PATTERN_NAMES of patterns meeting the confidence floor."""
+    return np.array([PATTERN_DEFINITIONS[name]["confidence"] >= min_confidence for name in PATTERN_NAMES])
+
+def detect_pattern_history(df: pd.DataFrame, min_confidence: int = 0) -> pd.DataFrame:
+    """
+    Pattern matches for every bar of a history – for backtests and statistics.
+
+    Returns:
+        pd.DataFrame: Boolean frame (bars × pattern names) on the input index.
+    """
+    matches = pattern_matrix(df["o"], df["h"], df["l"], df["c"]) & qualified_mask(min_confidence)
+    return pd.DataFrame(matches, index=df.index, columns=PATTERN_NAMES)
+
 def detect_patterns(df: pd.DataFrame, min_confidence: int = 55) -> list:
     results = []
-    if df is None or df.empty or len(df) < 3:
+    if df is None or len(df) < 3:
         return results
 
     try:
-        last, prev, prev2 = df.iloc[-1], df.iloc[-2], df.iloc[-3]
-        body = abs(last["c"] - last["o"])
-        candle_range = last["h"] - last["l"]
-        if candle_range == 0 or body == 0:
-            return results
-
-        # 1–2 Candle Patterns
-        if body < 0.1 * candle_range:
-            results.append({"pattern": "Doji", **PATTERN_DEFINITIONS["Doji"]})
-        if last["c"] > last["o"] and prev["c"] < prev["o"] and last["o"] < prev["c"] and last["c"] > prev["o"]:
-            results.append({"pattern": "Bullish Engulfing", **PATTERN_DEFINITIONS["Bullish Engulfing"]})
-        if last["o"] > last["c"] and prev["o"] < prev["c"] and last["c"] < prev["o"] and last["o"] > prev["c"]:
-            results.append({"pattern": "Bearish Engulfing", **PATTERN_DEFINITIONS["Bearish Engulfing"]})
-        if last["c"] > last["o"] and (last["l"] < last["o"] - body * 0.5):
-            results.append({"pattern": "Hammer", **PATTERN_DEFINITIONS["Hammer"]})
-        if last["o"] > last["c"] and (last["h"] > last["o"] + body * 0.5):
-            results.append({"pattern": "Shooting Star", **PATTERN_DEFINITIONS["Shooting Star"]})
-
-        # 3-Candle Reversal Patterns
-        if prev2["c"] < prev2["o"] and prev["c"] > prev["o"] and last["c"] > last["o"] and last["c"] > prev2["o"]:
-            results.append({"pattern": "Morning Star", **PATTERN_DEFINITIONS["Morning Star"]})
-        if prev2["c"] > prev2["o"] and prev["c"] < prev["o"] and last["c"] < last["o"] and last["c"] < prev2["o"]:
-            results.append({"pattern": "Evening Star", **PATTERN_DEFINITIONS["Evening Star"]})
-
-        # Momentum Patterns
-        if len(df) >= 11:
-            change_pct = ((df["c"].iloc[-1] - df["c"].iloc[-11]) / df["c"].iloc[-11]) * 100
-            if change_pct >= 2.0:
-                results.append({"pattern": "Strong Bullish Momentum", **PATTERN_DEFINITIONS["Strong Bullish Momentum"]})
-            elif change_pct <= -2.0:
-                results.append({"pattern": "Strong Bearish Momentum", **PATTERN_DEFINITIONS["Strong Bearish Momentum"]})
-
-        qualified = [p for p in results if p["confidence"] >= min_confidence]
-        logger.info(f"[PatternAnalysisEngine] {len(qualified)} pattern(s) qualified.")
-        return qualified
+        # Nur das für die letzte Kerze nötige Fenster auswerten
+        tail = df.iloc[-(MOMENTUM_LOOKBACK + 1):]
+        o, h, l, c = (tail[column].to_numpy(dtype=np.float64) for column in ("o", "h", "l", "c"))
+        last_row = pattern_matrix(o, h, l, c)[-1] & qualified_mask(min_confidence)
+
+        hits = {name for name, hit in zip(PATTERN_NAMES, last_row) if hit}
+        results = [{"pattern": name, **PATTERN_DEFINITIONS[name]} for name in DETECTION_ORDER if name in hits]
+        logger.info(f"[PatternAnalysisEngine] {len(results)} pattern(s) qualified.")
+        return results
 
     except Exception as e:
         logger.error(f"❌ [PatternDetection] Critical Error: {e}")
         return []
 
-def evaluate_indicators(df: pd.DataFrame) -> tuple:
+def evaluate_indicators(df: pd.DataFrame, features: FeatureFrame = None) -> tuple:
     if df is None or df.empty or len(df) < 20:
         return 50.0, "Neutral ⚪"
     try:
-        df["EMA_9"] = df["c"].ewm(span=9).mean()
-        df["EMA_21"] = df["c"].ewm(span=21).mean()
-        last_ema9, last_ema21 = df["EMA_9"].iloc[-1], df["EMA_21"].iloc[-1]
+        features = features or FeatureFrame.from_frame(df)
+        last_ema9, last_ema21 = features.last.ema_fast, features.last.ema_slow
         trend = "Long 📈" if last_ema9 > last_ema21 else "Short 📉" if last_ema9 < last_ema21 else "Neutral ⚪"
 
-        delta = df["c"].diff()
-        gain = np.maximum(delta, 0)
-        loss = np.abs(np.minimum(delta, 0))
-        avg_gain = pd.Series(gain).rolling(14).mean().iloc[-1]
-        avg_loss = pd.Series(loss).rolling(14).mean().iloc[-1]
-        rsi = 100.0 if avg_loss == 0 else 100 - (100 / (1 + (avg_gain / avg_loss)))
+        rsi = features.last.rsi
 
         score = 50 + (15 if trend == "Long 📈" else -15 if trend == "Short 📉" else 0)
         score += 10 if rsi < 30 else -10 if rsi > 70 else 0
@@ -11,6 +11,7 @@ Made in Bali. Engineered with German Precision.
 import pandas as pd
 import numpy as np
 import statistics
+from bot.engine.feature_frame import FeatureFrame, ATR_PERIOD
 from bot.utils.logger import setup_logger
 
 # Setup structured logger
@@ -27,28 +28,28 @@ class VolatilityEngine:
         self.threshold_multiplier = threshold_multiplier
         self.language = language.lower()
 
-    def detect_volatility_spike(self, df: pd.DataFrame) -> dict | None:
+    def detect_volatility_spike(self, df: pd.DataFrame, features: FeatureFrame = None) -> dict | None:
         """
         Detects sudden volatility spikes based on dynamic ATR and price changes.
+
+        Reads true range, ATR and percent moves from the shared feature frame.
         """
         if df is None or df.empty or not all(col in df.columns for col in ["h", "l", "c"]):
             logger.warning("⚠️ [VolatilityEngine] Invalid DataFrame for spike detection.")
             return None
 
         try:
-            # === True Range Components ===
-            df["high_low"] = df["h"] - df["l"]
-            df["high_close"] = (df["h"] - df["c"].shift()).abs()
-            df["low_close"] = (df["l"] - df["c"].shift()).abs()
-            df["true_range"] = df[["high_low", "high_close", "low_close"]].max(axis=1)
+            if features is None or self.period != ATR_PERIOD:
+                features = FeatureFrame.from_frame(df)
 
             # === ATR & Percent Move ===
-            df["atr"] = df["true_range"].rolling(window=self.period, min_periods=1).mean()
-            df["pct_change"] = df["c"].pct_change().abs() * 100
-
-            current_atr = df["atr"].iloc[-1]
-            avg_pct_change = df["pct_change"].rolling(window=self.period, min_periods=1).mean().iloc[-1]
-            current_move = df["pct_change"].iloc[-1]
+            if self.period == ATR_PERIOD:
+                current_atr = features.last.atr
+                avg_pct_change = features.last.avg_pct_move
+            else:
+                current_atr = pd.Series(features.true_range).rolling(window=self.period, min_periods=1).mean().iloc[-1]
+                avg_pct_change = pd.Series(features.pct_move).rolling(window=self.period, min_periods=1).mean().iloc[-1]
+            current_move = features.last.pct_move
 
             spike_detected = current_move > (avg_pct_change * self.threshold_multiplier)
 
@@ -69,9 +70,6 @@ class VolatilityEngine:
             logger.error(f"❌ [VolatilityEngine] Critical Error: {e}")
             return None
 
-        finally:
-            df.drop(columns=["high_low", "high_close", "low_close", "true_range", "atr", "pct_change"], inplace=True, errors="ignore")
-
     def is_high_volatility_phase(self, candles: list[dict]) -> bool:
         """
         Detects if recent candles reflect a sustained high-volatility environment.
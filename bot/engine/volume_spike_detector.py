@@ -6,11 +6,12 @@ Made in Bali. Engineered with German Precision.
 """
 
 import pandas as pd
+from bot.engine.feature_frame import FeatureFrame, VOLUME_WINDOW
 from bot.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
-def detect_volume_spike(df: pd.DataFrame, window: int = 30, multiplier: float = 1.3) -> dict | None:
+def detect_volume_spike(df: pd.DataFrame, window: int = 30, multiplier: float = 1.3, features: FeatureFrame = None) -> dict | None:
     """
     Detects real-time volume anomalies via short-term surges over a rolling baseline.
 
@@ -18,6 +19,7 @@ def detect_volume_spike(df: pd.DataFrame, window: int = 30, multiplier: float =
         df (pd.DataFrame): Candlestick DataFrame incl. 'v' (volume).
         window (int): Lookback for rolling average.
         multiplier (float): Trigger factor for spike.
+        features (FeatureFrame, optional): Shared volume baseline of the same bar.
 
     Returns:
         dict or None: Details of spike if detected.
@@ -27,7 +29,10 @@ def detect_volume_spike(df: pd.DataFrame, window: int = 30, multiplier: float =
         return None
 
     try:
-        base_avg = df["v"].rolling(window=window, min_periods=window // 2).mean().iloc[-1]
+        if features is not None and window == VOLUME_WINDOW:
+            base_avg = features.last.volume_baseline
+        else:
+            base_avg = df["v"].rolling(window=window, min_periods=window // 2).mean().iloc[-1]
         recent_avg = df["v"].tail(3).mean()
         recent_med = df["v"].tail(3).median()
 
@@ -0,0 +1,146 @@
+"""
+A.R.K. Yahoo Fallback – Off-Loop Batch Downloader 1.0
+Führt yfinance-Downloads in einem begrenzten Thread-Pool aus, nie auf dem Event Loop.
+Symbole, die im selben Zyklus auf Yahoo fallen, werden zu einem Multi-Ticker-Download gebündelt.
+
+Made in Bali. Engineered with German Precision.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import pandas as pd
+import yfinance as yf
+from bot.engine.candles import Candles
+from bot.utils.logger import setup_logger
+from bot.utils.circuit_breaker import yahoo_breaker, CircuitOpenError
+
+# === Setup ===
+logger = setup_logger(__name__)
+
+BATCH_WINDOW_SEC = 0.25  # Sammelfenster für gleichzeitige Fallbacks
+MAX_BATCH_SIZE = 50      # Ticker pro yf.download-Aufruf
+
+# yf.download hält globalen Modulzustand → genau ein Worker-Thread, Batches laufen seriell
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ark-yahoo")
+
+def _normalize(frame: pd.DataFrame) -> pd.DataFrame:
+    frame = frame.rename(columns={
+        "Open": "o", "High": "h", "Low": "l", "Close": "c", "Volume": "v"
+    })
+    df = frame[["o", "h", "l", "c", "v"]].dropna(subset=["o", "h", "l", "c"]).copy()
+    df["v"] = df["v"].fillna(0.0)
+    df.index.name = "t"
+    return df.astype(float)
+
+def _download_batch(symbols: list[str]) -> dict:
+    """
+    Blocking multi-ticker download – runs inside the worker thread.
+
+    Returns:
+        dict: Symbol → Candles (missing symbols are omitted).
+    """
+    data = yf.download(
+        tickers=symbols,
+        period="5d",
+        interval="5m",
+        group_by="ticker",
+        auto_adjust=True,
+        threads=False,
+        progress=False
+    )
+
+    if data is None or data.empty:
+        return {}
+
+    frames = {}
+    for symbol in symbols:
+        try:
+            raw = data[symbol] if isinstance(data.columns, pd.MultiIndex) else data
+            df = _normalize(raw)
+            if not df.empty:
+                frames[symbol] = Candles.from_pandas(df)
+        except KeyError:
+            continue
+    return frames
+
+class YahooBatcher:
+    """
+    Collects Yahoo fallback requests for a short window and serves them with
+    one batched download in the worker thread.
+    """
+
+    def __init__(self, window_sec: float = BATCH_WINDOW_SEC):
+        self.window_sec = window_sec
+        self._pending = {}   # symbol → asyncio.Future
+        self._flush_handle = None
+        self.batches = 0
+        self.symbols_served = 0
+
+    async def fetch(self, symbol: str) -> Candles:
+        """
+        Returns 5m candles for the symbol from the next batched Yahoo download.
+
+        Raises:
+            CircuitOpenError: If the Yahoo breaker refuses the batch.
+            LookupError: If Yahoo returned no data for the symbol.
+        """
+        loop = asyncio.get_running_loop()
+        future = self._pending.get(symbol)
+        if future is None:
+            future = loop.create_future()
+            self._pending[symbol] = future
+
+        if self._flush_handle is None:
+            self._flush_handle = loop.call_later(
+                self.window_sec, lambda: asyncio.ensure_future(self._flush())
+            )
+
+        return await asyncio.shield(future)
+
+    async def _flush(self) -> None:
+        batch, self._pending, self._flush_handle = self._pending, {}, None
+        symbols = list(batch)
+
+        for start in range(0, len(symbols), MAX_BATCH_SIZE):
+            chunk = symbols[start:start + MAX_BATCH_SIZE]
+            try:
+                frames = await self._download(chunk)
+            except Exception as e:
+                for symbol in chunk:
+                    if not batch[symbol].done():
+                        batch[symbol].set_exception(e)
+                continue
+
+            for symbol in chunk:
+                future = batch[symbol]
+                if future.done():
+                    continue
+                if symbol in frames:
+                    future.set_result(frames[symbol])
+                else:
+                    future.set_exception(LookupError(f"Yahoo returned no data for {symbol}"))
+
+    async def _download(self, symbols: list[str]) -> dict:
+        if not yahoo_breaker.allow_request():
+            raise CircuitOpenError(f"Yahoo circuit open – {len(symbols)} symbol(s)")
+
+        loop = asyncio.get_running_loop()
+        async with yahoo_breaker.call() as call:
+            frames = await loop.run_in_executor(_executor, _download_batch, symbols)
+            call.ok()
+
+        latency = call.latency
+        self.batches += 1
+        self.symbols_served += len(frames)
+        logger.info(
+            f"✅ [YahooBackup] Batch of {len(symbols)} symbol(s) in {latency:.2f}s | "
+            f"Delivered: {len(frames)}"
+        )
+        return frames
+
+# === Singleton Export ===
+yahoo_batcher = YahooBatcher()
+
+def shutdown_yahoo_executor() -> None:
+    """Stops the worker thread; pending downloads are abandoned."""
+    _executor.shutdown(wait=False, cancel_futures=True)
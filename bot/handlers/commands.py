@@ -4,15 +4,29 @@ Handles bilingual user commands with ultra-stability and strategic real-time res
 Made in Bali. Engineered with German Precision.
 """
 
+from datetime import datetime
 from telegram import Update
 from telegram.ext import ContextTypes
 from bot.utils.language import get_language, set_language
-from bot.utils.i18n import get_text
+from bot.utils.i18n import get_text, render_cache
 from bot.utils.logger import setup_logger
 from bot.utils.error_reporter import report_error
 from bot.utils.uptime_tracker import get_uptime
-from bot.engine.analysis_engine import analyze_symbol
+from bot.engine.analysis_engine import analyze_symbol, pipeline_stats
 from bot.utils.api_bridge import monitor as usage_monitor
+from bot.engine.data_loader import get_cache_stats
+from bot.engine.feature_frame import feature_cache
+from bot.engine.compute_pool import compute_pool
+from bot.auto.scan_scheduler import scan_scheduler
+from bot.auto.scan_bus import scan_bus
+from bot.auto.signal_digest import signal_digest
+from bot.utils.signal_state import signal_state
+from bot.utils.rate_limiter import finnhub_limiter, PRIORITY_INTERACTIVE
+from bot.utils.circuit_breaker import get_all_breakers
+from bot.scheduler.job_scheduler import job_scheduler
+from bot.utils.message_queue import message_queue
+from bot.utils.subscription_index import subscription_index, WILDCARD
+from bot.auto.broadcaster import broadcaster
 
 logger = setup_logger(__name__)
 
@@ -29,6 +43,9 @@ async def start(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
                   "`/signal` – Latest signal\n"
                   "`/status` – System status\n"
                   "`/monitor` – API usage\n"
+                  "`/jobs` – Scheduled jobs\n"
+                  "`/subscribe SYMBOL… [min=60]` – Signal subscription\n"
+                  "`/unsubscribe` – Stop signals\n"
                   "`/uptime` – Uptime check\n"
                   "`/setlanguage en|de` – Switch language\n"
                   "`/help` – All commands",
@@ -37,6 +54,9 @@ async def start(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
                   "`/signal` – Letztes Signal\n"
                   "`/status` – Systemstatus\n"
                   "`/monitor` – API-Verbrauch\n"
+                  "`/jobs` – Geplante Jobs\n"
+                  "`/subscribe SYMBOL… [min=60]` – Signale abonnieren\n"
+                  "`/unsubscribe` – Signale abbestellen\n"
                   "`/uptime` – Laufzeit prüfen\n"
                   "`/setlanguage de|en` – Sprache wählen\n"
                   "`/help` – Alle Befehle"
@@ -67,7 +87,7 @@ async def analyze_symbol_handler(update: Update, context: ContextTypes.DEFAULT_T
         symbol = context.args[0].upper()
         await update.message.reply_text(f"🔍 {get_text('analyzing', lang)} *{symbol}*...", parse_mode="Markdown")
 
-        result = await analyze_symbol(symbol, chat_id=update.effective_chat.id)
+        result = await analyze_symbol(symbol, chat_id=update.effective_chat.id, priority=PRIORITY_INTERACTIVE)
         if not result:
             await update.message.reply_text(get_text("no_analysis_data", lang).format(symbol=symbol), parse_mode="Markdown")
             return
@@ -154,6 +174,7 @@ async def shutdown_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -
     try:
         lang = get_language(update.effective_chat.id) or "en"
         await update.message.reply_text(get_text("shutdown", lang), parse_mode="Markdown")
+        await job_scheduler.shutdown()
         await context.application.stop()
         logger.info("🛑 [Command] /shutdown")
     except Exception as e:
@@ -166,6 +187,21 @@ async def monitor_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
         calls = usage_monitor.get_call_count()
         minutes = usage_monitor.get_elapsed_minutes()
         rate = usage_monitor.get_rate_per_minute()
+        cache = get_cache_stats()
+        features = feature_cache.get_stats()
+        pool = compute_pool.get_stats()
+        pipeline = pipeline_stats.get_stats()
+        rejects = " / ".join(f"{stage} {count}" for stage, count in pipeline["rejected"].items())
+        scans = scan_scheduler.get_stats()
+        bus = scan_bus.get_stats()
+        digest = signal_digest.get_stats()
+        dedup = signal_state.get_stats()
+        subscribers = subscription_index.get_stats()
+        fanout = broadcaster.get_stats()
+        renders = render_cache.get_stats()
+        limiter = finnhub_limiter.get_stats()
+        outbound = message_queue.get_stats()
+        breakers = " | ".join(f"{name}: {b.state}" for name, b in get_all_breakers().items())
 
         status = (
             ("🟢", "Stable") if rate < 75 else
@@ -178,7 +214,30 @@ async def monitor_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
             f"• *Total Calls:* `{calls}`\n"
             f"• *Runtime:* `{minutes:.1f} min`\n"
             f"• *Rate:* `{rate:.2f} calls/min`\n"
-            f"• *Status:* `{status[1]}`\n\n"
+            f"• *Status:* `{status[1]}`\n"
+            f"• *Candle Cache:* `{cache['hits']} hits / {cache['misses']} misses / "
+            f"{cache['coalesced']} coalesced ({cache['hit_rate']}%)`\n"
+            f"• *Feature Cache:* `{features['hits']} hits / {features['misses']} builds ({features['hit_rate']}%) | "
+            f"{features['bars_streamed']} bars streamed / {features['rebuilds']} rebuilds`\n"
+            f"• *Compute:* `{pool['mode']} | {pool['workers']} worker(s) | {pool['tasks']} task(s) | Ø {pool['avg_task_sec']}s`\n"
+            f"• *Pipeline:* `{pipeline['entered']} in → {pipeline['passed']} passed | rejected: {rejects}`\n"
+            f"• *Scan:* `{scans['runs']} phase(s) | {scans['completed']} done / {scans['rolled_over']} rolled over | "
+            f"last {scans['last_cycle_sec']}s @ {scans['concurrency']} parallel`\n"
+            f"• *Scan Bus:* `cycle {bus['cycle']} | {bus['published']} published → {bus['consumers']} consumer(s) | {bus['backlog']} queued | "
+            f"{bus['failures']} failure(s)`\n"
+            f"• *Signal State:* `{dedup['admitted']} sent | suppressed: {dedup['suppressed']['duplicate']} dup / "
+            f"{dedup['suppressed']['cooldown']} cooldown / {dedup['suppressed']['hourly_cap']} cap | "
+            f"{dedup['last_hour']}/{dedup['max_per_hour']} last hour`\n"
+            f"• *Subscribers:* `{subscribers['subscribers']} chat(s) ({subscribers['wildcard']} all symbols) | "
+            f"{fanout['deliveries']} delivered from {fanout['renders']} rendering(s) | Ø fan-out {fanout['avg_fanout_ms']}ms`\n"
+            f"• *Render Cache:* `{renders['hits']} hits / {renders['misses']} renders ({renders['hit_rate']}%) | "
+            f"{renders['entries']} cached`\n"
+            f"• *Digest:* `{digest['signals']} signal(s) in {digest['messages']} message(s) over {digest['digests']} cycle(s)`\n"
+            f"• *Rate Limiter:* `{limiter['queued']} queued | Ø wait {limiter['avg_wait_sec']}s`\n"
+            f"• *Telegram Queue:* `{outbound['queued']} queued (alert {outbound['depth']['alert']} / "
+            f"normal {outbound['depth']['normal']} / low {outbound['depth']['low']}) | {outbound['sent']} sent / "
+            f"{outbound['failed']} failed / {outbound['retries']} retries | Ø {outbound['avg_latency_sec']}s`\n"
+            f"• *Sources:* `{breakers}`\n\n"
             "_All API usage tracked in real-time._"
         )
 
@@ -186,3 +245,118 @@ async def monitor_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
         logger.info("✅ [Command] /monitor")
     except Exception as e:
         await report_error(context.bot, update.effective_chat.id, e, "/monitor Handler Error")
+
+# === /jobs ===
+async def jobs_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    try:
+        jobs = job_scheduler.list_jobs()
+        if not jobs:
+            await update.message.reply_text("ℹ️ *No jobs registered.*", parse_mode="Markdown")
+            return
+
+        lines = ["🗓️ *Job Scheduler*\n"]
+        for job in jobs:
+            state = "▶️" if job["running"] else "⏸️"
+            next_run = (
+                datetime.utcfromtimestamp(job["next_run"]).strftime("%H:%M:%S UTC")
+                if job["next_run"] else "–"
+            )
+            lines.append(
+                f"{state} *{job['name']}* `{job['schedule']}`\n"
+                f"   `{job['runs']} run(s) | {job['failures']} failed | {job['timeouts']} timeout(s) | "
+                f"{job['overlaps']} overlap(s) | {job['misfires']} misfire(s) | {job['restarts']} restart(s) | "
+                f"last {job['last_duration']:.1f}s | next {next_run}`"
+            )
+
+        await update.message.reply_text("\n".join(lines), parse_mode="Markdown")
+        logger.info("✅ [Command] /jobs")
+    except Exception as e:
+        await report_error(context.bot, update.effective_chat.id, e, "/jobs Handler Error")
+
+# === /subscribe ===
+async def subscribe_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    try:
+        chat_id = update.effective_chat.id
+        lang = get_language(chat_id) or "en"
+        if not context.args:
+            await update.message.reply_text(
+                "❗ Please use: `/subscribe AAPL TSLA min=60` or `/subscribe all`" if lang == "en" else
+                "❗ Bitte nutze: `/subscribe AAPL TSLA min=60` oder `/subscribe all`",
+                parse_mode="Markdown"
+            )
+            return
+
+        symbols, min_confidence = [], 0.0
+        for arg in context.args:
+            if arg.lower().startswith("min="):
+                min_confidence = max(0.0, min(float(arg[4:]), 100.0))
+            elif arg.lower() in ("all", WILDCARD):
+                symbols.append(WILDCARD)
+            else:
+                symbols.append(arg.upper())
+        if not symbols:
+            symbols = [WILDCARD]
+
+        subscription_index.subscribe(chat_id, symbols, min_confidence)
+        listed = "all symbols" if WILDCARD in symbols else ", ".join(sorted(set(symbols)))
+        await update.message.reply_text(
+            f"✅ *Subscribed:* `{listed}` | min. confidence `{min_confidence:.0f}%`" if lang == "en" else
+            f"✅ *Abonniert:* `{listed}` | min. Confidence `{min_confidence:.0f}%`",
+            parse_mode="Markdown"
+        )
+        logger.info(f"✅ [Command] /subscribe {chat_id} → {listed} (min {min_confidence:.0f}%)")
+    except ValueError:
+        await update.message.reply_text("❗ `min=` expects a number, e.g. `min=60`", parse_mode="Markdown")
+    except Exception as e:
+        await report_error(context.bot, update.effective_chat.id, e, "/subscribe Handler Error")
+
+# === /unsubscribe ===
+async def unsubscribe_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    try:
+        chat_id = update.effective_chat.id
+        lang = get_language(chat_id) or "en"
+        current = subscription_index.subscription(chat_id)
+
+        if context.args and current and WILDCARD not in current["symbols"]:
+            # Nur einzelne Symbole abbestellen
+            removed = {arg.upper() for arg in context.args}
+            remaining = [s for s in current["symbols"] if s not in removed]
+            if remaining:
+                subscription_index.subscribe(chat_id, remaining, current["min_confidence"])
+                await update.message.reply_text(
+                    f"✅ *Remaining:* `{', '.join(remaining)}`" if lang == "en" else f"✅ *Verbleibend:* `{', '.join(remaining)}`",
+                    parse_mode="Markdown"
+                )
+                return
+
+        subscription_index.unsubscribe(chat_id)
+        await update.message.reply_text(
+            "🔕 *Signals unsubscribed.*" if lang == "en" else "🔕 *Signale abbestellt.*",
+            parse_mode="Markdown"
+        )
+        logger.info(f"✅ [Command] /unsubscribe {chat_id}")
+    except Exception as e:
+        await report_error(context.bot, update.effective_chat.id, e, "/unsubscribe Handler Error")
+
+# === /subscriptions ===
+async def subscriptions_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    try:
+        chat_id = update.effective_chat.id
+        lang = get_language(chat_id) or "en"
+        current = subscription_index.subscription(chat_id)
+        if current is None:
+            await update.message.reply_text(
+                "ℹ️ *No subscription.* Use `/subscribe`." if lang == "en" else "ℹ️ *Kein Abo.* Nutze `/subscribe`.",
+                parse_mode="Markdown"
+            )
+            return
+
+        listed = "all symbols" if WILDCARD in current["symbols"] else ", ".join(current["symbols"])
+        await update.message.reply_text(
+            f"📬 *Subscription:* `{listed}` | min. confidence `{current['min_confidence']:.0f}%`" if lang == "en" else
+            f"📬 *Abo:* `{listed}` | min. Confidence `{current['min_confidence']:.0f}%`",
+            parse_mode="Markdown"
+        )
+        logger.info("✅ [Command] /subscriptions")
+    except Exception as e:
+        await report_error(context.bot, update.effective_chat.id, e, "/subscriptions Handler Error")
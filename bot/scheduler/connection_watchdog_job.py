@@ -4,18 +4,17 @@ Permanently monitors Telegram API connectivity. Sends multilingual alerts on dis
 Made in Bali. Engineered with German Precision.
 """
 
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from apscheduler.triggers.interval import IntervalTrigger
 from telegram import Bot
 from bot.utils.logger import setup_logger
 from bot.utils.error_reporter import report_error
 from bot.utils.language import get_language
 from bot.utils.i18n import get_text
 from bot.config.settings import get_settings
+from bot.scheduler.job_scheduler import job_scheduler
+from bot.utils.message_queue import message_queue, PRIORITY_LOW
 
 logger = setup_logger(__name__)
 config = get_settings()
-watchdog_scheduler = AsyncIOScheduler()
 
 async def check_connection(bot: Bot, chat_id: int):
     """
@@ -31,11 +30,13 @@ async def check_connection(bot: Bot, chat_id: int):
 
         try:
             text = get_text("connection_lost", lang)
-            await bot.send_message(
+            await message_queue.send(
+                bot,
                 chat_id=chat_id,
                 text=f"⚠️ *{text}*",
                 parse_mode="Markdown",
-                disable_web_page_preview=True
+                disable_web_page_preview=True,
+                priority=PRIORITY_LOW
             )
             logger.info("⚠️ [Watchdog] Alert message sent to admin.")
 
@@ -46,29 +47,17 @@ async def check_connection(bot: Bot, chat_id: int):
 
 def start_connection_watchdog(bot: Bot, chat_id: int):
     """
-    Starts the watchdog job, runs every 30 minutes.
+    Registers the watchdog job (every WATCHDOG_INTERVAL_MIN, default 30 minutes) with the central job scheduler.
     """
     try:
-        job_id = f"connection_watchdog_job_{chat_id}"
-
-        if watchdog_scheduler.get_job(job_id):
-            logger.info(f"♻️ [Watchdog] Already running for {chat_id}")
-            return
-
-        watchdog_scheduler.add_job(
-            check_connection,
-            trigger=IntervalTrigger(minutes=30),
-            args=[bot, chat_id],
-            id=job_id,
-            replace_existing=True,
-            name=f"A.R.K. Connection Watchdog for Chat {chat_id}",
-            misfire_grace_time=300
+        job_scheduler.add_interval(
+            f"connection_watchdog_{chat_id}",
+            check_connection, bot, chat_id,
+            minutes=config.get("WATCHDOG_INTERVAL_MIN", 30),
+            jitter=30,
+            max_runtime=60
         )
-
-        if not watchdog_scheduler.running:
-            watchdog_scheduler.start()
-
-        logger.info(f"✅ [Watchdog] Scheduler started for chat_id {chat_id}")
+        logger.info(f"✅ [Watchdog] Registered for chat_id {chat_id}")
 
     except Exception as e:
         logger.critical(f"🔥 [Watchdog] Scheduler init error: {e}")
@@ -4,8 +4,6 @@ Sends multilingual system pings every 60 minutes to ensure uptime and diagnostic
 Made in Bali. Engineered with German Precision.
 """
 
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from apscheduler.triggers.interval import IntervalTrigger
 from datetime import datetime
 import platform
 import psutil
@@ -15,11 +13,12 @@ from bot.config.settings import get_settings
 from bot.utils.logger import setup_logger
 from bot.utils.language import get_language
 from bot.utils.i18n import get_text
+from bot.scheduler.job_scheduler import job_scheduler
+from bot.utils.message_queue import message_queue, PRIORITY_LOW
 
 # Setup
 logger = setup_logger(__name__)
 config = get_settings()
-heartbeat_scheduler = AsyncIOScheduler()
 
 async def send_heartbeat(bot: Bot, chat_id: int):
     """
@@ -46,11 +45,13 @@ async def send_heartbeat(bot: Bot, chat_id: int):
             f"_{get_text('heartbeat_footer', lang)}_"
         )
 
-        await bot.send_message(
+        await message_queue.send(
+            bot,
             chat_id=chat_id,
             text=message,
             parse_mode="Markdown",
-            disable_web_page_preview=True
+            disable_web_page_preview=True,
+            priority=PRIORITY_LOW
         )
         logger.info(f"✅ [HeartbeatJob] Heartbeat sent to chat_id {chat_id}")
 
@@ -59,30 +60,17 @@ async def send_heartbeat(bot: Bot, chat_id: int):
 
 def start_heartbeat_job(bot: Bot, chat_id: int):
     """
-    Starts the heartbeat job with 60-minute interval.
+    Registers the heartbeat job (60-minute interval) with the central job scheduler.
     """
     try:
-        job_id = f"heartbeat_job_{chat_id}"
-
-        # Prüfen ob Job bereits existiert
-        if heartbeat_scheduler.get_job(job_id):
-            logger.info(f"♻️ [HeartbeatJob] Scheduler already running for chat_id {chat_id}")
-            return
-
-        heartbeat_scheduler.add_job(
-            send_heartbeat,
-            trigger=IntervalTrigger(minutes=60),
-            args=[bot, chat_id],
-            id=job_id,
-            name=f"A.R.K. Heartbeat for Chat {chat_id}",
-            replace_existing=True,
-            misfire_grace_time=300
+        job_scheduler.add_interval(
+            f"heartbeat_{chat_id}",
+            send_heartbeat, bot, chat_id,
+            minutes=60,
+            jitter=30,
+            max_runtime=60
         )
-
-        if not heartbeat_scheduler.running:
-            heartbeat_scheduler.start()
-
-        logger.info(f"✅ [HeartbeatJob] Scheduler started for chat_id {chat_id}")
+        logger.info(f"✅ [HeartbeatJob] Registered for chat_id {chat_id}")
 
     except Exception as e:
         logger.critical(f"🔥 [HeartbeatJob] Failed to start scheduler: {e}")
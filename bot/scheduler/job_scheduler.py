@@ -0,0 +1,205 @@
+"""
+A.R.K. Job Scheduler – Central Periodic Work Service 1.0
+Ein einziger AsyncIOScheduler für alle periodischen Jobs plus überwachte Dauer-Loops (Services).
+Pro Job: Überlappungsschutz, Jitter, maximale Laufzeit, Misfire- und Fehlerstatistik – per /jobs einsehbar.
+
+Made in Bali. Engineered with German Precision.
+"""
+
+import asyncio
+import time
+from datetime import datetime
+import pytz
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
+from apscheduler.events import EVENT_JOB_MISSED, EVENT_JOB_MAX_INSTANCES
+from bot.utils.logger import setup_logger
+
+# === Setup ===
+logger = setup_logger(__name__)
+
+SERVICE_RESTART_DELAY_SEC = 30
+
+class JobStats:
+    """Run statistics of one registered job or service."""
+
+    def __init__(self, name: str, kind: str, schedule: str, max_runtime: float = None):
+        self.name = name
+        self.kind = kind          # interval | cron | service
+        self.schedule = schedule  # lesbare Beschreibung des Triggers
+        self.max_runtime = max_runtime
+        self.running = False
+        self.runs = 0
+        self.failures = 0
+        self.timeouts = 0
+        self.overlaps = 0
+        self.misfires = 0
+        self.restarts = 0
+        self.last_run = None
+        self.last_duration = 0.0
+
+    def as_dict(self) -> dict:
+        return {key: value for key, value in vars(self).items()}
+
+class JobScheduler:
+    """
+    Owns all periodic work of the bot.
+
+    Jobs run on one shared AsyncIOScheduler with at most one instance each;
+    a fire that would overlap a running instance is skipped and counted.
+    Services are long-running loops that are restarted after a crash. After
+    shutdown() no job fires and all services are cancelled.
+    """
+
+    def __init__(self):
+        self._scheduler = AsyncIOScheduler(timezone=pytz.utc)
+        self._scheduler.add_listener(self._on_event, EVENT_JOB_MISSED | EVENT_JOB_MAX_INSTANCES)
+        self._stats = {}      # name → JobStats
+        self._services = {}   # name → asyncio.Task
+        self._stopping = False
+
+    # === Registration ===
+    def add_interval(self, name: str, func, *args, seconds: int = 0, minutes: int = 0,
+                     jitter: int = 0, max_runtime: float = None, run_now: bool = False,
+                     misfire_grace_sec: int = 300) -> None:
+        """
+        Registers a coroutine function to run every `seconds + minutes`.
+
+        Args:
+            name (str): Unique job name; re-registering replaces the job.
+            func (Callable): Coroutine function, called with *args.
+            jitter (int): Random delay of up to this many seconds per fire.
+            max_runtime (float, optional): Seconds after which a run is cancelled.
+            run_now (bool): Fire once immediately after start.
+        """
+        trigger = IntervalTrigger(seconds=seconds, minutes=minutes, jitter=jitter or None)
+        schedule = f"every {minutes * 60 + seconds}s" + (f" ±{jitter}s" if jitter else "")
+        self._add(name, func, args, trigger, "interval", schedule, max_runtime, misfire_grace_sec,
+                  next_run_time=datetime.now(pytz.utc) if run_now else None)
+
+    def add_cron(self, name: str, func, *args, timezone: str = "UTC", jitter: int = 0,
+                 max_runtime: float = None, misfire_grace_sec: int = 300, **fields) -> None:
+        """
+        Registers a coroutine function on a cron schedule (fields as in CronTrigger).
+        """
+        trigger = CronTrigger(timezone=timezone, jitter=jitter or None, **fields)
+        schedule = " ".join(f"{key}={value}" for key, value in fields.items()) + f" ({timezone})"
+        self._add(name, func, args, trigger, "cron", schedule, max_runtime, misfire_grace_sec)
+
+    def _add(self, name, func, args, trigger, kind, schedule, max_runtime, misfire_grace_sec, next_run_time=None):
+        self._stats[name] = JobStats(name, kind, schedule, max_runtime)
+        options = {"next_run_time": next_run_time} if next_run_time else {}
+        self._scheduler.add_job(
+            self._run,
+            trigger=trigger,
+            args=[name, func, args],
+            id=name,
+            name=name,
+            replace_existing=True,
+            max_instances=1,
+            coalesce=True,
+            misfire_grace_time=misfire_grace_sec,
+            **options
+        )
+        logger.info(f"🗓️ [JobScheduler] Job registriert: {name} ({schedule})")
+
+    def add_service(self, name: str, coro_fn, *args) -> None:
+        """
+        Starts a long-running loop under supervision; it is restarted
+        SERVICE_RESTART_DELAY_SEC after an unexpected exit.
+        """
+        if name in self._services and not self._services[name].done():
+            logger.info(f"♻️ [JobScheduler] Service läuft bereits: {name}")
+            return
+        self._stats[name] = JobStats(name, "service", "continuous")
+        self._services[name] = asyncio.ensure_future(self._supervise(name, coro_fn, args))
+        logger.info(f"🗓️ [JobScheduler] Service gestartet: {name}")
+
+    # === Execution ===
+    async def _run(self, name: str, func, args: tuple) -> None:
+        if self._stopping:
+            return
+
+        stats = self._stats[name]
+        stats.running = True
+        stats.runs += 1
+        stats.last_run = time.time()
+        started = time.monotonic()
+        try:
+            if stats.max_runtime:
+                await asyncio.wait_for(func(*args), timeout=stats.max_runtime)
+            else:
+                await func(*args)
+        except asyncio.TimeoutError:
+            stats.timeouts += 1
+            logger.error(f"⏱️ [JobScheduler] {name} nach {stats.max_runtime}s abgebrochen.")
+        except Exception as e:
+            stats.failures += 1
+            logger.exception(f"❌ [JobScheduler] {name} fehlgeschlagen: {e}")
+        finally:
+            stats.running = False
+            stats.last_duration = time.monotonic() - started
+
+    async def _supervise(self, name: str, coro_fn, args: tuple) -> None:
+        stats = self._stats[name]
+        while not self._stopping:
+            stats.running = True
+            stats.runs += 1
+            stats.last_run = time.time()
+            try:
+                await coro_fn(*args)
+                logger.warning(f"⚠️ [JobScheduler] Service {name} beendet.")
+                return
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                stats.failures += 1
+                logger.exception(f"❌ [JobScheduler] Service {name} abgestürzt: {e} – Neustart in {SERVICE_RESTART_DELAY_SEC}s")
+            finally:
+                stats.running = False
+            stats.restarts += 1
+            await asyncio.sleep(SERVICE_RESTART_DELAY_SEC)
+
+    def _on_event(self, event) -> None:
+        stats = self._stats.get(event.job_id)
+        if stats is None:
+            return
+        if event.code == EVENT_JOB_MISSED:
+            stats.misfires += 1
+            logger.warning(f"⚠️ [JobScheduler] Misfire: {event.job_id}")
+        elif event.code == EVENT_JOB_MAX_INSTANCES:
+            stats.overlaps += 1
+            logger.warning(f"⚠️ [JobScheduler] {event.job_id} läuft noch – Ausführung übersprungen.")
+
+    # === Lifecycle ===
+    def start(self) -> None:
+        if not self._scheduler.running:
+            self._scheduler.start()
+            logger.info(f"✅ [JobScheduler] Gestartet mit {len(self._stats)} Job(s)/Service(s).")
+
+    async def shutdown(self) -> None:
+        """Stops firing jobs and cancels all services."""
+        if self._stopping:
+            return
+        self._stopping = True
+        if self._scheduler.running:
+            self._scheduler.shutdown(wait=False)
+        for task in self._services.values():
+            task.cancel()
+        await asyncio.gather(*self._services.values(), return_exceptions=True)
+        logger.info("🛑 [JobScheduler] Alle Jobs und Services gestoppt.")
+
+    # === Introspection ===
+    def list_jobs(self) -> list[dict]:
+        """Returns the registry with stats and the next fire time of each job."""
+        jobs = []
+        for name, stats in self._stats.items():
+            entry = stats.as_dict()
+            job = self._scheduler.get_job(name) if stats.kind != "service" else None
+            entry["next_run"] = job.next_run_time.timestamp() if job and job.next_run_time else None
+            jobs.append(entry)
+        return jobs
+
+# === Singleton Export ===
+job_scheduler = JobScheduler()
@@ -12,13 +12,16 @@ from bot.utils.logger import setup_logger
 from bot.utils.language import get_language
 from bot.utils.error_reporter import report_error
 from bot.engine.news_alert_engine import detect_breaking_news, format_breaking_news
-from bot.utils.market_session_guard import is_us_market_open, minutes_until_market_open
+from bot.utils.market_calendar import market_calendar
 from bot.utils.api_bridge import record_call
+from bot.scheduler.job_scheduler import job_scheduler
+from bot.utils.message_queue import message_queue, PRIORITY_ALERT
 
 logger = setup_logger(__name__)
 config = get_settings()
 
 is_scanner_running = False  # Block multiple parallel starts
+PRE_MARKET_LEAD_SEC = 30 * 60
 
 async def news_scanner_job(application: Application):
     global is_scanner_running
@@ -35,31 +38,29 @@ async def news_scanner_job(application: Application):
 
     while True:
         try:
-            market_open = is_us_market_open()
-            pre_market = minutes_until_market_open() <= 30
+            # Schläft bis 30 Minuten vor der nächsten Eröffnung, wenn der Markt zu ist
+            await market_calendar.wait_for_session("NewsScanner", lead_sec=PRE_MARKET_LEAD_SEC)
 
-            if market_open or pre_market:
-                logger.info("📰 [NewsScanner] Running market news scan...")
-                record_call("finnhub")
+            logger.info("📰 [NewsScanner] Running market news scan...")
+            record_call("finnhub")
 
-                breaking_news = await detect_breaking_news()
-                if breaking_news:
-                    message = await format_breaking_news(breaking_news, lang=lang)
-                    if message:
-                        await bot.send_message(
-                            chat_id=chat_id,
-                            text=message,
-                            parse_mode="Markdown",
-                            disable_web_page_preview=True
-                        )
-                        logger.info(f"✅ [NewsScanner] Alert sent – {len(breaking_news)} article(s).")
-                else:
-                    logger.info("ℹ️ [NewsScanner] No relevant news found.")
-
-                await asyncio.sleep(300)  # Cooldown: 5 Minuten
+            breaking_news = await detect_breaking_news()
+            if breaking_news:
+                message = await format_breaking_news(breaking_news, lang=lang)
+                if message:
+                    await message_queue.send(
+                        bot,
+                        chat_id=chat_id,
+                        text=message,
+                        parse_mode="Markdown",
+                        disable_web_page_preview=True,
+                        priority=PRIORITY_ALERT
+                    )
+                    logger.info(f"✅ [NewsScanner] Alert sent – {len(breaking_news)} article(s).")
             else:
-                logger.info("⏳ [NewsScanner] Market closed – sleep 10 min.")
-                await asyncio.sleep(600)
+                logger.info("ℹ️ [NewsScanner] No relevant news found.")
+
+            await asyncio.sleep(300)  # Cooldown: 5 Minuten
 
         except Exception as e:
             logger.error(f"❌ [NewsScanner] Fatal error: {e}")
@@ -67,4 +68,4 @@ async def news_scanner_job(application: Application):
             await asyncio.sleep(90)  # Stabilitätswartezeit bei Fehlern
 
 def start_news_scanner_job(application: Application):
-    asyncio.create_task(news_scanner_job(application))
+    job_scheduler.add_service("news_scanner", news_scanner_job, application)
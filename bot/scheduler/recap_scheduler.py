@@ -5,19 +5,18 @@ Made in Bali. Engineered with German Precision.
 """
 
 from telegram import Bot
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from apscheduler.triggers.cron import CronTrigger
 from bot.utils.logger import setup_logger
 from bot.utils.i18n import get_text
 from bot.config.settings import get_settings
 from bot.utils.session_tracker import get_session_data
 from bot.analytics.win_loss_report import generate_win_loss_report
 from bot.utils.error_reporter import report_error
+from bot.scheduler.job_scheduler import job_scheduler
+from bot.utils.message_queue import message_queue, PRIORITY_NORMAL
 
 # Setup
 logger = setup_logger(__name__)
 config = get_settings()
-scheduler = AsyncIOScheduler()
 
 def get_performance_summary(lang: str = "en") -> str:
     """
@@ -68,7 +67,7 @@ async def send_recap(bot: Bot, chat_id: int, mode: str = "daily"):
             return
 
         message = f"📈 *{title}*\n\n{text}"
-        await bot.send_message(chat_id=chat_id, text=message, parse_mode="Markdown", disable_web_page_preview=True)
+        await message_queue.send(bot, chat_id=chat_id, text=message, priority=PRIORITY_NORMAL, parse_mode="Markdown", disable_web_page_preview=True)
 
         logger.info(f"✅ [RecapScheduler] {mode.capitalize()} recap sent successfully.")
 
@@ -78,36 +77,27 @@ async def send_recap(bot: Bot, chat_id: int, mode: str = "daily"):
 
 def start_recap_scheduler(bot: Bot, chat_id: int):
     """
-    Starts the automated recap jobs (daily and weekly) based on configured timezones.
+    Registers the automated recap jobs (daily and weekly) with the central job scheduler.
     """
 
     try:
-        scheduler.remove_all_jobs()
-
         # === Daily Recap ===
-        scheduler.add_job(
-            send_recap,
-            trigger=CronTrigger(hour=22, minute=30, timezone="Europe/Berlin"),
-            args=[bot, chat_id, "daily"],
-            id="daily_recap_job",
-            name="Daily Recap",
-            replace_existing=True
+        job_scheduler.add_cron(
+            "daily_recap",
+            send_recap, bot, chat_id, "daily",
+            timezone="Europe/Berlin", hour=22, minute=30,
+            max_runtime=120
         )
 
         # === Weekly Recap ===
-        scheduler.add_job(
-            send_recap,
-            trigger=CronTrigger(day_of_week="fri", hour=22, minute=35, timezone="Europe/Berlin"),
-            args=[bot, chat_id, "weekly"],
-            id="weekly_recap_job",
-            name="Weekly Recap",
-            replace_existing=True
+        job_scheduler.add_cron(
+            "weekly_recap",
+            send_recap, bot, chat_id, "weekly",
+            timezone="Europe/Berlin", day_of_week="fri", hour=22, minute=35,
+            max_runtime=120
         )
 
-        if not scheduler.running:
-            scheduler.start()
-
-        logger.info("✅ [RecapScheduler] Scheduler started successfully.")
+        logger.info("✅ [RecapScheduler] Recap jobs registered.")
 
     except Exception as e:
         logger.critical(f"🔥 [RecapScheduler] Startup error: {e}")
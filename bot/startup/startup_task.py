@@ -5,7 +5,7 @@ Made in Bali. Engineered with German Precision.
 """
 
 import os
-import asyncio
+from functools import partial
 from datetime import datetime
 import pytz
 from telegram import Bot
@@ -20,9 +20,13 @@ from bot.utils.i18n import get_text
 from bot.scheduler.recap_scheduler import start_recap_scheduler
 from bot.scheduler.heartbeat_job import start_heartbeat_job
 from bot.scheduler.connection_watchdog_job import start_connection_watchdog
-from bot.scheduler.news_scanner_job import news_scanner_job
-from bot.scheduler.auto_analysis_scheduler import start_auto_analysis_scheduler
-from bot.auto.auto_signal_loop import auto_signal_loop
+from bot.scheduler.news_scanner_job import start_news_scanner_job
+from bot.scheduler.job_scheduler import job_scheduler
+from bot.auto.auto_signal_loop import auto_signal_loop, dispatch_live_signal
+from bot.auto.auto_analysis import ultra_signal_consumer
+from bot.auto.scan_bus import scan_bus
+from bot.auto.signal_digest import digest_consumer, flush_digest
+from bot.utils.message_queue import message_queue, PRIORITY_NORMAL
 
 # === Logger & Settings ===
 logger = setup_logger(__name__)
@@ -58,10 +62,12 @@ async def send_startup_ping(bot: Bot):
             "de": "\n\n*Menü:* `/analyse`  `/signal`  `/status`  `/monitor`  `/help`"
         }.get(lang, "")
 
-        await bot.send_message(
+        await message_queue.send(
+            bot,
             chat_id=settings["TELEGRAM_CHAT_ID"],
             text=text + menu,
-            parse_mode="Markdown"
+            parse_mode="Markdown",
+            priority=PRIORITY_NORMAL
         )
         logger.info("✅ [Startup] Telegram-Startmeldung gesendet.")
     except Exception as e:
@@ -92,22 +98,28 @@ async def launch_background_jobs(application: Application):
         logger.error(f"❌ Recap Fehler: {e}")
 
     try:
-        asyncio.create_task(news_scanner_job())
+        start_news_scanner_job(application)
         logger.info("✅ [Startup] News Scanner aktiviert.")
     except Exception as e:
         logger.error(f"❌ News Scanner Fehler: {e}")
 
+    # Ein Scan, mehrere Abnehmer: alle Consumer hängen am Scan Bus des Auto Signal Loops
+    if settings.get("SIGNAL_DELIVERY") == "digest":
+        # Eine gerankte Sammelnachricht pro Zyklus statt einer Nachricht pro Symbol
+        scan_bus.subscribe("signal_digest", digest_consumer)
+        scan_bus.on_cycle_end("signal_digest", partial(flush_digest, application))
+    else:
+        scan_bus.subscribe("live_alerts", partial(dispatch_live_signal, application))
+        scan_bus.subscribe("ultra_signals", partial(ultra_signal_consumer, application))
+
     try:
-        asyncio.create_task(auto_signal_loop(application))
+        job_scheduler.add_service("auto_signal_loop", auto_signal_loop, application)
         logger.info("✅ [Startup] Auto Signal Loop gestartet.")
     except Exception as e:
         logger.error(f"❌ Auto Signal Loop Fehler: {e}")
 
-    try:
-        start_auto_analysis_scheduler(application)
-        logger.info("✅ [Startup] Auto Analysis Scheduler gestartet.")
-    except Exception as e:
-        logger.error(f"❌ Auto Analysis Scheduler Fehler: {e}")
+    # Alle periodischen Jobs laufen über einen zentralen Scheduler
+    job_scheduler.start()
 
 async def execute_startup_tasks(application: Application):
     logger.info("🚀 [Startup] Initialisiere A.R.K. Master-System...")
@@ -13,6 +13,7 @@ import random
 from telegram import Bot
 from bot.utils.logger import setup_logger
 from bot.utils.error_reporter import report_error
+from bot.utils.message_queue import message_queue, PRIORITY_LOW
 
 # === Setup structured logger ===
 logger = setup_logger(__name__)
@@ -54,10 +55,12 @@ async def scale_up(bot: Bot, chat_id: int, load: float):
     Placeholder for scale-up action.
     """
     logger.info(f"⚡ [Autoscaler] Scaling up... Load: {load}")
-    await bot.send_message(
+    await message_queue.send(
+        bot,
         chat_id=chat_id,
         text=f"⚡ *Scaling Up* → Current load: `{load}`\n_More power unlocked._",
-        parse_mode="Markdown"
+        parse_mode="Markdown",
+        priority=PRIORITY_LOW
     )
 
 async def scale_down(bot: Bot, chat_id: int, load: float):
@@ -65,8 +68,10 @@ async def scale_down(bot: Bot, chat_id: int, load: float):
     Placeholder for scale-down action.
     """
     logger.info(f"🧯 [Autoscaler] Scaling down... Load: {load}")
-    await bot.send_message(
+    await message_queue.send(
+        bot,
         chat_id=chat_id,
         text=f"🧯 *Scaling Down* → Current load: `{load}`\n_Limiting tasks to preserve performance._",
-        parse_mode="Markdown"
+        parse_mode="Markdown",
+        priority=PRIORITY_LOW
     )
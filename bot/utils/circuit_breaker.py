@@ -0,0 +1,229 @@
+"""
+A.R.K. Circuit Breaker – Source Health Guard 1.0
+Rollierende Fehler- und Latenzquote pro Datenquelle (Finnhub, Yahoo).
+Offener Breaker → sofort zur gesunden Quelle, Half-Open-Probes stellen die Quelle wieder her.
+
+Made in Bali. Engineered with German Precision.
+"""
+
+import asyncio
+import time
+from collections import deque
+from bot.config.settings import get_settings
+from bot.utils.logger import setup_logger
+
+# === Setup ===
+logger = setup_logger(__name__)
+config = get_settings()
+
+# === States ===
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+class CircuitOpenError(ConnectionError):
+    """Raised when a call is refused because the source's breaker is open."""
+
+class BreakerCall:
+    """
+    One call through a breaker, used as `async with breaker.call(...) as call`.
+
+    Waits for the rate limiter (if given), then times the block. The call
+    counts as a success only if call.ok() was reached; an exception or a
+    missing ok() counts as a failure. Calls cancelled or failed before they
+    reached the source (e.g. while waiting in the limiter) are not recorded
+    and only give the half-open probe slot back.
+    """
+
+    def __init__(self, breaker: "CircuitBreaker", limiter=None, endpoint: str = None, priority: int = None):
+        self.breaker = breaker
+        self.limiter = limiter
+        self.endpoint = endpoint
+        self.priority = priority
+        self.started = None
+        self.latency = 0.0
+        self.healthy = False
+
+    def ok(self) -> None:
+        """Marks the call as a healthy response of the source."""
+        self.healthy = True
+
+    async def __aenter__(self) -> "BreakerCall":
+        if self.limiter is not None:
+            try:
+                if self.priority is None:
+                    await self.limiter.acquire(self.endpoint)
+                else:
+                    await self.limiter.acquire(self.endpoint, priority=self.priority)
+            except BaseException:
+                self.breaker.release_probe()
+                raise
+        self.started = time.monotonic()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        self.latency = time.monotonic() - self.started
+        if exc_type is not None and issubclass(exc_type, asyncio.CancelledError):
+            self.breaker.release_probe()  # Abbruch ist kein Fehler der Quelle
+        elif self.healthy:
+            self.breaker.record_success(self.latency)
+        else:
+            self.breaker.record_failure(self.latency)
+        return False
+
+class CircuitBreaker:
+    """
+    Tracks call outcomes of one data source over a rolling time window.
+
+    The breaker opens when the error rate or the slow-call rate crosses its
+    threshold, refuses calls for a cooldown period and then lets a single
+    probe through (half-open) to decide whether to close again.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        window_sec: float = 60.0,
+        min_calls: int = 5,
+        error_rate: float = 0.5,
+        slow_call_sec: float = 5.0,
+        slow_rate: float = 0.8,
+        open_sec: float = 30.0
+    ):
+        self.name = name
+        self.window_sec = window_sec
+        self.min_calls = min_calls
+        self.error_rate = error_rate
+        self.slow_call_sec = slow_call_sec
+        self.slow_rate = slow_rate
+        self.open_sec = open_sec
+
+        self.state = CLOSED
+        self.opened_at = 0.0
+        self._probe_in_flight = False
+        self._calls = deque()  # (timestamp, ok, latency)
+        self.times_opened = 0
+
+    # === Gatekeeping ===
+    def is_available(self) -> bool:
+        """Read-only check whether the source may currently be used."""
+        if self.state == OPEN:
+            return time.monotonic() - self.opened_at >= self.open_sec
+        return True
+
+    def allow_request(self) -> bool:
+        """
+        Decides whether a call may be made now; admits one probe when half-open.
+
+        Returns:
+            bool: True if the caller may contact the source.
+        """
+        if self.state == CLOSED:
+            return True
+
+        if self.state == OPEN:
+            if time.monotonic() - self.opened_at < self.open_sec:
+                return False
+            self.state = HALF_OPEN
+            self._probe_in_flight = False
+            logger.info(f"🟡 [CircuitBreaker:{self.name}] Half-open – probing source.")
+
+        if self._probe_in_flight:
+            return False
+        self._probe_in_flight = True
+        return True
+
+    def call(self, limiter=None, endpoint: str = None, priority: int = None) -> BreakerCall:
+        """
+        Wraps one source call: limiter wait, timing and outcome recording.
+
+        Args:
+            limiter (RateLimiter, optional): Limiter to acquire before the call.
+            endpoint (str, optional): Limiter endpoint class.
+            priority (int, optional): Limiter lane.
+        """
+        return BreakerCall(self, limiter, endpoint, priority)
+
+    # === Outcome Recording ===
+    def release_probe(self) -> None:
+        """Frees the half-open probe slot of a call that ended without reaching the source (e.g. cancelled)."""
+        if self.state == HALF_OPEN:
+            self._probe_in_flight = False
+
+    def record_success(self, latency: float = 0.0) -> None:
+        if self.state == HALF_OPEN:
+            self._close()
+            return
+        self._record(True, latency)
+
+    def record_failure(self, latency: float = 0.0) -> None:
+        if self.state == HALF_OPEN:
+            self._open("probe failed")
+            return
+        self._record(False, latency)
+
+    def _record(self, ok: bool, latency: float) -> None:
+        now = time.monotonic()
+        self._calls.append((now, ok, latency))
+        while self._calls and now - self._calls[0][0] > self.window_sec:
+            self._calls.popleft()
+
+        if self.state != CLOSED or len(self._calls) < self.min_calls:
+            return
+
+        total = len(self._calls)
+        errors = sum(1 for _, ok_, _ in self._calls if not ok_)
+        slow = sum(1 for _, _, lat in self._calls if lat >= self.slow_call_sec)
+
+        if errors / total >= self.error_rate:
+            self._open(f"error rate {errors}/{total}")
+        elif slow / total >= self.slow_rate:
+            self._open(f"slow calls {slow}/{total}")
+
+    def _open(self, reason: str) -> None:
+        self.state = OPEN
+        self.opened_at = time.monotonic()
+        self._probe_in_flight = False
+        self.times_opened += 1
+        logger.warning(f"🔴 [CircuitBreaker:{self.name}] OPEN ({reason}) – cooldown {self.open_sec:.0f}s.")
+
+    def _close(self) -> None:
+        self.state = CLOSED
+        self._probe_in_flight = False
+        self._calls.clear()
+        logger.info(f"🟢 [CircuitBreaker:{self.name}] Closed – source healthy again.")
+
+    def get_stats(self) -> dict:
+        """Returns state, window size and rolling error rate."""
+        total = len(self._calls)
+        errors = sum(1 for _, ok, _ in self._calls if not ok)
+        return {
+            "state": self.state,
+            "calls_in_window": total,
+            "error_rate": round(errors / total, 2) if total else 0.0,
+            "times_opened": self.times_opened
+        }
+
+# === Registry ===
+_breakers = {}
+
+def get_breaker(name: str) -> CircuitBreaker:
+    """Returns the shared breaker for a data source, creating it on first use."""
+    if name not in _breakers:
+        _breakers[name] = CircuitBreaker(
+            name,
+            window_sec=config.get("BREAKER_WINDOW_SEC", 60),
+            min_calls=config.get("BREAKER_MIN_CALLS", 5),
+            error_rate=config.get("BREAKER_ERROR_RATE", 0.5),
+            slow_call_sec=config.get("BREAKER_SLOW_CALL_SEC", 5.0),
+            open_sec=config.get("BREAKER_OPEN_SEC", 30)
+        )
+    return _breakers[name]
+
+def get_all_breakers() -> dict:
+    """Returns all registered breakers by source name."""
+    return dict(_breakers)
+
+# === Singleton Exports ===
+finnhub_breaker = get_breaker("finnhub")
+yahoo_breaker = get_breaker("yahoo")
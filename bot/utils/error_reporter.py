@@ -7,6 +7,7 @@ import traceback
 from telegram import Bot
 from bot.utils.logger import setup_logger
 from bot.config.settings import get_settings
+from bot.utils.message_queue import message_queue, PRIORITY_NORMAL
 
 # Setup logger
 logger = setup_logger(__name__)
@@ -35,7 +36,7 @@ async def report_error(bot: Bot, chat_id: int, error: Exception, context_info: s
             f"*Traceback:*\n```{tb_clean}```"
         )
 
-        await bot.send_message(chat_id=chat_id, text=error_text, parse_mode="Markdown")
+        await message_queue.send(bot, chat_id=chat_id, text=error_text, priority=PRIORITY_NORMAL, parse_mode="Markdown")
         logger.error(f"[ErrorReporter] Exception reported: {error_safe} | Context: {context_safe}")
 
     except Exception as reporting_error:
@@ -1,47 +1,36 @@
 """
 A.R.K. Holiday Checker – Smart Market Pause Detection 2025.
-Detects fixed and approximated US stock market holidays.
+Detects US stock market holidays via the shared NYSE market calendar.
 
 Built for: API Protection, Efficiency Boost, Market-Aware Execution.
 Made in Bali. Engineered with German Precision.
 """
 
 from datetime import datetime
-import logging
+import pytz
 from bot.utils.logger import setup_logger
+from bot.utils.market_calendar import market_calendar, NY_TZ
 
 # Setup structured logger
 logger = setup_logger(__name__)
 
-# === Static Approximation of Major US Holidays ===
-US_MARKET_HOLIDAYS = {
-    (1, 1): "New Year's Day",
-    (1, 15): "Martin Luther King Jr. Day",
-    (2, 19): "Presidents' Day",
-    (5, 27): "Memorial Day",
-    (7, 4): "Independence Day",
-    (9, 2): "Labor Day",
-    (11, 23): "Thanksgiving Day",
-    (12, 25): "Christmas Day"
-}
-
 def is_us_holiday(now: datetime = None) -> bool:
     """
-    Checks if today matches one of the known US stock market holidays.
+    Checks if today is an NYSE holiday according to the shared market calendar.
 
     Args:
-        now (datetime, optional): Custom datetime (UTC). Defaults to now.
+        now (datetime, optional): Custom datetime (naive = UTC). Defaults to now.
 
     Returns:
         bool: True if today is a holiday.
     """
     now = now or datetime.utcnow()
-    today_tuple = (now.month, now.day)
+    today = (pytz.utc.localize(now) if now.tzinfo is None else now).astimezone(NY_TZ).date()
+    holiday_name = market_calendar.holiday_name(today)
 
-    if today_tuple in US_MARKET_HOLIDAYS:
-        holiday_name = US_MARKET_HOLIDAYS[today_tuple]
-        logger.info(f"🛑 [HolidayChecker] Holiday Detected: {holiday_name} ({today_tuple})")
+    if holiday_name:
+        logger.info(f"🛑 [HolidayChecker] Holiday Detected: {holiday_name} ({today})")
         return True
 
-    logger.debug(f"✅ [HolidayChecker] No holiday today: {today_tuple}")
+    logger.debug(f"✅ [HolidayChecker] No holiday today: {today}")
     return False
@@ -0,0 +1,61 @@
+"""
+A.R.K. HTTP Client – Shared Connection Pool 1.0
+Eine langlebige aiohttp-Session für alle ausgehenden Finnhub-/Yahoo-Aufrufe.
+Keep-Alive Pooling, Per-Host Limits, DNS-Cache und sauberer Shutdown.
+
+Made in Bali. Engineered with German Precision.
+"""
+
+import aiohttp
+from bot.config.settings import get_settings
+from bot.utils.logger import setup_logger
+
+# === Setup ===
+logger = setup_logger(__name__)
+config = get_settings()
+
+# === Pool Settings ===
+POOL_LIMIT = config.get("HTTP_POOL_LIMIT", 20)
+POOL_LIMIT_PER_HOST = config.get("HTTP_POOL_LIMIT_PER_HOST", 8)
+DNS_CACHE_TTL = 300       # Sekunden
+KEEPALIVE_TIMEOUT = 60    # Sekunden
+DEFAULT_TIMEOUT = aiohttp.ClientTimeout(total=config.get("HTTP_TIMEOUT_SEC", 10))
+
+# === Application-Scoped Session ===
+_session: aiohttp.ClientSession | None = None
+
+def get_http_session() -> aiohttp.ClientSession:
+    """
+    Returns the shared HTTP session, creating it lazily on first use.
+
+    Must be called from inside the running event loop.
+
+    Returns:
+        aiohttp.ClientSession: Pooled session reused by every outbound call.
+    """
+    global _session
+
+    if _session is None or _session.closed:
+        connector = aiohttp.TCPConnector(
+            limit=POOL_LIMIT,
+            limit_per_host=POOL_LIMIT_PER_HOST,
+            ttl_dns_cache=DNS_CACHE_TTL,
+            keepalive_timeout=KEEPALIVE_TIMEOUT,
+        )
+        _session = aiohttp.ClientSession(connector=connector, timeout=DEFAULT_TIMEOUT)
+        logger.info(
+            f"🌐 [HTTPClient] Session opened | Pool: {POOL_LIMIT} | Per Host: {POOL_LIMIT_PER_HOST}"
+        )
+
+    return _session
+
+async def close_http_session() -> None:
+    """
+    Closes the shared session and releases all pooled connections.
+    """
+    global _session
+
+    if _session is not None and not _session.closed:
+        await _session.close()
+        logger.info("🛑 [HTTPClient] Session closed.")
+    _session = None
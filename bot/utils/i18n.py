@@ -1,10 +1,14 @@
 """
 A.R.K. Internationalization (i18n) Engine – Human-Grade Localization.
 Provides full multilingual translations for all core functions.
+Signal templates are resolved once per language into formatters; finished renderings are cached per (signal, language).
 Made in Bali. Engineered with German Precision.
 """
 
 import logging
+import re
+from collections import OrderedDict
+from functools import wraps
 from bot.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
@@ -67,6 +71,22 @@ translations = {
         "detected_patterns": "Detected Patterns",
         "signal_footer": "This signal was generated by the A.R.K. analysis engine.",
 
+        # === Live Signals ===
+        "live_signal_header": "A.R.K. Live Signal!",
+        "live_signal_direction": "Direction",
+        "live_signal_score": "Signal Score",
+        "live_signal_rating": "Rating",
+        "live_signal_price": "Price",
+        "live_signal_bar": "Signal Bar",
+        "live_signal_today": "today",
+        "live_signal_footer": "Markets move fast. Be precise. Be ready.",
+
+        # === Signal Digest ===
+        "digest_header": "A.R.K. Signal Digest",
+        "digest_cycle": "Cycle",
+        "digest_signals": "signal(s), strongest first",
+        "digest_score": "Score",
+
         # === Volatility Alerts ===
         "volatility_alert_header": "⚠️ *Volatility Alert Detected!*",
         "volatility_alert_move": "Price Move",
@@ -143,6 +163,22 @@ translations = {
         "detected_patterns": "Erkannte Muster",
         "signal_footer": "Dieses Signal wurde vom A.R.K.-Analysemodul generiert.",
 
+        # === Live Signals ===
+        "live_signal_header": "A.R.K. Live-Signal!",
+        "live_signal_direction": "Richtung",
+        "live_signal_score": "Signal-Score",
+        "live_signal_rating": "Bewertung",
+        "live_signal_price": "Preis",
+        "live_signal_bar": "Signalbalken",
+        "live_signal_today": "heute",
+        "live_signal_footer": "Märkte bewegen sich schnell. Sei präzise. Sei bereit.",
+
+        # === Signal Digest ===
+        "digest_header": "A.R.K. Signal-Übersicht",
+        "digest_cycle": "Zyklus",
+        "digest_signals": "Signal(e), stärkste zuerst",
+        "digest_score": "Score",
+
         # === Volatility Alerts ===
         "volatility_alert_header": "⚠️ *Volatilitätsalarm erkannt!*",
         "volatility_alert_move": "Kursbewegung",
@@ -177,3 +213,86 @@ def get_text(key: str, lang: str = "en") -> str:
     except Exception as e:
         logger.error(f"[i18n] Fatal translation error: {e}")
         return f"⚠️ Translation Error: {key}"
+
+# === Precompiled Templates ===
+_LABEL = re.compile(r"\{t:(\w+)\}")
+RENDER_CACHE_SIZE = 512
+
+class TemplateSet:
+    """
+    Named message templates with {t:key} translation labels.
+
+    Calling the set with a language returns name → str.format of the template
+    with all labels already substituted; this happens once per language.
+    Remaining {fields} are filled at render time.
+    """
+
+    def __init__(self, **sources: str):
+        self.sources = sources
+        self._compiled = {}  # lang → {name: formatter}
+
+    def __call__(self, lang: str) -> dict:
+        lang = lang if lang in SUPPORTED_LANGUAGES else "en"
+        compiled = self._compiled.get(lang)
+        if compiled is None:
+            compiled = self._compiled[lang] = {
+                name: _LABEL.sub(lambda match: get_text(match.group(1), lang), source).format
+                for name, source in self.sources.items()
+            }
+        return compiled
+
+# === Render Cache ===
+class RenderCache:
+    """LRU cache of finished message renderings, keyed by builder, arguments and language."""
+
+    def __init__(self, maxsize: int = RENDER_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_render(self, key: tuple, build) -> str:
+        text = self._entries.get(key)
+        if text is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return text
+
+        self.misses += 1
+        text = build()
+        self._entries[key] = text
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return text
+
+    def get_stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total * 100, 1) if total else 0.0
+        }
+
+render_cache = RenderCache()
+
+def _freeze(value):
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    hash(value)  # TypeError für alles Unhashbare → Rendering ohne Cache
+    return value
+
+def cached_render(builder):
+    """
+    Caches a message builder's output per argument set; the language must be one of its arguments.
+    """
+    @wraps(builder)
+    def wrapper(*args, **kwargs):
+        try:
+            key = (builder.__qualname__, _freeze(args), _freeze(kwargs))
+        except TypeError:
+            return builder(*args, **kwargs)
+        return render_cache.get_or_render(key, lambda: builder(*args, **kwargs))
+    return wrapper
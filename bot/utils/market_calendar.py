@@ -0,0 +1,183 @@
+"""
+A.R.K. Market Calendar – NYSE Session Calendar 1.0
+Einmal vorberechnete Handelstage, Feiertage und verkürzte Sessions (13:00 Uhr NY) als Epoch-Sekunden.
+Alle Lookups O(1) bzw. per Bisect – Markt-Jobs schlafen bis zur nächsten Eröffnung statt zu pollen.
+
+Made in Bali. Engineered with German Precision.
+"""
+
+import asyncio
+import bisect
+import time
+from datetime import date, datetime, time as dtime, timedelta
+import holidays
+import pytz
+from bot.config.settings import get_settings
+from bot.utils.logger import setup_logger
+
+# === Setup ===
+logger = setup_logger(__name__)
+config = get_settings()
+
+NY_TZ = pytz.timezone("America/New_York")
+MARKET_OPEN = dtime(9, 30)
+MARKET_CLOSE = dtime(16, 0)
+HALF_DAY_CLOSE = dtime(13, 0)
+YEARS_AHEAD = 2
+
+class MarketCalendar:
+    """
+    Precomputed NYSE sessions.
+
+    Every trading day maps to its (open, close) epoch seconds; holidays come
+    from the NYSE calendar of the `holidays` package, early closes follow the
+    exchange rules (July 3rd, day after Thanksgiving, Christmas Eve).
+    """
+
+    def __init__(self, first_year: int = None, years_ahead: int = YEARS_AHEAD):
+        first_year = first_year or datetime.now(NY_TZ).year - 1
+        self._build(first_year, datetime.now(NY_TZ).year + years_ahead)
+
+    def _build(self, first_year: int, last_year: int) -> None:
+        self.first_year, self.last_year = first_year, last_year
+        self._holidays = holidays.NYSE(years=range(first_year, last_year + 1))
+        self._sessions = {}  # date → (open_ts, close_ts)
+        self._half_days = set()
+
+        day = date(first_year, 1, 1)
+        while day.year <= last_year:
+            if day.weekday() < 5 and day not in self._holidays:
+                early = self._is_early_close(day)
+                if early:
+                    self._half_days.add(day)
+                self._sessions[day] = (_epoch(day, MARKET_OPEN), _epoch(day, HALF_DAY_CLOSE if early else MARKET_CLOSE))
+            day += timedelta(days=1)
+
+        self._opens = sorted(open_ts for open_ts, _ in self._sessions.values())
+        self._closes = sorted(close_ts for _, close_ts in self._sessions.values())
+        logger.info(
+            f"📅 [MarketCalendar] {len(self._sessions)} sessions {first_year}–{last_year} | "
+            f"{len(self._half_days)} half day(s)"
+        )
+
+    @staticmethod
+    def _is_early_close(day: date) -> bool:
+        if day.month == 7 and day.day == 3:
+            return True
+        if day.month == 12 and day.day == 24:
+            return True
+        # Freitag nach Thanksgiving (4. Donnerstag im November)
+        return day.month == 11 and day.weekday() == 4 and 23 <= day.day <= 29
+
+    def _ensure(self, day: date) -> None:
+        if not self.first_year <= day.year <= self.last_year:
+            self._build(min(self.first_year, day.year), max(self.last_year, day.year + 1))
+
+    # === Lookups ===
+    def session(self, day: date) -> tuple | None:
+        """Returns (open_ts, close_ts) of a trading day, None if the market is closed all day."""
+        self._ensure(day)
+        return self._sessions.get(day)
+
+    def is_trading_day(self, day: date) -> bool:
+        return self.session(day) is not None
+
+    def is_half_day(self, day: date) -> bool:
+        self._ensure(day)
+        return day in self._half_days
+
+    def holiday_name(self, day: date) -> str | None:
+        self._ensure(day)
+        return self._holidays.get(day)
+
+    def is_open(self, ts: float = None) -> bool:
+        """True while a regular session is running."""
+        ts = ts if ts is not None else time.time()
+        session = self.session(datetime.fromtimestamp(ts, NY_TZ).date())
+        return session is not None and session[0] <= ts < session[1]
+
+    def next_open(self, ts: float = None) -> float:
+        """Epoch second of the next session open after ts (ts itself if it is an open)."""
+        ts = ts if ts is not None else time.time()
+        self._ensure(datetime.fromtimestamp(ts, NY_TZ).date() + timedelta(days=14))
+        return self._opens[bisect.bisect_left(self._opens, ts)]
+
+    def next_close(self, ts: float = None) -> float:
+        """Epoch second of the next session close after ts."""
+        ts = ts if ts is not None else time.time()
+        self._ensure(datetime.fromtimestamp(ts, NY_TZ).date() + timedelta(days=14))
+        return self._closes[bisect.bisect_right(self._closes, ts)]
+
+    def seconds_until_open(self, ts: float = None) -> float:
+        """0 while the market is open, otherwise seconds until the next open."""
+        ts = ts if ts is not None else time.time()
+        return 0.0 if self.is_open(ts) else self.next_open(ts) - ts
+
+    # === Job Control ===
+    async def wait_for_session(self, job: str, lead_sec: float = 0.0) -> float:
+        """
+        Suspends the calling job until lead_sec before the next session open.
+
+        Returns immediately while the market is open, inside the lead window,
+        or when MARKET_HOURS_ONLY is disabled.
+
+        Returns:
+            float: Seconds slept.
+        """
+        if not config.get("MARKET_HOURS_ONLY", True):
+            return 0.0
+
+        now = time.time()
+        if self.is_open(now):
+            return 0.0
+
+        wake_at = self.next_open(now) - lead_sec
+        if wake_at <= now:
+            return 0.0
+
+        logger.info(
+            f"🌙 [MarketCalendar] {job} suspended until "
+            f"{datetime.fromtimestamp(wake_at, NY_TZ).strftime('%a %Y-%m-%d %H:%M')} NY ({(wake_at - now) / 3600:.1f}h)"
+        )
+        await asyncio.sleep(wake_at - now)
+        return wake_at - now
+
+    def bar_in_session(self, ts: float, bar_sec: float) -> bool:
+        """
+        True if the latest bar closed by ts (a bar of bar_sec seconds) lies
+        completely inside a session – i.e. a scan at ts sees session data.
+        """
+        return self.is_open(ts - 1) and self.is_open(ts - bar_sec)
+
+    async def wait_for_bar(self, job: str, bar_sec: float, offset_sec: float = 0.0) -> float:
+        """
+        Suspends the calling job until the first bar of the next session has
+        closed (open + bar_sec + offset_sec).
+
+        Returns immediately while a session bar is due (including the final bar
+        right after the close) or when MARKET_HOURS_ONLY is disabled.
+
+        Returns:
+            float: Seconds slept.
+        """
+        if not config.get("MARKET_HOURS_ONLY", True):
+            return 0.0
+
+        now = time.time()
+        if self.bar_in_session(now - offset_sec, bar_sec):
+            return 0.0
+
+        wake_at = self.next_open(now - offset_sec - bar_sec) + bar_sec + offset_sec
+        logger.info(
+            f"🌙 [MarketCalendar] {job} suspended until "
+            f"{datetime.fromtimestamp(wake_at, NY_TZ).strftime('%a %Y-%m-%d %H:%M:%S')} NY ({(wake_at - now) / 3600:.1f}h, first bar close)"
+        )
+        await asyncio.sleep(max(wake_at - now, 0))
+        return max(wake_at - now, 0)
+
+# === Helpers ===
+def _epoch(day: date, at: dtime) -> float:
+    return NY_TZ.localize(datetime.combine(day, at)).timestamp()
+
+# === Singleton Export ===
+market_calendar = MarketCalendar()
@@ -7,22 +7,13 @@ Made in Bali. Engineered with German Precision.
 """
 
 from datetime import datetime, time
-import pytz
-import holidays
 from bot.utils.logger import setup_logger
+from bot.utils.market_calendar import market_calendar, NY_TZ, MARKET_OPEN, MARKET_CLOSE
 
 # === Logger Setup ===
 logger = setup_logger(__name__)
 
-# === US Market Timezone (New York) ===
-NY_TZ = pytz.timezone("America/New_York")
-
-# === US Public Holidays ===
-US_HOLIDAYS = holidays.US()
-
 # === Trading Session Times (NYSE / NASDAQ) ===
-MARKET_OPEN = time(9, 30)
-MARKET_CLOSE = time(16, 0)
 PREMARKET_WARNING_START = time(9, 15)
 
 def get_now_est() -> datetime:
@@ -33,24 +24,21 @@ def get_now_est() -> datetime:
 
 def is_trading_day(now: datetime = None) -> bool:
     """
-    Checks if the current day is a valid trading day (Mon–Fri, not a US holiday).
+    Checks if the current day is a valid trading day (Mon–Fri, not an NYSE holiday).
     """
     now = now or get_now_est()
-    is_weekday = now.weekday() < 5
-    is_not_holiday = now.date() not in US_HOLIDAYS
-
-    result = is_weekday and is_not_holiday
+    result = market_calendar.is_trading_day(now.date())
     logger.debug(f"[MarketTime] Trading Day: {result} | {now.strftime('%A %Y-%m-%d')}")
     return result
 
 def is_trading_hours(now: datetime = None) -> bool:
     """
-    Checks if the current NY time is between 9:30 and 16:00.
+    Checks if the current NY time is within today's session (9:30–16:00, 13:00 on half days).
     """
     now = now or get_now_est()
     current_time = now.time()
 
-    result = MARKET_OPEN <= current_time <= MARKET_CLOSE
+    result = market_calendar.is_open(now.timestamp())
     logger.debug(f"[MarketTime] Trading Hours: {result} | {current_time}")
     return result
 
@@ -0,0 +1,299 @@
+"""
+A.R.K. Message Queue – Outbound Telegram Dispatcher 1.0
+Alle ausgehenden Nachrichten laufen durch eine Queue: globaler und Pro-Chat-Token-Bucket, Prioritäten (Alerts vor Heartbeats),
+RetryAfter wird respektiert, Netzwerkfehler mit Backoff wiederholt, Alert-Bursts pro Chat zu einer Nachricht gebündelt.
+
+Made in Bali. Engineered with German Precision.
+"""
+
+import asyncio
+import heapq
+import itertools
+import time
+from telegram import Bot
+from telegram.error import RetryAfter, BadRequest, Forbidden, NetworkError, TelegramError
+from bot.config.settings import get_settings
+from bot.utils.logger import setup_logger
+from bot.utils.rate_limiter import TokenBucket
+
+# === Setup ===
+logger = setup_logger(__name__)
+config = get_settings()
+
+# === Priorities (kleiner = wichtiger) ===
+PRIORITY_ALERT = 0    # Signale, Breaking News
+PRIORITY_NORMAL = 1   # Recaps, Fehlerberichte, Startmeldung
+PRIORITY_LOW = 2      # Heartbeats, Watchdog
+
+PRIORITY_NAMES = {PRIORITY_ALERT: "alert", PRIORITY_NORMAL: "normal", PRIORITY_LOW: "low"}
+
+MAX_MESSAGE_LENGTH = 4096
+BATCH_SEPARATOR = "\n\n━━━━━━━━━━\n\n"
+MAX_BACKOFF_SEC = 30
+
+class OutboundMessage:
+    """One queued send_message call."""
+
+    __slots__ = ("bot", "chat_id", "text", "priority", "batch", "kwargs", "future", "enqueued_at", "not_before", "attempts")
+
+    def __init__(self, bot: Bot, chat_id: int, text: str, priority: int, batch: bool, kwargs: dict):
+        self.bot = bot
+        self.chat_id = chat_id
+        self.text = text
+        self.priority = priority
+        self.batch = batch
+        self.kwargs = kwargs
+        self.future = asyncio.get_running_loop().create_future()
+        self.enqueued_at = time.monotonic()
+        self.not_before = 0.0
+        self.attempts = 0
+
+class MessageQueue:
+    """
+    Priority queue in front of bot.send_message.
+
+    A message is sent when the global bucket and its chat's bucket both have
+    a token; each chat has at most one send in flight, so messages to one
+    chat keep their order. Batchable messages of the same chat, priority and
+    format are joined up to Telegram's 4096-character limit.
+    """
+
+    def __init__(self, global_rate_per_sec: float, chat_rate_per_min: float, max_retries: int):
+        self.global_bucket = TokenBucket(global_rate_per_sec * 60, capacity=global_rate_per_sec)
+        self.chat_rate_per_min = chat_rate_per_min
+        self.max_retries = max_retries
+        self._chat_buckets = {}   # chat_id → TokenBucket
+        self._heap = []           # (priority, seq, OutboundMessage)
+        self._seq = itertools.count()
+        self._inflight = set()    # chat_ids mit laufendem Send
+        self._wakeup = asyncio.Event()
+        self._dispatcher = None
+        self._closed = False
+        # === Metrics ===
+        self.sent = 0
+        self.failed = 0
+        self.retries = 0
+        self.retry_after_hits = 0
+        self.batched = 0
+        self.total_latency = 0.0
+        self.total_send_time = 0.0
+
+    # === Public API ===
+    async def send(self, bot: Bot, chat_id: int, text: str, priority: int = PRIORITY_NORMAL,
+                   batch: bool = False, wait: bool = False, **kwargs):
+        """
+        Queues a message for chat_id.
+
+        Args:
+            bot (Bot): Bot used for sending.
+            chat_id (int): Target chat.
+            text (str): Message text.
+            priority (int): PRIORITY_ALERT, PRIORITY_NORMAL or PRIORITY_LOW.
+            batch (bool): May be joined with other queued batchable messages of the chat.
+            wait (bool): Wait for delivery and return the sent Message (or raise).
+            **kwargs: Further send_message arguments (parse_mode, ...).
+        """
+        if self._closed:
+            logger.warning(f"⚠️ [MessageQueue] Closed – message to {chat_id} dropped.")
+            return None
+
+        message = OutboundMessage(bot, chat_id, text, priority, batch, kwargs)
+        self._push(message)
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.ensure_future(self._dispatch())
+        return await message.future if wait else None
+
+    def _push(self, message: OutboundMessage) -> None:
+        heapq.heappush(self._heap, (message.priority, next(self._seq), message))
+        self._wakeup.set()
+
+    # === Dispatching ===
+    def _chat_bucket(self, chat_id: int) -> TokenBucket:
+        bucket = self._chat_buckets.get(chat_id)
+        if bucket is None:
+            bucket = self._chat_buckets[chat_id] = TokenBucket(self.chat_rate_per_min, capacity=3)
+        return bucket
+
+    def _next_ready(self, now: float) -> tuple:
+        """Returns (message, seconds to wait) for the most important sendable message."""
+        head = self._heap[0][2]
+        if head.chat_id not in self._inflight and head.not_before <= now and self._chat_bucket(head.chat_id).available():
+            return head, 0.0  # Normalfall beim Fan-out: kein Sortieren der ganzen Queue
+
+        wait = None
+        for _, _, message in sorted(self._heap):
+            if message.chat_id in self._inflight:
+                continue
+            if message.not_before > now:
+                delay = message.not_before - now
+            else:
+                delay = self._chat_bucket(message.chat_id).wait_time()
+                if delay == 0:
+                    return message, 0.0
+            wait = delay if wait is None else min(wait, delay)
+        return None, wait
+
+    async def _dispatch(self) -> None:
+        while self._heap or self._inflight:
+            if not self._heap:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            if not self.global_bucket.available():
+                await asyncio.sleep(self.global_bucket.wait_time())
+                continue
+
+            message, wait = self._next_ready(time.monotonic())
+            if message is None:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=wait)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            if self._heap[0][2] is message:
+                heapq.heappop(self._heap)
+            else:
+                self._heap = [entry for entry in self._heap if entry[2] is not message]
+                heapq.heapify(self._heap)
+            group = self._collect_batch(message)
+
+            self.global_bucket.take()
+            self._chat_bucket(message.chat_id).take()
+            self._inflight.add(message.chat_id)
+            asyncio.ensure_future(self._deliver(group))
+
+    def _collect_batch(self, first: OutboundMessage) -> list:
+        """Removes and returns the batchable messages that can share one send with `first`."""
+        if not first.batch:
+            return [first]
+
+        group, length = [first], len(first.text)
+        same_chat = sorted(entry for entry in self._heap if entry[2].chat_id == first.chat_id and entry[2].batch)
+        for entry in same_chat:
+            candidate = entry[2]
+            if (
+                candidate.priority == first.priority and candidate.kwargs == first.kwargs
+                and candidate.not_before <= time.monotonic()
+                and length + len(BATCH_SEPARATOR) + len(candidate.text) <= MAX_MESSAGE_LENGTH
+            ):
+                group.append(candidate)
+                length += len(BATCH_SEPARATOR) + len(candidate.text)
+        if len(group) > 1:
+            members = {id(m) for m in group[1:]}
+            self._heap = [entry for entry in self._heap if id(entry[2]) not in members]
+            heapq.heapify(self._heap)
+            self.batched += len(group) - 1
+        return group
+
+    async def _deliver(self, group: list) -> None:
+        head = group[0]
+        text = BATCH_SEPARATOR.join(m.text for m in group)
+        started = time.monotonic()
+        try:
+            head.attempts += 1
+            sent = await head.bot.send_message(chat_id=head.chat_id, text=text, **head.kwargs)
+            self.sent += len(group)
+            self.total_send_time += time.monotonic() - started
+            for message in group:
+                self.total_latency += time.monotonic() - message.enqueued_at
+                if not message.future.done():
+                    message.future.set_result(sent)
+
+        except RetryAfter as e:
+            self.retry_after_hits += 1
+            logger.warning(f"⏳ [MessageQueue] RetryAfter {e.retry_after}s for chat {head.chat_id}")
+            self._requeue(group, float(e.retry_after), e)
+
+        except BadRequest as e:
+            if len(group) > 1:
+                # Eine fehlerhafte Nachricht soll nicht die ganze Sammelnachricht mitreißen
+                logger.warning(f"⚠️ [MessageQueue] Batch of {len(group)} rejected for chat {head.chat_id} – resending individually: {e}")
+                for message in group:
+                    message.batch = False
+                    self._push(message)
+            else:
+                self._fail(group, e)
+
+        except Forbidden as e:
+            self._fail(group, e)
+
+        except (NetworkError, asyncio.TimeoutError) as e:
+            backoff = min(2 ** head.attempts, MAX_BACKOFF_SEC)
+            logger.warning(f"🌐 [MessageQueue] {type(e).__name__} for chat {head.chat_id} – retry in {backoff}s")
+            self._requeue(group, backoff, e)
+
+        except TelegramError as e:
+            self._fail(group, e)
+
+        except Exception as e:
+            # z. B. RuntimeError eines bereits heruntergefahrenen Bots – Futures nie offen lassen
+            self._fail(group, e)
+
+        finally:
+            self._inflight.discard(head.chat_id)
+            self._wakeup.set()
+
+    def _requeue(self, group: list, delay: float, error: Exception) -> None:
+        head = group[0]
+        if head.attempts >= self.max_retries:
+            self._fail(group, error)
+            return
+        self.retries += 1
+        # Teile einer Sammelnachricht gehen einzeln zurück und werden ggf. neu gebündelt
+        for message in group:
+            message.attempts = head.attempts
+            message.not_before = time.monotonic() + delay
+            self._push(message)
+
+    def _fail(self, group: list, error: Exception) -> None:
+        self.failed += len(group)
+        logger.error(f"❌ [MessageQueue] Send to {group[0].chat_id} failed after {group[0].attempts} attempt(s): {error}")
+        for message in group:
+            if not message.future.done():
+                message.future.set_exception(error)
+                message.future.exception()  # gilt als abgerufen, auch wenn niemand wartet
+
+    # === Lifecycle ===
+    async def shutdown(self, timeout: float = 5.0) -> None:
+        """Stops accepting messages and gives queued ones up to `timeout` seconds to go out."""
+        self._closed = True
+        if self._dispatcher is not None and not self._dispatcher.done():
+            try:
+                await asyncio.wait_for(asyncio.shield(self._dispatcher), timeout=timeout)
+            except asyncio.TimeoutError:
+                logger.warning(f"⚠️ [MessageQueue] {len(self._heap)} message(s) dropped at shutdown.")
+                self._dispatcher.cancel()
+                if self._heap:
+                    self._fail([entry[2] for entry in self._heap], asyncio.TimeoutError("message queue shut down"))
+                    self._heap.clear()
+
+    def get_stats(self) -> dict:
+        depth = {name: 0 for name in PRIORITY_NAMES.values()}
+        for priority, _, _ in self._heap:
+            depth[PRIORITY_NAMES.get(priority, str(priority))] += 1
+        return {
+            "queued": len(self._heap),
+            "depth": depth,
+            "in_flight": len(self._inflight),
+            "sent": self.sent,
+            "failed": self.failed,
+            "retries": self.retries,
+            "retry_after": self.retry_after_hits,
+            "batched": self.batched,
+            "avg_latency_sec": round(self.total_latency / self.sent, 3) if self.sent else 0.0,
+            "avg_send_sec": round(self.total_send_time / self.sent, 3) if self.sent else 0.0
+        }
+
+# === Singleton Export ===
+message_queue = MessageQueue(
+    global_rate_per_sec=config.get("TELEGRAM_GLOBAL_RATE_PER_SEC", 25),
+    chat_rate_per_min=config.get("TELEGRAM_CHAT_RATE_PER_MIN", 20),
+    max_retries=config.get("TELEGRAM_MAX_RETRIES", 5)
+)
+
+async def send_message(bot: Bot, chat_id: int, text: str, priority: int = PRIORITY_NORMAL, **kwargs):
+    """Externer Shortcut für message_queue.send()."""
+    return await message_queue.send(bot, chat_id, text, priority=priority, **kwargs)
@@ -9,6 +9,9 @@ Made in Bali. Engineered with German Precision.
 import aiohttp
 from bot.config.settings import get_settings
 from bot.utils.logger import setup_logger
+from bot.utils.http_client import get_http_session
+from bot.utils.rate_limiter import finnhub_limiter, PRIORITY_NEWS
+from bot.utils.circuit_breaker import finnhub_breaker, CLOSED, OPEN
 
 # === Setup Logger and Config ===
 logger = setup_logger(__name__)
@@ -18,41 +21,47 @@ config = get_settings()
 FINNHUB_API_KEY = config.get("FINNHUB_API_KEY")
 FINNHUB_ENDPOINT = f"https://finnhub.io/api/v1/news?category=general&token={FINNHUB_API_KEY}"
 
-# === Global Health State ===
-_finnhub_healthy = True
+# === Health State ===
+# Geteilt mit dem Data Loader: ein Circuit Breaker pro Quelle statt eigenem Flag.
 
 def use_finnhub() -> bool:
     """
     Determines whether Finnhub should be used as the active news source.
 
     Returns:
-        bool: True if Finnhub is healthy, False if fallback (Yahoo Finance) is active.
+        bool: True if the Finnhub breaker admits calls, False if fallback (Yahoo Finance) is active.
     """
-    return _finnhub_healthy
+    return finnhub_breaker.is_available()
 
 async def check_finnhub_health(timeout_sec: int = 5) -> None:
     """
     Pings Finnhub API to verify availability.
-    Updates internal status and triggers source switching if necessary.
+    Feeds the outcome into the shared Finnhub circuit breaker; acts as the
+    half-open probe once an open breaker's cooldown has elapsed.
 
     Args:
         timeout_sec (int): Timeout for the API health check.
     """
-    global _finnhub_healthy
+    if not finnhub_breaker.allow_request():
+        logger.debug("⏸️ [News Health] Finnhub breaker open – health probe deferred.")
+        return
+
+    previous = finnhub_breaker.state
 
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(FINNHUB_ENDPOINT, timeout=timeout_sec) as response:
+        async with finnhub_breaker.call(finnhub_limiter, "news", PRIORITY_NEWS) as call:
+            session = get_http_session()
+            timeout = aiohttp.ClientTimeout(total=timeout_sec)
+            async with session.get(FINNHUB_ENDPOINT, timeout=timeout) as response:
                 if response.status == 200:
-                    if not _finnhub_healthy:
-                        logger.info("✅ [News Health] Finnhub API back online. Switching primary source to Finnhub.")
-                    _finnhub_healthy = True
+                    call.ok()
                 else:
-                    if _finnhub_healthy:
-                        logger.warning(f"⚠️ [News Health] Finnhub error {response.status}. Switching to Yahoo Finance.")
-                    _finnhub_healthy = False
+                    logger.warning(f"⚠️ [News Health] Finnhub error {response.status}.")
 
     except Exception as e:
-        if _finnhub_healthy:
-            logger.error(f"❌ [News Health] Finnhub unavailable: {e}. Switching to Yahoo Finance fallback.")
-        _finnhub_healthy = False
+        logger.error(f"❌ [News Health] Finnhub unavailable: {e}.")
+
+    if previous != CLOSED and finnhub_breaker.state == CLOSED:
+        logger.info("✅ [News Health] Finnhub API back online. Switching primary source to Finnhub.")
+    elif previous != OPEN and finnhub_breaker.state == OPEN:
+        logger.warning("⚠️ [News Health] Finnhub breaker opened. Switching to Yahoo Finance.")
@@ -7,9 +7,28 @@ Delivers multilingual, psychologically-optimized signal alerts for elite executi
 Made in Bali. Engineered with German Precision.
 """
 
-from bot.utils.i18n import get_text
+from bot.utils.i18n import TemplateSet, cached_render
 from bot.utils.language import get_language
 
+# === Templates (Labels einmal pro Sprache aufgelöst) ===
+TEMPLATES = TemplateSet(
+    confidence_ultra="{t:notification_confidence_ultra}",
+    confidence_high="{t:notification_confidence_high}",
+    confidence_moderate="{t:notification_confidence_moderate}",
+    confidence_low="{t:notification_confidence_low}",
+    body=(
+        "{headline_emoji} *{t:notification_title}*\n\n"
+        "*{t:symbol}:* `{symbol}`\n"
+        "*{t:move}:* `{move_percent:.2f}%`\n"
+        "*{t:volume_spike}:* `{volume_spike:.2f}%`\n"
+        "*{t:trend}:* {trend_emoji} `{trend_direction}`\n"
+        "*{t:confidence}:* `{confidence:.1f}%`\n"
+        "*{t:risk_reward}:* `{risk_reward}`\n\n"
+        "{confidence_label}\n\n"
+        "{t:notification_footer}"
+    )
+)
+
 def build_trading_signal_notification(
     symbol: str,
     action: str,
@@ -18,7 +37,8 @@ def build_trading_signal_notification(
     trend_direction: str,
     confidence: float,
     risk_reward: str,
-    chat_id: int = None
+    chat_id: int = None,
+    lang: str = None
 ) -> str:
     """
     Builds a professional-grade, multilingual trading signal notification.
@@ -32,38 +52,42 @@ def build_trading_signal_notification(
         confidence (float): Confidence score (0–100)
         risk_reward (str): Estimated RRR (e.g. "2.1R")
         chat_id (int): Optional – for language resolution
+        lang (str): Optional – language code, skips the chat lookup
 
     Returns:
         str: Fully formatted notification message
     """
+    lang = lang or get_language(chat_id) or "en"
+    return _render_notification(symbol, action, move_percent, volume_spike, trend_direction, confidence, risk_reward, lang)
 
-    lang = get_language(chat_id) or "en"
+@cached_render
+def _render_notification(symbol, action, move_percent, volume_spike, trend_direction, confidence, risk_reward, lang) -> str:
+    t = TEMPLATES(lang)
 
     # === Confidence Labeling ===
     if confidence >= 90:
-        confidence_label = get_text("notification_confidence_ultra", lang)
+        confidence_label = t["confidence_ultra"]()
     elif confidence >= 75:
-        confidence_label = get_text("notification_confidence_high", lang)
+        confidence_label = t["confidence_high"]()
     elif confidence >= 60:
-        confidence_label = get_text("notification_confidence_moderate", lang)
+        confidence_label = t["confidence_moderate"]()
     else:
-        confidence_label = get_text("notification_confidence_low", lang)
+        confidence_label = t["confidence_low"]()
 
     # === Emoji Reinforcement ===
     headline_emoji = "🚀" if action.startswith("Long") else "🔻"
     trend_emoji = "📈" if trend_direction.lower().startswith("bull") else "📉"
 
     # === Assemble Message ===
-    message = (
-        f"{headline_emoji} *{get_text('notification_title', lang).format(action=action)}*\n\n"
-        f"*{get_text('symbol', lang)}:* `{symbol}`\n"
-        f"*{get_text('move', lang)}:* `{move_percent:.2f}%`\n"
-        f"*{get_text('volume_spike', lang)}:* `{volume_spike:.2f}%`\n"
-        f"*{get_text('trend', lang)}:* {trend_emoji} `{trend_direction}`\n"
-        f"*{get_text('confidence', lang)}:* `{confidence:.1f}%`\n"
-        f"*{get_text('risk_reward', lang)}:* `{risk_reward}`\n\n"
-        f"{confidence_label}\n\n"
-        f"{get_text('notification_footer', lang)}"
+    return t["body"](
+        headline_emoji=headline_emoji,
+        action=action,
+        symbol=symbol,
+        move_percent=move_percent,
+        volume_spike=volume_spike,
+        trend_emoji=trend_emoji,
+        trend_direction=trend_direction,
+        confidence=confidence,
+        risk_reward=risk_reward,
+        confidence_label=confidence_label
     )
-
-    return message
@@ -0,0 +1,159 @@
+"""
+A.R.K. Rate Limiter – Finnhub Quota Scheduler 1.0
+Client-seitige Token-Buckets pro Endpoint-Klasse (candles, news, quote) plus globales API-Key-Budget.
+Prioritätsspuren: /analyse vor Hintergrund-Scans, Scans vor News. Wartet statt zu scheitern.
+
+Made in Bali. Engineered with German Precision.
+"""
+
+import asyncio
+import itertools
+import time
+from bot.config.settings import get_settings
+from bot.utils.logger import setup_logger
+
+# === Setup ===
+logger = setup_logger(__name__)
+config = get_settings()
+
+# === Priority Lanes (kleiner = wichtiger) ===
+PRIORITY_INTERACTIVE = 0
+PRIORITY_SCAN = 1
+PRIORITY_NEWS = 2
+
+LANE_NAMES = {
+    PRIORITY_INTERACTIVE: "interactive",
+    PRIORITY_SCAN: "scan",
+    PRIORITY_NEWS: "news",
+}
+
+class TokenBucket:
+    """
+    Classic token bucket refilled continuously at a fixed rate.
+    """
+
+    def __init__(self, rate_per_min: float, capacity: float):
+        self.rate = rate_per_min / 60.0
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def available(self) -> bool:
+        self._refill()
+        return self.tokens >= 1
+
+    def take(self) -> None:
+        self.tokens -= 1
+
+    def wait_time(self) -> float:
+        """Seconds until the next token is available."""
+        self._refill()
+        return 0.0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+
+class RateLimiter:
+    """
+    Grants calls from per-endpoint buckets that share one global budget.
+
+    Waiters are served strictly by priority lane; a lower lane only gets a
+    token when no more important waiter can use it.
+    """
+
+    def __init__(self, name: str, global_bucket: TokenBucket, endpoint_buckets: dict):
+        self.name = name
+        self.global_bucket = global_bucket
+        self.endpoint_buckets = endpoint_buckets
+        self._waiters = []  # (priority, seq, endpoint, future)
+        self._seq = itertools.count()
+        self._dispatcher = None
+        self.granted = {lane: 0 for lane in LANE_NAMES.values()}
+        self.total_wait = 0.0
+
+    async def acquire(self, endpoint: str, priority: int = PRIORITY_SCAN) -> None:
+        """
+        Waits until a call to the given endpoint class may be made.
+
+        Args:
+            endpoint (str): Endpoint class ("candles", "news", "quote").
+            priority (int): Priority lane, PRIORITY_INTERACTIVE is served first.
+        """
+        if endpoint not in self.endpoint_buckets:
+            raise KeyError(f"[RateLimiter] Unknown endpoint class: {endpoint}")
+
+        started = time.monotonic()
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.append((priority, next(self._seq), endpoint, future))
+
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.ensure_future(self._dispatch())
+
+        await future
+        self.total_wait += time.monotonic() - started
+        lane = LANE_NAMES.get(priority, str(priority))
+        self.granted[lane] = self.granted.get(lane, 0) + 1
+
+    async def _dispatch(self) -> None:
+        while self._waiters:
+            # Abgebrochene Wartende verwerfen
+            self._waiters = [w for w in self._waiters if not w[3].done()]
+            if not self._waiters:
+                break
+
+            if not self.global_bucket.available():
+                await asyncio.sleep(self.global_bucket.wait_time())
+                continue
+
+            granted = False
+            for waiter in sorted(self._waiters):
+                bucket = self.endpoint_buckets[waiter[2]]
+                if bucket.available():
+                    bucket.take()
+                    self.global_bucket.take()
+                    self._waiters.remove(waiter)
+                    waiter[3].set_result(None)
+                    granted = True
+                    break
+
+            if not granted:
+                wait = min(self.endpoint_buckets[w[2]].wait_time() for w in self._waiters)
+                logger.debug(f"⏳ [RateLimiter:{self.name}] {len(self._waiters)} queued – next token in {wait:.2f}s")
+                await asyncio.sleep(wait)
+
+    def estimated_wait(self, endpoint: str, priority: int = PRIORITY_SCAN) -> float:
+        """
+        Rough seconds until a new call on endpoint at priority would be granted,
+        counting the waiters that would be served before it.
+        """
+        ahead = [w for w in self._waiters if not w[3].done() and w[0] <= priority]
+        bucket = self.endpoint_buckets[endpoint]
+        self.global_bucket._refill()
+        bucket._refill()
+        need_global = len(ahead) + 1 - self.global_bucket.tokens
+        need_endpoint = sum(1 for w in ahead if w[2] == endpoint) + 1 - bucket.tokens
+        return max(need_global / self.global_bucket.rate, need_endpoint / bucket.rate, 0.0)
+
+    def get_stats(self) -> dict:
+        """Returns queue depth, grants per lane and average wait time."""
+        granted_total = sum(self.granted.values())
+        return {
+            "queued": sum(1 for w in self._waiters if not w[3].done()),
+            "granted": dict(self.granted),
+            "avg_wait_sec": round(self.total_wait / granted_total, 3) if granted_total else 0.0
+        }
+
+# === Finnhub Singleton ===
+_burst = config.get("FINNHUB_BURST", 10)
+
+finnhub_limiter = RateLimiter(
+    "finnhub",
+    global_bucket=TokenBucket(config.get("FINNHUB_RATE_PER_MIN", 60), capacity=_burst),
+    endpoint_buckets={
+        "candles": TokenBucket(config.get("FINNHUB_CANDLE_RATE_PER_MIN", 60), capacity=_burst),
+        "news": TokenBucket(config.get("FINNHUB_NEWS_RATE_PER_MIN", 10), capacity=2),
+        "quote": TokenBucket(config.get("FINNHUB_QUOTE_RATE_PER_MIN", 60), capacity=_burst),
+    }
+)
@@ -4,9 +4,26 @@ Combines strategy, psychology, and clean minimalism for maximum trading impact.
 Made in Bali. Engineered with German Precision.
 """
 
-from bot.utils.i18n import get_text
+from bot.utils.i18n import get_text, TemplateSet, cached_render
 from bot.utils.language import get_language
 
+# === Templates (Labels einmal pro Sprache aufgelöst) ===
+TEMPLATES = TemplateSet(
+    header_super="{t:signal_header_super}",
+    header_strong="{t:signal_header_strong}",
+    header_moderate="{t:signal_header_moderate}",
+    body=(
+        "{header}\n\n"
+        "*{t:symbol}:* `{symbol}`\n"
+        "*{t:action}:* {combined_action}\n"
+        "*{t:trend_structure}:* {trend_direction}\n"
+        "*{t:signal_quality}:* {stars} ({avg_confidence:.1f}%)\n"
+        "*{t:indicator_score}:* `{indicator_score:.1f}%`\n\n"
+        "✨ *{t:detected_patterns}:*\n{pattern_text}\n\n"
+        "_{t:signal_footer}_"
+    )
+)
+
 def build_signal_message(
     symbol: str,
     patterns: list,
@@ -14,7 +31,8 @@ def build_signal_message(
     avg_confidence: float,
     indicator_score: float,
     trend_direction: str,
-    chat_id: int = None
+    chat_id: int = None,
+    lang: str = None
 ) -> str:
     """
     Builds the ultimate premium trading signal message.
@@ -27,22 +45,28 @@ def build_signal_message(
         indicator_score (float): Composite score from RSI, EMA, Patterns
         trend_direction (str): Current trend direction
         chat_id (int, optional): For localized language fallback
+        lang (str, optional): Language code; skips the chat lookup when given
 
     Returns:
         str: Ready-to-send premium structured trading signal message.
     """
+    lang = lang or get_language(chat_id) or "en"
     if not patterns:
-        return get_text("no_patterns_found", get_language(chat_id))
+        return get_text("no_patterns_found", lang)
 
-    lang = get_language(chat_id) or "en"
+    return _render_signal_message(symbol, patterns, combined_action, avg_confidence, indicator_score, trend_direction, lang)
+
+@cached_render
+def _render_signal_message(symbol, patterns, combined_action, avg_confidence, indicator_score, trend_direction, lang) -> str:
+    t = TEMPLATES(lang)
 
     # === Header decision based on signal quality ===
     if avg_confidence >= 85 and indicator_score >= 80:
-        header = get_text("signal_header_super", lang)
+        header = t["header_super"]()
     elif avg_confidence >= 70:
-        header = get_text("signal_header_strong", lang)
+        header = t["header_strong"]()
     else:
-        header = get_text("signal_header_moderate", lang)
+        header = t["header_moderate"]()
 
     # === Stars based on confidence level ===
     stars = "⭐" * min(5, max(1, int(avg_confidence // 20)))
@@ -51,15 +75,13 @@ def build_signal_message(
     pattern_text = "\n".join([f"• {p}" for p in patterns])
 
     # === Message Assembly ===
-    message = (
-        f"{header}\n\n"
-        f"*{get_text('symbol', lang)}:* `{symbol}`\n"
-        f"*{get_text('action', lang)}:* {combined_action}\n"
-        f"*{get_text('trend_structure', lang)}:* {trend_direction}\n"
-        f"*{get_text('signal_quality', lang)}:* {stars} ({avg_confidence:.1f}%)\n"
-        f"*{get_text('indicator_score', lang)}:* `{indicator_score:.1f}%`\n\n"
-        f"✨ *{get_text('detected_patterns', lang)}:*\n{pattern_text}\n\n"
-        f"_{get_text('signal_footer', lang)}_"
+    return t["body"](
+        header=header,
+        symbol=symbol,
+        combined_action=combined_action,
+        trend_direction=trend_direction,
+        stars=stars,
+        avg_confidence=avg_confidence,
+        indicator_score=indicator_score,
+        pattern_text=pattern_text
     )
-
-    return message
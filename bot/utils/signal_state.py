@@ -0,0 +1,132 @@
+"""
+A.R.K. Signal State – De-Duplication & Cooldown Store 1.0
+Merkt sich pro Symbol und Kanal das zuletzt gesendete Setup (Richtung, Kerze, Pattern-Set, Confidence-Stufe).
+Unveränderte Setups werden innerhalb des Cooldowns unterdrückt – gesendet wird nur bei einem Zustandswechsel.
+MAX_SIGNALS_PER_HOUR wird über ein gleitendes Stundenfenster durchgesetzt.
+
+Made in Bali. Engineered with German Precision.
+"""
+
+import time
+from collections import deque
+from typing import NamedTuple
+from bot.config.settings import get_settings
+from bot.utils.logger import setup_logger
+
+# === Setup ===
+logger = setup_logger(__name__)
+config = get_settings()
+
+HOUR_SEC = 3600
+
+class SignalSnapshot(NamedTuple):
+    """Identity of one sent setup."""
+    direction: str
+    bar_ts: float | None     # Epoch-Sekunde der Signal-Kerze
+    patterns: frozenset      # Namen der erkannten Patterns
+    tier: str                # Confidence-Stufe (signal_category)
+    sent_at: float
+
+class SignalState:
+    """
+    Decides whether a scan result is worth sending again.
+
+    A result is sent when it is the first for its (channel, symbol), when the
+    direction flips, the confidence tier changes, or a new pattern appears.
+    Anything else counts as a repeat and waits for the cooldown to expire.
+    Every send also needs a free slot in the hourly budget.
+    """
+
+    def __init__(self, cooldown_sec: float, max_per_hour: int):
+        self.cooldown_sec = cooldown_sec
+        self.max_per_hour = max_per_hour
+        self._last = {}        # (channel, symbol) → SignalSnapshot
+        self._sent = deque()   # time.time() jeder Freigabe im letzten Stundenfenster
+        self.admitted = {}     # reason → count
+        self.suppressed = {"duplicate": 0, "cooldown": 0, "hourly_cap": 0}
+
+    @staticmethod
+    def snapshot(result: dict, now: float) -> SignalSnapshot:
+        return SignalSnapshot(
+            direction=result.get("combined_action", "Neutral ⚪"),
+            bar_ts=result.get("bar_ts"),
+            patterns=frozenset(p.get("pattern", "") for p in result.get("patterns", [])),
+            tier=result.get("signal_category", ""),
+            sent_at=now
+        )
+
+    def transition(self, previous: SignalSnapshot | None, current: SignalSnapshot) -> str | None:
+        """Returns why `current` differs materially from `previous`, or None for a repeat."""
+        if previous is None:
+            return "new"
+        if current.direction != previous.direction:
+            return "direction"
+        if current.tier != previous.tier:
+            return "tier"
+        if current.patterns - previous.patterns:
+            return "pattern"
+        return None
+
+    def admit(self, symbol: str, result: dict, channel: str = "signals", now: float = None) -> bool:
+        """
+        Checks a result against the stored state and records it when it may be sent.
+
+        Args:
+            symbol (str): Ticker symbol.
+            result (dict): analyze_symbol result.
+            channel (str): Delivery path; each channel keeps its own state.
+
+        Returns:
+            bool: True if the signal should be sent.
+        """
+        now = now if now is not None else time.time()
+        key = (channel, symbol)
+        previous = self._last.get(key)
+        current = self.snapshot(result, now)
+
+        reason = self.transition(previous, current)
+        if reason is None:
+            if current.bar_ts == previous.bar_ts:
+                return self._suppress("duplicate", symbol, channel)
+            if now - previous.sent_at < self.cooldown_sec:
+                return self._suppress("cooldown", symbol, channel)
+            reason = "reminder"
+
+        self._prune(now)
+        if self.max_per_hour > 0 and len(self._sent) >= self.max_per_hour:
+            return self._suppress("hourly_cap", symbol, channel)
+
+        self._sent.append(now)
+        self._last[key] = current
+        self.admitted[reason] = self.admitted.get(reason, 0) + 1
+        logger.debug(f"🔔 [SignalState] {channel}/{symbol} freigegeben ({reason})")
+        return True
+
+    def _suppress(self, reason: str, symbol: str, channel: str) -> bool:
+        self.suppressed[reason] += 1
+        logger.info(f"🔕 [SignalState] {channel}/{symbol} unterdrückt ({reason})")
+        return False
+
+    def _prune(self, now: float) -> None:
+        while self._sent and now - self._sent[0] >= HOUR_SEC:
+            self._sent.popleft()
+
+    def reset(self) -> None:
+        self._last.clear()
+        self._sent.clear()
+
+    def get_stats(self) -> dict:
+        self._prune(time.time())
+        return {
+            "tracked": len(self._last),
+            "last_hour": len(self._sent),
+            "max_per_hour": self.max_per_hour,
+            "admitted": sum(self.admitted.values()),
+            "suppressed": dict(self.suppressed)
+        }
+
+# === Singleton Export ===
+signal_state = SignalState(
+    cooldown_sec=config.get("SIGNAL_COOLDOWN_SEC", 900),
+    max_per_hour=config.get("MAX_SIGNALS_PER_HOUR", 150)
+)
@@ -10,6 +10,7 @@ from bot.utils.logger import setup_logger
 from bot.utils.i18n import get_text
 from bot.utils.language import get_language
 from bot.config.settings import get_settings
+from bot.utils.message_queue import message_queue, PRIORITY_NORMAL
 
 # Setup Logger & Config
 logger = setup_logger(__name__)
@@ -40,11 +41,13 @@ async def send_startup_notification(bot: Bot, chat_id: int) -> None:
 
         message = f"{header}\n\n{body}"
 
-        await bot.send_message(
+        await message_queue.send(
+            bot,
             chat_id=chat_id,
             text=message,
             parse_mode="Markdown",
-            disable_web_page_preview=True
+            disable_web_page_preview=True,
+            priority=PRIORITY_NORMAL
         )
 
         logger.info(f"✅ [StartupNotifier] Startup message sent to chat ID {chat_id}.")
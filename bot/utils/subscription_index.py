@@ -0,0 +1,101 @@
+"""
+A.R.K. Subscription Index – Symbol → Subscriber Lookup 1.0
+Invertierter Index über die Abos aus user_settings: pro Symbol die abonnierten Chats, dazu Wildcard-Abos ("*")
+und die Mindest-Confidence je Chat. Ein Lookup pro Signal statt eines Durchlaufs über alle Nutzer.
+
+Made in Bali. Engineered with German Precision.
+"""
+
+from bot.config.settings import get_settings
+from bot.utils.logger import setup_logger
+from bot.utils import user_settings
+
+# === Setup ===
+logger = setup_logger(__name__)
+config = get_settings()
+
+WILDCARD = "*"
+
+class SubscriptionIndex:
+    """
+    In-memory inverted index of signal subscriptions.
+
+    The persistent copy lives in user_settings; subscribe() and unsubscribe()
+    write through to it and update the index incrementally.
+    """
+
+    def __init__(self):
+        self._by_symbol = {}     # symbol → set(chat_id)
+        self._wildcard = set()   # Chats mit allen Symbolen
+        self._min_conf = {}      # chat_id → Mindest-Confidence
+
+    # === Building ===
+    def load(self, subscriptions: dict, default_chat_id: int = 0) -> None:
+        """
+        Rebuilds the index from chat_id → subscription.
+
+        The configured TELEGRAM_CHAT_ID receives all signals unless it has a
+        stored subscription of its own.
+        """
+        self._by_symbol.clear()
+        self._wildcard.clear()
+        self._min_conf.clear()
+        for chat_id, subscription in subscriptions.items():
+            self._add(int(chat_id), subscription["symbols"], subscription.get("min_confidence", 0.0))
+        if default_chat_id and default_chat_id not in self._min_conf:
+            self._add(default_chat_id, [WILDCARD], 0.0)
+        logger.info(f"📇 [SubscriptionIndex] {len(self._min_conf)} subscriber(s) | {len(self._by_symbol)} symbol(s) indexed")
+
+    def _add(self, chat_id: int, symbols: list, min_confidence: float) -> None:
+        self._min_conf[chat_id] = float(min_confidence)
+        for symbol in symbols:
+            if symbol == WILDCARD:
+                self._wildcard.add(chat_id)
+            else:
+                self._by_symbol.setdefault(symbol, set()).add(chat_id)
+
+    def _remove(self, chat_id: int) -> None:
+        self._min_conf.pop(chat_id, None)
+        self._wildcard.discard(chat_id)
+        for symbol in [s for s, chats in self._by_symbol.items() if chat_id in chats]:
+            chats = self._by_symbol[symbol]
+            chats.discard(chat_id)
+            if not chats:
+                del self._by_symbol[symbol]
+
+    # === Updates ===
+    def subscribe(self, chat_id: int, symbols: list, min_confidence: float = 0.0) -> None:
+        """Replaces the chat's subscription and persists it."""
+        self._remove(chat_id)
+        self._add(chat_id, symbols, min_confidence)
+        user_settings.set_subscription(chat_id, symbols, min_confidence)
+
+    def unsubscribe(self, chat_id: int) -> None:
+        """Removes the chat from the index and from user_settings."""
+        self._remove(chat_id)
+        user_settings.clear_subscription(chat_id)
+
+    # === Lookups ===
+    def recipients(self, symbol: str, confidence: float = 100.0) -> set:
+        """Chats subscribed to symbol whose minimum confidence the signal meets."""
+        candidates = self._wildcard | self._by_symbol.get(symbol, set())
+        return {chat_id for chat_id in candidates if confidence >= self._min_conf[chat_id]}
+
+    def subscription(self, chat_id: int) -> dict | None:
+        if chat_id not in self._min_conf:
+            return None
+        symbols = [WILDCARD] if chat_id in self._wildcard else sorted(
+            s for s, chats in self._by_symbol.items() if chat_id in chats
+        )
+        return {"symbols": symbols, "min_confidence": self._min_conf[chat_id]}
+
+    def get_stats(self) -> dict:
+        return {
+            "subscribers": len(self._min_conf),
+            "wildcard": len(self._wildcard),
+            "symbols": len(self._by_symbol)
+        }
+
+# === Singleton Export ===
+subscription_index = SubscriptionIndex()
+subscription_index.load(user_settings.get_all_subscriptions(), int(config.get("TELEGRAM_CHAT_ID") or 0))
@@ -4,12 +4,27 @@ Built for Deep Confidence, Dynamic Risk Profiling, and Adaptive Messaging.
 Made in Bali. Engineered with German Precision.
 """
 
-from bot.utils.i18n import get_text
+from bot.utils.i18n import TemplateSet, cached_render
 from bot.utils.logger import setup_logger
 
 # Setup structured logger
 logger = setup_logger(__name__)
 
+# === Templates (Labels einmal pro Sprache aufgelöst) ===
+TEMPLATES = TemplateSet(
+    header="🚀 *{t:signal_ultra_premium}*\n",
+    symbol="*Symbol:* `{symbol}`\n",
+    move_detected="{t:move_detected}",
+    move_percent="*Move:* `{move_percent:.2f}%` – {move_type}\n",
+    move_text="*Move:* `{move}`\n",
+    volume_spike="*Volume Spike:* `{volume_pct:.1f}%` 📈\n",
+    atr_breakout="*ATR Breakout:* ✅ {t:confirmed}\n",
+    risk_reward="*Risk/Reward:* `{rr}:1`\n*Stop-Loss:* `{sl}`\n*Target:* `{tgt}`\n",
+    confidence="*Confidence:* `{confidence:.1f}%`\n",
+    footer="\n_{t:signal_footer}_"
+)
+
+@cached_render
 def build_ultra_signal(
     symbol: str,
     move: dict | str = None,
@@ -35,47 +50,45 @@ def build_ultra_signal(
         str: Formatted signal message
     """
     try:
+        t = TEMPLATES(lang)
+
         # === Header ===
-        header = f"🚀 *{get_text('signal_ultra_premium', lang)}*\n"
+        header = t["header"]()
 
         # === Core Body ===
-        body = f"*Symbol:* `{symbol}`\n"
+        body = t["symbol"](symbol=symbol)
 
         # === Move Detection ===
         if move:
             if isinstance(move, dict):
-                move_type = move.get("type", get_text("move_detected", lang))
+                move_type = move.get("type") or t["move_detected"]()
                 move_percent = move.get("move_percent", 0.0)
-                body += f"*Move:* `{move_percent:.2f}%` – {move_type}\n"
+                body += t["move_percent"](move_percent=move_percent, move_type=move_type)
             elif isinstance(move, str):
-                body += f"*Move:* `{move}`\n"
+                body += t["move_text"](move=move)
 
         # === Volume Spike ===
         if volume_spike and volume_spike.get("volume_spike", False):
-            volume_pct = volume_spike.get("volume_percent", 0.0)
-            body += f"*Volume Spike:* `{volume_pct:.1f}%` 📈\n"
+            body += t["volume_spike"](volume_pct=volume_spike.get("volume_percent", 0.0))
 
         # === ATR Breakout ===
         if atr_breakout and atr_breakout.get("atr_breakout", False):
-            body += f"*ATR Breakout:* ✅ {get_text('confirmed', lang)}\n"
+            body += t["atr_breakout"]()
 
         # === Risk/Reward Output ===
         if risk_reward:
-            rr = risk_reward.get("risk_reward_ratio", "-")
-            sl = risk_reward.get("stop_loss", "-")
-            tgt = risk_reward.get("target", "-")
-            body += (
-                f"*Risk/Reward:* `{rr}:1`\n"
-                f"*Stop-Loss:* `{sl}`\n"
-                f"*Target:* `{tgt}`\n"
+            body += t["risk_reward"](
+                rr=risk_reward.get("risk_reward_ratio", "-"),
+                sl=risk_reward.get("stop_loss", "-"),
+                tgt=risk_reward.get("target", "-")
             )
 
         # === Confidence ===
         if confidence is not None:
-            body += f"*Confidence:* `{confidence:.1f}%`\n"
+            body += t["confidence"](confidence=confidence)
 
         # === Footer ===
-        footer = f"\n_{get_text('signal_footer', lang)}_"
+        footer = t["footer"]()
 
         return f"{header}\n{body}{footer}"
 
@@ -1,6 +1,6 @@
 """
 A.R.K. User Settings Manager – Ultra Premium Build.
-Manages per-user timezones and future user-specific settings cleanly.
+Manages per-user timezones, signal subscriptions and future user-specific settings cleanly.
 Made in Bali. Engineered with German Precision.
 """
 
@@ -79,5 +79,29 @@ def update_user_setting(chat_id: int, key: str, value) -> None:
     save_user_settings()
     logger.info(f"✅ [UserSettings] Updated {key} for {chat_id}: {value}")
 
+# === Signal Subscriptions ===
+
+def get_subscription(chat_id: int) -> Optional[dict]:
+    """Returns {"symbols": [...], "min_confidence": float} or None if the chat is not subscribed."""
+    return _user_settings.get(str(chat_id), {}).get("subscription")
+
+def set_subscription(chat_id: int, symbols: list, min_confidence: float) -> None:
+    """Stores a chat's subscription; "*" in symbols means all symbols."""
+    update_user_setting(chat_id, "subscription", {
+        "symbols": sorted(set(symbols)),
+        "min_confidence": float(min_confidence)
+    })
+
+def clear_subscription(chat_id: int) -> None:
+    """Removes a chat's subscription and persists it."""
+    settings = _user_settings.get(str(chat_id))
+    if settings and settings.pop("subscription", None) is not None:
+        save_user_settings()
+        logger.info(f"✅ [UserSettings] Subscription removed for {chat_id}")
+
+def get_all_subscriptions() -> Dict[str, dict]:
+    """Returns chat_id → subscription for all subscribed chats."""
+    return {chat: data["subscription"] for chat, data in _user_settings.items() if data.get("subscription")}
+
 # === Startup Init ===
 load_user_settings()
@@ -2,7 +2,19 @@
 A.R.K. Volatility Alert Builder – Multilingual Ultra Precision Notifications.
 """
 
-from bot.utils.i18n import get_text
+from bot.utils.i18n import TemplateSet, cached_render
+
+# === Template (Labels einmal pro Sprache aufgelöst) ===
+TEMPLATES = TemplateSet(
+    body=(
+        "{t:volatility_alert_header}\n\n"
+        "*Symbol:* `{symbol}`\n"
+        "*{t:volatility_alert_move}:* `{move_percent:.2f}%`\n"
+        "*{t:volatility_alert_volume}:* `{volume_spike:.1f}%`\n"
+        "*{t:volatility_alert_trend}:* {trend}\n\n"
+        "{t:volatility_alert_footer}"
+    )
+)
 
 def build_volatility_alert(symbol: str, move_data: dict, lang: str = "en") -> str:
     """
@@ -23,25 +35,8 @@ def build_volatility_alert(symbol: str, move_data: dict, lang: str = "en") -> st
         missing = [key for key in required_keys if key not in move_data]
         raise ValueError(f"[Volatility Alert Builder] Missing keys in move_data: {missing}")
 
-    move_percent = move_data["move_percent"]
-    volume_spike = move_data["volume_spike"]
-    trend = move_data["trend"]
-
-    # === Fetch Multilingual Labels ===
-    header = get_text("volatility_alert_header", lang)
-    move_label = get_text("volatility_alert_move", lang)
-    volume_label = get_text("volatility_alert_volume", lang)
-    trend_label = get_text("volatility_alert_trend", lang)
-    footer = get_text("volatility_alert_footer", lang)
-
-    # === Compose final message ===
-    message = (
-        f"{header}\n\n"
-        f"*Symbol:* `{symbol}`\n"
-        f"*{move_label}:* `{move_percent:.2f}%`\n"
-        f"*{volume_label}:* `{volume_spike:.1f}%`\n"
-        f"*{trend_label}:* {trend}\n\n"
-        f"{footer}"
-    )
+    return _render_volatility_alert(symbol, move_data["move_percent"], move_data["volume_spike"], move_data["trend"], lang)
 
-    return message
+@cached_render
+def _render_volatility_alert(symbol, move_percent, volume_spike, trend, lang) -> str:
+    return TEMPLATES(lang)["body"](symbol=symbol, move_percent=move_percent, volume_spike=volume_spike, trend=trend)
@@ -18,12 +18,22 @@ from bot.handlers.commands import (
     uptime_handler,
     set_language_handler,
     shutdown_handler,
-    monitor_handler
+    monitor_handler,
+    jobs_handler,
+    subscribe_handler,
+    unsubscribe_handler,
+    subscriptions_handler
 )
 from bot.handlers.global_error_handler import global_error_handler
 from bot.config.settings import get_settings
 from bot.utils.logger import setup_logger
 from bot.startup.startup_task import execute_startup_tasks
+from bot.utils.http_client import close_http_session
+from bot.engine.yahoo_fallback import shutdown_yahoo_executor
+from bot.engine.compute_pool import compute_pool
+from bot.scheduler.job_scheduler import job_scheduler
+from bot.utils.message_queue import message_queue
+from bot.auto.scan_bus import scan_bus
 
 # Logger & ENV
 logger = setup_logger(__name__)
@@ -44,6 +54,14 @@ async def force_webhook_deletion():
         logger.error(f"❌ [Webhook] Failed to delete webhook: {e}")
 
 
+# === Stop Hook ===
+async def on_stop(application):
+    """Läuft nach dem Polling-Stopp, aber bevor PTB den Bot herunterfährt – ausstehende Nachrichten gehen noch raus."""
+    await job_scheduler.shutdown()
+    await scan_bus.shutdown()
+    await message_queue.shutdown()
+
+
 # === Main Routine ===
 async def main():
     logger.info("🚀 [Main] Booting A.R.K...")
@@ -53,7 +71,7 @@ async def main():
         await force_webhook_deletion()
 
         # Step 2 – Bot-App starten
-        application = ApplicationBuilder().token(config["BOT_TOKEN"]).build()
+        application = ApplicationBuilder().token(config["BOT_TOKEN"]).post_stop(on_stop).build()
 
         # Step 3 – Command Handler
         application.add_handler(CommandHandler("start", start))
@@ -65,12 +83,17 @@ async def main():
         application.add_handler(CommandHandler("setlanguage", set_language_handler))
         application.add_handler(CommandHandler("shutdown", shutdown_handler))
         application.add_handler(CommandHandler("monitor", monitor_handler))
+        application.add_handler(CommandHandler("jobs", jobs_handler))
+        application.add_handler(CommandHandler("subscribe", subscribe_handler))
+        application.add_handler(CommandHandler("unsubscribe", unsubscribe_handler))
+        application.add_handler(CommandHandler("subscriptions", subscriptions_handler))
 
         # Step 4 – Fehlerbehandlung
         application.add_error_handler(global_error_handler)
 
         # Step 5 – Hintergrund-Jobs
         await execute_startup_tasks(application)
+        await compute_pool.warm_up()
 
         # Step 6 – Starte Polling
         logger.info("✅ [Main] A.R.K. is now live and polling for events.")
@@ -80,6 +103,15 @@ async def main():
         logger.critical(f"🔥 [Main] Critical Launch Error: {e}")
         raise
 
+    finally:
+        # Step 7 – Jobs und Queue sind im post_stop-Hook bereits gestoppt (hier nur noch für Startfehler)
+        await job_scheduler.shutdown()
+        await scan_bus.shutdown()
+        await message_queue.shutdown()
+        await close_http_session()
+        shutdown_yahoo_executor()
+        compute_pool.shutdown()
+
 
 # === Startpoint ===
 if __name__ == "__main__":